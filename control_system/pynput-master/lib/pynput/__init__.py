@@ -18,8 +18,16 @@
 The main *pynput* module.
 
 This module imports ``keyboard`` and ``mouse``.
+
+If the environment variable ``$PYNPUT_LAZY`` is set to a non-empty value other
+than ``0``, they are instead imported when first accessed.
 """
 
+import importlib
+import os
+import sys
+
+
 def _logger(cls):
     """Creates a logger with a name suitable for a specific class.
 
@@ -37,5 +45,28 @@ def _logger(cls):
         cls.__name__))
 
 
-from . import keyboard
-from . import mouse
+#: The submodules imported by this module
+_SUBMODULES = ('keyboard', 'mouse')
+
+#: Whether to defer importing the submodules until they are accessed; this
+#: requires support for module level ``__getattr__``
+_LAZY = os.environ.get('PYNPUT_LAZY', '') not in ('', '0') \
+    and sys.version_info >= (3, 7)
+
+
+if _LAZY:
+    def __getattr__(name):
+        if name in _SUBMODULES:
+            # This will also make the module an attribute of this package, so
+            # this function is only called once per submodule
+            return importlib.import_module('.' + name, __name__)
+        else:
+            raise AttributeError('module {} has no attribute {}'.format(
+                __name__, name))
+
+    def __dir__():
+        return sorted(set(globals()) | set(_SUBMODULES))
+
+else:
+    from . import keyboard
+    from . import mouse
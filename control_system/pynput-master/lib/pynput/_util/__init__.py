@@ -24,6 +24,7 @@ General utility functions and classes.
 # pylint: disable=W0212
 # We implement an internal API
 
+import collections
 import contextlib
 import functools
 import importlib
@@ -309,8 +310,194 @@ class AbstractListener(threading.Thread):
             return
 
 
+class RingBuffer(object):
+    """A thread safe buffer of items, optionally bounded.
+
+    Items are added with :meth:`put` and removed in batches with
+    :meth:`get_many`. What happens when an item is added to a full buffer is
+    decided by the overflow policy.
+
+    :param maxsize: The maximum number of items held. If this is ``None``, the
+        buffer is unbounded.
+    :type maxsize: int or None
+
+    :param str overflow: The overflow policy. This is one of
+        :attr:`DROP_OLDEST`, :attr:`DROP_NEWEST` and :attr:`BLOCK`.
+
+    :raises ValueError: if ``maxsize`` is not positive or ``overflow`` is
+        unknown
+    """
+    #: Discard the oldest item in the buffer to make room for the new one
+    DROP_OLDEST = 'drop-oldest'
+
+    #: Discard the new item
+    DROP_NEWEST = 'drop-newest'
+
+    #: Wait until there is room in the buffer
+    BLOCK = 'block'
+
+    def __init__(self, maxsize, overflow=BLOCK):
+        if maxsize is not None and maxsize < 1:
+            raise ValueError(maxsize)
+        if overflow not in (self.DROP_OLDEST, self.DROP_NEWEST, self.BLOCK):
+            raise ValueError(overflow)
+        self._maxsize = maxsize
+        self._overflow = overflow
+        self._items = collections.deque()
+        self._condition = threading.Condition()
+        self._closed = False
+
+        #: The number of items discarded because the buffer was full
+        self.dropped = 0
+
+        #: The number of items added while older items were still waiting
+        self.lagging = 0
+
+        #: The largest number of items held at any time
+        self.peak = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def _full(self):
+        """Whether the buffer is full.
+
+        This method must be called with the lock held.
+        """
+        return self._maxsize is not None \
+            and len(self._items) >= self._maxsize
+
+    @property
+    def maxsize(self):
+        """The maximum number of items held, or ``None`` if the buffer is
+        unbounded.
+        """
+        return self._maxsize
+
+    @property
+    def overflow(self):
+        """The overflow policy.
+        """
+        return self._overflow
+
+    def put(self, item, timeout=None):
+        """Adds an item to the buffer.
+
+        :param item: The item to add.
+
+        :param timeout: The maximum number of seconds to wait for room in the
+            buffer if the overflow policy is :attr:`BLOCK`. If this is not
+            provided, this method may block until :meth:`close` is called.
+        :type timeout: float or None
+
+        :return: whether the item was added
+        """
+        with self._condition:
+            if self._closed:
+                return False
+
+            if self._full():
+                if self._overflow == self.DROP_OLDEST:
+                    self._items.popleft()
+                    self.dropped += 1
+                elif self._overflow == self.DROP_NEWEST:
+                    self.dropped += 1
+                    return False
+                else:
+                    deadline = time.monotonic() + timeout \
+                        if timeout is not None else None
+                    while self._full() and not self._closed:
+                        remaining = deadline - time.monotonic() \
+                            if deadline is not None else None
+                        if remaining is not None and remaining <= 0:
+                            self.dropped += 1
+                            return False
+                        self._condition.wait(remaining)
+                    if self._closed:
+                        return False
+
+            if self._items:
+                self.lagging += 1
+            self._items.append(item)
+            self.peak = max(self.peak, len(self._items))
+            self._condition.notify_all()
+            return True
+
+    def get_many(self, max_items=None, timeout=None):
+        """Removes items from the buffer.
+
+        This method blocks until at least one item is available, the timeout
+        expires or the buffer is closed.
+
+        :param max_items: The maximum number of items to remove. If this is not
+            provided, all available items are removed.
+        :type max_items: int or None
+
+        :param timeout: The maximum number of seconds to wait. If this is not
+            provided, this method may block until :meth:`close` is called.
+        :type timeout: float or None
+
+        :return: a list of items, in the order they were added; this is empty
+            only if the timeout expired or the buffer is closed
+        """
+        with self._condition:
+            deadline = time.monotonic() + timeout \
+                if timeout is not None else None
+            while not self._items and not self._closed:
+                remaining = deadline - time.monotonic() \
+                    if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+            count = len(self._items) if max_items is None \
+                else min(max_items, len(self._items))
+            result = [self._items.popleft() for _ in range(count)]
+            if result:
+                self._condition.notify_all()
+            return result
+
+    def clear(self):
+        """Removes all items from the buffer.
+        """
+        with self._condition:
+            self._items.clear()
+            self._condition.notify_all()
+
+    def close(self):
+        """Closes this buffer.
+
+        Any calls blocking in :meth:`put` or :meth:`get_many` will return, and
+        no more items will be added. Items already in the buffer may still be
+        removed.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+
 class Events(object):
     """A base class to enable iterating over events.
+
+    Events are held in a buffer until read. By default this buffer is
+    unbounded; pass ``maxsize`` to limit memory use if events may be read at a
+    lower rate than they arrive.
+
+    :param maxsize: The maximum number of events held, or ``None`` to not
+        limit the number of events.
+    :type maxsize: int or None
+
+    :param str overflow: What to do when an event arrives and ``maxsize``
+        events are already held. This is one of
+        :attr:`RingBuffer.DROP_OLDEST`, :attr:`RingBuffer.DROP_NEWEST`, the
+        default, and :attr:`RingBuffer.BLOCK`, which will block the listener
+        until events are read.
+
+    :param args: Arguments to pass to the listener constructor.
+
+    :param kwargs: Arguments to pass to the listener constructor. Callbacks,
+        whose names start with ``on_``, generate the events; any other value
+        is passed unchanged.
     """
     #: The listener class providing events.
     _Listener = None
@@ -332,10 +519,11 @@ class Events(object):
 
     def __init__(self, *args, **kwargs):
         super(Events, self).__init__()
-        self._event_queue = queue.Queue()
-        self._sentinel = object()
+        self._event_queue = RingBuffer(
+            kwargs.pop('maxsize', None),
+            kwargs.pop('overflow', RingBuffer.DROP_NEWEST))
         self._listener = self._Listener(*args, **{
-            key: self._event_mapper(value)
+            key: self._event_mapper(value) if key.startswith('on_') else value
             for (key, value) in kwargs.items()})
         self.start = self._listener.start
 
@@ -346,14 +534,9 @@ class Events(object):
     def __exit__(self, *args):
         self._listener.__exit__(*args)
 
-        # Drain the queue to ensure that the put does not block
-        while True:
-            try:
-                self._event_queue.get_nowait()
-            except queue.Empty:
-                break
-
-        self._event_queue.put(self._sentinel)
+        # Discard any unread events, and make sure that readers do not block
+        self._event_queue.clear()
+        self._event_queue.close()
 
     def __iter__(self):
         return self
@@ -365,6 +548,19 @@ class Events(object):
         else:
             raise StopIteration()
 
+    @property
+    def dropped(self):
+        """The number of events discarded because ``maxsize`` events were
+        already held.
+        """
+        return self._event_queue.dropped
+
+    @property
+    def peak(self):
+        """The largest number of events held at any time.
+        """
+        return self._event_queue.peak
+
     def get(self, timeout=None):
         """Attempts to read the next event.
 
@@ -374,11 +570,25 @@ class Events(object):
         :return: the next event, or ``None`` if the source has been stopped or
             no events were received
         """
-        try:
-            event = self._event_queue.get(timeout=timeout)
-            return event if event is not self._sentinel else None
-        except queue.Empty:
-            return None
+        events = self._event_queue.get_many(1, timeout)
+        return events[0] if events else None
+
+    def get_many(self, max_items=None, timeout=None):
+        """Attempts to read all available events.
+
+        This method blocks until at least one event is available.
+
+        :param max_items: The maximum number of events to read. If this is not
+            provided, all available events are read.
+        :type max_items: int or None
+
+        :param int timeout: An optional timeout. If this is not provided, this
+            method may block infinitely.
+
+        :return: a list of events, which is empty if the source has been
+            stopped or no events were received
+        """
+        return self._event_queue.get_many(max_items, timeout)
 
     def _event_mapper(self, event):
         """Generates an event callback to transforms the callback arguments to
@@ -390,10 +600,7 @@ class Events(object):
         """
         @functools.wraps(event)
         def inner(*args):
-            try:
-                self._event_queue.put(event(*args), block=False)
-            except queue.Full:
-                pass
+            self._event_queue.put(event(*args))
 
         return inner
 
@@ -403,19 +610,45 @@ class NotifierMixin(object):
 
     This mixin can be used for controllers on platforms where sending fake
     events does not cause a listener to receive a notification.
+
+    The running listeners are kept in an immutable snapshot, which is replaced
+    when a listener is added or removed, so sending a notification does not
+    require a lock.
     """
+    @property
+    def _pending_notifications(self):
+        """The state of :meth:`_emit_batch` for the current thread.
+
+        This has the attribute ``notifications``, which is the list of
+        notifications collected by the current thread, or ``None``.
+        """
+        # dict.setdefault is atomic, so all threads see the same instance
+        return self.__dict__.setdefault(
+            '_notifier_local', threading.local())
+
     def _emit(self, action, *args):
         """Sends a notification to all registered listeners.
 
         This method will ensure that listeners that raise
         :class:`StopException` are stopped.
 
+        If called within an :meth:`_emit_batch` block, the notification is
+        sent when the block exits.
+
         :param str action: The name of the notification.
 
         :param args: The arguments to pass.
         """
+        listeners = self._listeners()
+        if not listeners:
+            return
+        pending = getattr(self._pending_notifications, 'notifications', None)
+        if pending is not None:
+            pending.append((action, args))
+            return
+
         stopped = []
-        for listener in self._listeners():
+        for listener in listeners:
             try:
                 getattr(listener, action)(*args)
             except listener.StopException:
@@ -423,6 +656,38 @@ class NotifierMixin(object):
         for listener in stopped:
             listener.stop()
 
+    @contextlib.contextmanager
+    def _emit_batch(self):
+        """Collects all notifications sent in a code block and sends them when
+        the block exits.
+
+        Every listener receives all notifications in a single call to its
+        method ``_receive_many``.
+
+        Nested calls are merged with the outermost one. Notifications are
+        collected separately for every thread.
+        """
+        local = self._pending_notifications
+        if getattr(local, 'notifications', None) is not None:
+            yield
+            return
+
+        local.notifications = []
+        try:
+            yield
+        finally:
+            notifications = local.notifications
+            local.notifications = None
+            if notifications:
+                stopped = []
+                for listener in self._listeners():
+                    try:
+                        listener._receive_many(notifications)
+                    except listener.StopException:
+                        stopped.append(listener)
+                for listener in stopped:
+                    listener.stop()
+
     @classmethod
     def _receiver(cls, listener_class):
         """A decorator to make a class able to receive fake events from a
@@ -433,6 +698,11 @@ class NotifierMixin(object):
         This method is a context manager which ensures that all calls to
         :meth:`_emit` will invoke the named method in the listener instance
         while the block is active.
+
+        Unless the decorated class defines it, the method ``_receive_many`` is
+        also added. This method receives the notifications collected by
+        :meth:`_emit_batch` as a list of ``(action, args)``, and the default
+        implementation invokes the named methods in order.
         """
         @contextlib.contextmanager
         def receive(self):
@@ -445,30 +715,37 @@ class NotifierMixin(object):
             finally:
                 self._controller_class._remove_listener(self)
 
+        def receive_many(self, notifications):
+            """Invokes the methods named by a sequence of notifications.
+
+            :param notifications: The notifications, as a list of
+                ``(action, args)``.
+            """
+            for action, args in notifications:
+                getattr(self, action)(*args)
+
         listener_class._receive = receive
         listener_class._controller_class = cls
+        if not hasattr(listener_class, '_receive_many'):
+            listener_class._receive_many = receive_many
 
         # Make sure this class has the necessary attributes
         if not hasattr(cls, '_listener_cache'):
-            cls._listener_cache = set()
+            cls._listener_cache = tuple()
             cls._listener_lock = threading.Lock()
 
         return listener_class
 
     @classmethod
     def _listeners(cls):
-        """Iterates over the set of running listeners.
+        """Returns the running listeners.
+
+        The returned value is an immutable snapshot, so no lock is required.
+        Listeners added or removed while iterating are not reflected.
 
-        This method will quit without acquiring the lock if the set is empty,
-        so there is potential for race conditions. This is an optimisation,
-        since :class:`Controller` will need to call this method for every
-        control event.
+        :return: a tuple of listeners
         """
-        if not cls._listener_cache:
-            return
-        with cls._listener_lock:
-            for listener in cls._listener_cache:
-                yield listener
+        return getattr(cls, '_listener_cache', ())
 
     @classmethod
     def _add_listener(cls, listener):
@@ -477,7 +754,7 @@ class NotifierMixin(object):
         :param listener: The listener for fake events.
         """
         with cls._listener_lock:
-            cls._listener_cache.add(listener)
+            cls._listener_cache = cls._listener_cache + (listener,)
 
     @classmethod
     def _remove_listener(cls, listener):
@@ -486,4 +763,5 @@ class NotifierMixin(object):
         :param listener: The listener for fake events.
         """
         with cls._listener_lock:
-            cls._listener_cache.remove(listener)
+            cls._listener_cache = tuple(
+                l for l in cls._listener_cache if l is not listener)
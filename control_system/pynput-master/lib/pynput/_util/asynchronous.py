@@ -0,0 +1,283 @@
+# coding=utf-8
+# pynput
+# Copyright (C) 2015-2024 Moses Palmér
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+Utility classes for using *pynput* with :mod:`asyncio`.
+"""
+
+# pylint: disable=W0212
+# We implement an internal API
+
+import asyncio
+import concurrent.futures
+import functools
+import threading
+
+from . import RingBuffer
+
+
+class AsyncEvents(object):
+    """A base class to enable asynchronous iteration over events.
+
+    Events are passed from the listener thread to the event loop running when
+    this object is entered, and held in a buffer until read.
+
+    :param maxsize: The maximum number of events held, or ``None`` to not
+        limit the number of events.
+    :type maxsize: int or None
+
+    :param str overflow: What to do when an event arrives and ``maxsize``
+        events are already held. This is one of
+        :attr:`RingBuffer.DROP_OLDEST`, :attr:`RingBuffer.DROP_NEWEST` and
+        :attr:`RingBuffer.BLOCK`, the default, which will block the listener
+        until events are read.
+
+    :param args: Arguments to pass to the listener constructor.
+
+    :param kwargs: Callbacks to pass to the listener constructor.
+
+    :raises ValueError: if ``maxsize`` is not positive or ``overflow`` is
+        unknown
+    """
+    #: The listener class providing events.
+    _Listener = None
+
+    def __init__(self, *args, **kwargs):
+        super(AsyncEvents, self).__init__()
+        self._maxsize = kwargs.pop('maxsize', None)
+        self._overflow = kwargs.pop('overflow', RingBuffer.BLOCK)
+        if self._maxsize is not None and self._maxsize < 1:
+            raise ValueError(self._maxsize)
+        if self._overflow not in (
+                RingBuffer.DROP_OLDEST,
+                RingBuffer.DROP_NEWEST,
+                RingBuffer.BLOCK):
+            raise ValueError(self._overflow)
+
+        # When blocking, the listener thread must acquire a slot before
+        # passing an event to the event loop, and the reader releases it
+        self._slots = threading.Semaphore(self._maxsize) \
+            if self._maxsize is not None \
+            and self._overflow == RingBuffer.BLOCK \
+            else None
+
+        self._loop = None
+        self._queue = None
+        self._closed = False
+        self._sentinel = object()
+        self._dropped = 0
+        self._peak = 0
+        self._listener = self._Listener(*args, **{
+            key: self._event_mapper(value)
+            for (key, value) in kwargs.items()})
+
+    async def __aenter__(self):
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._listener.start()
+        await self._loop.run_in_executor(None, self._listener.wait)
+        return self
+
+    async def __aexit__(self, *args):
+        self._listener.stop()
+        self._close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        event = await self.get()
+        if event is not None:
+            return event
+        else:
+            raise StopAsyncIteration()
+
+    @property
+    def dropped(self):
+        """The number of events discarded because ``maxsize`` events were
+        already held.
+        """
+        return self._dropped
+
+    @property
+    def peak(self):
+        """The largest number of events held at any time.
+        """
+        return self._peak
+
+    async def get(self, timeout=None):
+        """Attempts to read the next event.
+
+        :param timeout: An optional timeout. If this is not provided, this
+            method may wait infinitely.
+        :type timeout: float or None
+
+        :return: the next event, or ``None`` if the source has been stopped or
+            no events were received
+        """
+        if self._queue.empty() and self._closed:
+            return None
+        try:
+            event = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+        if event is self._sentinel:
+            # Let any other readers know as well
+            self._queue.put_nowait(event)
+            return None
+        else:
+            if self._slots is not None:
+                self._slots.release()
+            return event
+
+    def _close(self):
+        """Closes this event source.
+
+        Unread events are discarded, and any pending or later reads return
+        ``None``.
+        """
+        self._closed = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(self._sentinel)
+
+        # Make sure that the listener thread is not blocked
+        if self._slots is not None:
+            for _ in range(self._maxsize):
+                self._slots.release()
+
+    def _put(self, event):
+        """Adds an event to the queue.
+
+        This method is run by the event loop.
+
+        :param event: The event to add.
+        """
+        if self._closed:
+            return
+
+        if self._slots is None and self._maxsize is not None \
+                and self._queue.qsize() >= self._maxsize:
+            self._dropped += 1
+            if self._overflow == RingBuffer.DROP_OLDEST:
+                self._queue.get_nowait()
+            else:
+                return
+
+        self._queue.put_nowait(event)
+        self._peak = max(self._peak, self._queue.qsize())
+
+    def _event_mapper(self, event):
+        """Generates an event callback to transforms the callback arguments to
+        an event and then passes it to the event loop.
+
+        This callback is called from the listener thread.
+
+        :param callback event: A function generating an event object.
+
+        :return: a callback
+        """
+        @functools.wraps(event)
+        def inner(*args):
+            if self._closed:
+                return
+            item = event(*args)
+            if self._slots is not None:
+                self._slots.acquire()
+            try:
+                self._loop.call_soon_threadsafe(self._put, item)
+            except RuntimeError:
+                # The event loop has been closed, so the event will never be
+                # read
+                if self._slots is not None:
+                    self._slots.release()
+
+        return inner
+
+
+class AsyncController(object):
+    """A facade for a controller making all methods coroutines.
+
+    All calls are made from a single dedicated thread, so they are performed
+    in the order they are made, without blocking the event loop.
+
+    Methods of the wrapped controller are available as attributes of this
+    object; calling them returns an awaitable.
+
+    :param controller: The controller to wrap. If this is not specified, an
+        instance of :attr:`_Controller` is created from the dedicated thread.
+    """
+    #: The controller class created when no controller is passed.
+    _Controller = None
+
+    def __init__(self, controller=None):
+        self._controller = controller
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix='pynput')
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        async def inner(*args, **kwargs):
+            return await self.run(
+                lambda controller: getattr(controller, name)(*args, **kwargs))
+
+        return inner
+
+    async def run(self, f, *args, **kwargs):
+        """Calls a function with the controller as first argument from the
+        dedicated thread.
+
+        This can be used to perform a sequence of operations without
+        interleaving, or to access properties::
+
+            position = await controller.run(lambda c: c.position)
+
+        :param callable f: The function to call.
+
+        :param args: Any additional positional arguments.
+
+        :param kwargs: Any keyword arguments.
+
+        :return: the return value of ``f``
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            lambda: f(self._get_controller(), *args, **kwargs))
+
+    def close(self):
+        """Waits for all pending calls to complete and releases the dedicated
+        thread.
+        """
+        self._executor.shutdown(wait=True)
+
+    def _get_controller(self):
+        """Returns the wrapped controller, creating it if necessary.
+
+        This method is called from the dedicated thread.
+        """
+        if self._controller is None:
+            self._controller = self._Controller()
+        return self._controller
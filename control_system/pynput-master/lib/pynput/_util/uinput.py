@@ -21,6 +21,15 @@ Utility functions and classes for the *uinput* backend.
 # pylint: disable=R0903
 # We implement stubs
 
+import concurrent.futures
+import ctypes
+import ctypes.util
+import errno
+import os
+import selectors
+import struct
+import threading
+
 import evdev
 
 
@@ -32,67 +41,295 @@ _check()
 del _check
 
 
+#: The environment variable used to override the screen size
+SCREEN_SIZE_ENVIRONMENT = 'PYNPUT_UINPUT_SCREEN_SIZE'
+
+#: The file from which the size of the framebuffer console is read
+_FRAMEBUFFER_SIZE = '/sys/class/graphics/fb0/virtual_size'
+
+#: The screen size used when no other source is available
+_DEFAULT_SCREEN_SIZE = (1920, 1080)
+
+
+def screen_size():
+    """Determines the size of the screen.
+
+    Since *uinput* has no notion of a screen, the size is read from the
+    environment variable ``$PYNPUT_UINPUT_SCREEN_SIZE``, on the form
+    ``WIDTHxHEIGHT``, or from the framebuffer console. If neither is
+    available, ``1920x1080`` is assumed.
+
+    :return: the tuple ``(width, height)``
+
+    :raises ValueError: if the environment variable is invalid
+    """
+    value = os.environ.get(SCREEN_SIZE_ENVIRONMENT, None)
+    if value:
+        try:
+            width, height = (int(v) for v in value.lower().split('x'))
+        except ValueError:
+            raise ValueError('invalid value for ${}: {}'.format(
+                SCREEN_SIZE_ENVIRONMENT, value))
+        if width <= 0 or height <= 0:
+            raise ValueError('invalid value for ${}: {}'.format(
+                SCREEN_SIZE_ENVIRONMENT, value))
+        return (width, height)
+
+    try:
+        with open(_FRAMEBUFFER_SIZE) as f:
+            width, height = (int(v) for v in f.read().strip().split(','))
+            if width > 0 and height > 0:
+                return (width, height)
+    except (OSError, ValueError):
+        pass
+
+    return _DEFAULT_SCREEN_SIZE
+
+
+class _Inotify(object):
+    """A minimal wrapper around *inotify*, used to detect new devices.
+
+    :param str path: The directory to watch.
+
+    :raises OSError: if *inotify* is not available
+    """
+    #: The flags passed to ``inotify_init1``: ``IN_NONBLOCK | IN_CLOEXEC``
+    _INIT_FLAGS = os.O_NONBLOCK | os.O_CLOEXEC
+
+    #: The events for which to watch: ``IN_ATTRIB | IN_CREATE``; device nodes
+    #: may be created before their permissions are set
+    _MASK = 0x00000004 | 0x00000100
+
+    #: The header of ``struct inotify_event``
+    _EVENT = struct.Struct('iIII')
+
+    def __init__(self, path):
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._fd = libc.inotify_init1(self._INIT_FLAGS)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1')
+        if libc.inotify_add_watch(
+                self._fd, path.encode('utf-8'), self._MASK) < 0:
+            error = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(error, 'inotify_add_watch')
+        self._path = path
+
+    def fileno(self):
+        return self._fd
+
+    def close(self):
+        os.close(self._fd)
+
+    def read(self):
+        """Reads all pending events.
+
+        :return: a list of paths of created or modified files
+        """
+        try:
+            data = os.read(self._fd, 4096)
+        except BlockingIOError:
+            return []
+
+        result = []
+        offset = 0
+        while offset + self._EVENT.size <= len(data):
+            _, _, _, length = self._EVENT.unpack_from(data, offset)
+            offset += self._EVENT.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+            if name:
+                result.append(os.path.join(
+                    self._path, name.decode('utf-8', 'replace')))
+        return result
+
+
 class ListenerMixin(object):
     """A mixin for *uinput* event listeners.
 
+    All compatible devices are read from a single thread. Unless the option
+    ``device_paths`` is passed, devices added while the listener is running
+    are picked up as well.
+
     Subclasses should set a value for :attr:`_EVENTS` and implement
     :meth:`_handle_message`.
     """
     #: The events for which to listen
     _EVENTS = tuple()
 
+    #: The directory containing input devices
+    _DEVICE_DIRECTORY = '/dev/input'
+
+    #: The maximum number of devices to probe simultaneously
+    _PROBE_WORKERS = 16
+
     def __init__(self, *args, **kwargs):
         super(ListenerMixin, self).__init__(*args, **kwargs)
-        self._dev = self._device(self._options.get(
-            'device_paths',
-            evdev.list_devices()))
+        paths = self._options.get('device_paths', None)
+        self._hotplug = paths is None
+        self._devices = self._probe(
+            paths if paths is not None else evdev.list_devices())
+        if not self._devices:
+            raise OSError('no compatible input device available')
         if self.suppress:
-            self._dev.grab()
+            for dev in self._devices:
+                dev.grab()
+
+        #: The write end of a pipe used to wake the listener thread when
+        #: stopping; this is only set while the listener thread is running
+        self._wake = None
+        self._wake_lock = threading.Lock()
 
     def _run(self):
-        for event in self._dev.read_loop():
-            if event.type in self._EVENTS:
-                self._handle_message(event)
+        wake_read, wake = os.pipe()
+        with self._wake_lock:
+            self._wake = wake
+
+        selector = selectors.DefaultSelector()
+        selector.register(wake_read, selectors.EVENT_READ, None)
+        for dev in self._devices:
+            selector.register(dev, selectors.EVENT_READ, dev)
+
+        inotify = None
+        if self._hotplug:
+            try:
+                inotify = _Inotify(self._DEVICE_DIRECTORY)
+                selector.register(inotify, selectors.EVENT_READ, inotify)
+            except OSError:
+                inotify = None
+
+        self._mark_ready()
+        try:
+            while self.running:
+                for key, _ in selector.select():
+                    if key.data is None:
+                        return
+                    elif key.data is inotify:
+                        self._hotplug_devices(selector, inotify.read())
+                    else:
+                        self._read(selector, key.data)
+        finally:
+            selector.close()
+
+            # Make sure that _stop_platform does not write to a closed, and
+            # possibly reused, file descriptor
+            with self._wake_lock:
+                self._wake = None
+            os.close(wake_read)
+            os.close(wake)
+            if inotify is not None:
+                inotify.close()
+            for dev in self._devices:
+                dev.close()
 
     def _stop_platform(self):
-        self._dev.close()
+        with self._wake_lock:
+            if self._wake is not None:
+                os.write(self._wake, b'\0')
+
+    def _read(self, selector, dev):
+        """Reads and handles all pending events from a device.
 
-    def _device(self, paths):
-        """Attempts to load a readable keyboard device.
+        If the device has been removed, it is closed and no longer watched.
 
-        :param paths: A list of paths.
+        :param selector: The selector watching the device.
 
-        :return: a compatible device
+        :param evdev.InputDevice dev: The device.
         """
-        dev, count = None, 0
-        for path in paths:
-            # Open the device
-            try:
-                next_dev = evdev.InputDevice(path)
-            except OSError:
-                continue
-
-            # Does this device provide more handled event codes?
-            capabilities = next_dev.capabilities()
-            next_count = sum(
-                len(codes)
-                for event, codes in capabilities.items()
-                if event in self._EVENTS)
-            if next_count > count:
-                dev = next_dev
-                count = next_count
-            else:
-                next_dev.close()
-
-        if dev is None:
-            raise OSError('no keyboard device available')
-        else:
+        try:
+            for event in dev.read():
+                if event.type in self._EVENTS:
+                    try:
+                        self._handle_message(event)
+                    except Exception:
+                        # If the emitter has handled the exception, the
+                        # listener has been stopped
+                        if self.running:
+                            raise
+                        return
+        except BlockingIOError:
+            pass
+        except OSError as e:
+            if e.errno != errno.ENODEV:
+                raise
+            selector.unregister(dev)
+            self._devices.remove(dev)
+            dev.close()
+
+    def _hotplug_devices(self, selector, paths):
+        """Starts watching new devices.
+
+        :param selector: The selector watching devices.
+
+        :param paths: The paths of created or modified device files.
+        """
+        known = set(dev.path for dev in self._devices)
+        for dev in self._probe(
+                path
+                for path in paths
+                if os.path.basename(path).startswith('event')
+                and path not in known):
+            if self.suppress:
+                dev.grab()
+            selector.register(dev, selectors.EVENT_READ, dev)
+            self._devices.append(dev)
+
+    def _probe(self, paths):
+        """Opens all compatible devices.
+
+        The devices are probed in parallel.
+
+        :param paths: The device paths.
+
+        :return: a list of compatible devices
+        """
+        paths = list(paths)
+        if not paths:
+            return []
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(len(paths), self._PROBE_WORKERS)) as executor:
+            return [
+                dev
+                for dev in executor.map(self._open, paths)
+                if dev is not None]
+
+    def _open(self, path):
+        """Opens a device if it is compatible.
+
+        :param str path: The device path.
+
+        :return: the device, or ``None`` if it cannot be opened or is not
+            compatible
+        """
+        try:
+            dev = evdev.InputDevice(path)
+        except OSError:
+            return None
+
+        if self._is_compatible(dev.capabilities()):
             return dev
+        else:
+            dev.close()
+            return None
+
+    def _is_compatible(self, capabilities):
+        """Determines whether a device provides events for this listener.
+
+        :param dict capabilities: The device capabilities, as returned by
+            :meth:`evdev.InputDevice.capabilities`.
+
+        :return: whether the device is compatible
+        """
+        return any(
+            codes
+            for event, codes in capabilities.items()
+            if event in self._EVENTS)
 
     def _handle_message(self, event):
         """Handles a single event.
 
-        This method should call one of the registered event callbacks.
+        This method should call one of the registered event callbacks, and be
+        decorated with :meth:`pynput._util.AbstractListener._emitter`.
 
         :param event: The event.
         """
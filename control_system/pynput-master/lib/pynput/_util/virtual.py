@@ -0,0 +1,292 @@
+# coding=utf-8
+# pynput
+# Copyright (C) 2015-2024 Moses Palmér
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+Utility functions and classes for the *virtual* backend.
+
+The *virtual* backend does not interact with the system at all. Controllers
+update the simulated state in :data:`DESKTOP`, and deliver their events
+directly to running listeners.
+"""
+
+# pylint: disable=R0903
+# We implement stubs
+
+import collections
+import threading
+import time
+
+from . import AbstractListener
+
+
+#: An entry in the event log.
+#:
+#: ``time`` is the value of :func:`time.perf_counter` when the event was sent,
+#: ``action`` the name of the listener callback, such as ``'on_press'``, and
+#: ``args`` the arguments passed to it, excluding ``injected``.
+LogEntry = collections.namedtuple(
+    'LogEntry',
+    ('time', 'action', 'args'))
+
+
+class Desktop(object):
+    """The simulated state of the input devices.
+
+    :param tuple size: The size of the screen, as the tuple
+        ``(width, height)``.
+
+    :param log_size: The maximum number of entries kept in :attr:`log`. When
+        the log is full, the oldest entries are discarded. Pass ``None`` to
+        keep all entries, and ``0`` to disable the log.
+    :type log_size: int or None
+    """
+    #: The default screen size
+    SIZE = (1920, 1080)
+
+    #: The default maximum number of log entries
+    LOG_SIZE = 1 << 20
+
+    #: The default value of arguments to :meth:`reset`, meaning that the
+    #: current value is kept
+    _UNCHANGED = object()
+
+    def __init__(self, size=SIZE, log_size=LOG_SIZE):
+        self._lock = threading.RLock()
+        self.reset(size, log_size)
+
+    def reset(self, size=_UNCHANGED, log_size=_UNCHANGED):
+        """Releases all keys and buttons, moves the pointer to the origin and
+        clears the event log.
+
+        :param tuple size: A new size of the screen. If not specified, the
+            size is not changed.
+
+        :param log_size: A new maximum number of log entries, or ``None`` to
+            keep all entries. If not specified, the maximum is not changed.
+        :type log_size: int or None
+        """
+        with self._lock:
+            if size is not self._UNCHANGED:
+                self._size = tuple(int(v) for v in size)
+            if log_size is not self._UNCHANGED:
+                self._log_size = log_size
+            self._position = (0, 0)
+            self._pressed = set()
+            self._modifiers = set()
+            self._buttons = set()
+            self._log = collections.deque(maxlen=self._log_size)
+
+    @property
+    def size(self):
+        """The size of the screen, as the tuple ``(width, height)``.
+        """
+        return self._size
+
+    @property
+    def position(self):
+        """The position of the pointer, as the tuple ``(x, y)``.
+        """
+        return self._position
+
+    @property
+    def pressed(self):
+        """The keys currently pressed.
+        """
+        with self._lock:
+            return frozenset(self._pressed)
+
+    @property
+    def modifiers(self):
+        """The generic modifiers currently pressed, such as
+        :attr:`pynput.keyboard.Key.shift`.
+        """
+        with self._lock:
+            return frozenset(self._modifiers)
+
+    @property
+    def buttons(self):
+        """The mouse buttons currently pressed.
+        """
+        with self._lock:
+            return frozenset(self._buttons)
+
+    @property
+    def log(self):
+        """The event log, as a list of :class:`LogEntry`.
+        """
+        with self._lock:
+            return list(self._log)
+
+    def key(self, key, is_press, modifier=None):
+        """Presses or releases a key.
+
+        :param key: The key.
+
+        :param bool is_press: Whether the key is pressed.
+
+        :param modifier: The generic modifier corresponding to the key, if
+            any.
+        """
+        with self._lock:
+            if is_press:
+                self._pressed.add(key)
+                if modifier is not None:
+                    self._modifiers.add(modifier)
+            else:
+                self._pressed.discard(key)
+                if modifier is not None:
+                    self._modifiers.discard(modifier)
+            self._record('on_press' if is_press else 'on_release', (key,))
+
+    def move(self, x, y):
+        """Moves the pointer.
+
+        :param int x: The horizontal coordinate.
+
+        :param int y: The vertical coordinate.
+
+        :return: the new position, limited to the screen
+        """
+        with self._lock:
+            width, height = self._size
+            self._position = (
+                min(max(int(x), 0), width - 1),
+                min(max(int(y), 0), height - 1))
+            self._record('on_move', self._position)
+            return self._position
+
+    def click(self, button, is_press):
+        """Presses or releases a mouse button at the current position.
+
+        :param button: The button.
+
+        :param bool is_press: Whether the button is pressed.
+
+        :return: the current position
+        """
+        with self._lock:
+            if is_press:
+                self._buttons.add(button)
+            else:
+                self._buttons.discard(button)
+            self._record('on_click', self._position + (button, is_press))
+            return self._position
+
+    def scroll(self, dx, dy):
+        """Scrolls at the current position.
+
+        :param int dx: The horizontal scroll.
+
+        :param int dy: The vertical scroll.
+
+        :return: the current position
+        """
+        with self._lock:
+            self._record('on_scroll', self._position + (dx, dy))
+            return self._position
+
+    def _record(self, action, args):
+        """Adds an entry to the event log.
+
+        This method must be called with the lock held.
+
+        :param str action: The name of the listener callback.
+
+        :param tuple args: The arguments to the callback.
+        """
+        if self._log_size != 0:
+            self._log.append(LogEntry(time.perf_counter(), action, args))
+
+
+#: The simulated state shared by all controllers and listeners.
+DESKTOP = Desktop()
+
+
+class ListenerMixin(object):
+    """A mixin for *virtual* event listeners.
+
+    Subclasses must be decorated with
+    :meth:`pynput._util.NotifierMixin._receiver` for their controller class.
+    Controllers deliver events by calling :meth:`_on_fake_event` from their
+    own thread.
+    """
+    def __init__(self, *args, **kwargs):
+        super(ListenerMixin, self).__init__(*args, **kwargs)
+        self._stopped = threading.Event()
+
+    def _run(self):
+        with self._receive():
+            self._mark_ready()
+            self._stopped.wait()
+
+    def _stop_platform(self):
+        self._stopped.set()
+
+    def _on_fake_event(self, action, *args):
+        """The handler for events sent by the controllers.
+
+        Exceptions other than :class:`StopException` are not passed to the
+        controller; they are reraised by :meth:`join`.
+
+        :param str action: The name of the callback to call.
+
+        :param args: The arguments to pass, excluding ``injected``.
+        """
+        try:
+            self._dispatch(action, args)
+        except self.StopException:
+            raise
+        except Exception:  # pylint: disable=W0703
+            pass
+
+    def _receive_many(self, notifications):
+        """The handler for batches of events sent by the controllers.
+
+        :param notifications: The events, as a list of ``(action, args)``,
+            where ``action`` is always ``'_on_fake_event'``.
+        """
+        try:
+            for _, args in notifications:
+                self._dispatch(args[0], args[1:])
+        except self.StopException:
+            raise
+        except Exception:  # pylint: disable=W0703
+            pass
+
+    @AbstractListener._emitter
+    def _dispatch(self, action, args):
+        """Calls a callback.
+
+        :param str action: The name of the callback to call.
+
+        :param tuple args: The arguments to pass, excluding ``injected``.
+        """
+        if self.running:
+            getattr(self, action)(*self._translate(action, args) + (True,))
+
+    def _translate(self, action, args):
+        """Converts the arguments of an event to the form expected by the
+        callbacks.
+
+        The default implementation returns the arguments unchanged.
+
+        :param str action: The name of the callback.
+
+        :param tuple args: The arguments.
+
+        :return: the arguments to pass
+        """
+        return args
@@ -21,50 +21,78 @@ Utility functions and classes for the *Xorg* backend.
 # pylint: disable=R0903
 # We implement stubs
 
+import bisect
+import collections
 import contextlib
 import functools
 import itertools
 import operator
+import struct
+import threading
+
+import six
 import Xlib.display
 import Xlib.keysymdef
+import Xlib.keysymdef.xkb
+import Xlib.protocol.rq
 import Xlib.threaded
 import Xlib.XK
 
-from . import AbstractListener
-from .xorg_keysyms import SYMBOLS
+from . import AbstractListener, RingBuffer
+from .xorg_keysyms import KEYSYMS, SYMBOLS
 
 
 # Create a display to verify that we have an X connection
 def _check_and_initialize():
     display = Xlib.display.Display()
     display.close()
-
-    for group in Xlib.keysymdef.__all__:
-        Xlib.XK.load_keysym_group(group)
 _check_and_initialize()
 del _check_and_initialize
 
 
+#: The *keysym* groups loaded into :mod:`Xlib.XK`; *Xlib* loads some groups
+#: itself, and the rest are loaded by :func:`string_to_keysym` when needed
+_KEYSYM_GROUPS = set(('latin1', 'miscellany'))
+
+
 class X11Error(Exception):
     """An error that is thrown at the end of a code block managed by a
     :func:`display_manager` if an *X11* error occurred.
+
+    When raised from a :func:`display_batch`, the first argument is a list of
+    the tuples ``(operation, args)``, where ``operation`` is the operation
+    passed to :func:`display_manager` for the block causing the error, and
+    ``args`` the arguments passed to the error handler.
     """
     pass
 
 
 @contextlib.contextmanager
-def display_manager(display):
+def display_manager(display, operation=None):
     """Traps *X* errors and raises an :class:``X11Error`` at the end if any
     error occurred.
 
     This handler also ensures that the :class:`Xlib.display.Display` being
     managed is sync'd.
 
+    If a :func:`display_batch` is active for the display, errors are instead
+    trapped by the batch, and the display is not sync'd.
+
     :param Xlib.display.Display display: The *X* display.
 
+    :param operation: A description of the operation performed in the block.
+        This is used to attribute errors to operations in a
+        :func:`display_batch`.
+
     :return: the display
     :rtype: Xlib.display.Display
     """
+    batch = getattr(display, '__batch', None)
+    if batch is not None:
+        batch.begin(operation)
+        yield display
+        return
+
     errors = []
 
     def handler(*args):
@@ -82,6 +110,159 @@ def display_manager(display):
         raise X11Error(errors)
 
 
+class DisplayBatch(object):
+    """A sequence of operations sent to a display without waiting for the
+    server to process each one.
+
+    Instances of this class are created by :func:`display_batch`.
+
+    :param Xlib.display.Display display: The *X* display.
+
+    :param size: The maximum number of operations to queue before waiting for
+        the server. If this is ``None``, the display is sync'd only when the
+        batch ends.
+    """
+    #: The number of request serial numbers; serials wrap around at this value
+    SERIALS = 0x10000
+
+    def __init__(self, display, size=None):
+        self._display = display
+        self._size = size
+        self._errors = []
+        self._operations = []
+        self._base = self._serial()
+
+    def begin(self, operation):
+        """Marks the start of an operation.
+
+        All requests sent until the next call to this method are considered to
+        be part of this operation.
+
+        If the maximum number of queued operations has been reached, or if
+        request serial numbers would become ambiguous, the display is sync'd
+        first.
+
+        :param operation: A description of the operation.
+
+        :raises X11Error: if the display is sync'd and a previous operation
+            caused an error
+        """
+        offset = (self._serial() - self._base) % self.SERIALS
+        if (self._size is not None and len(self._operations) >= self._size) \
+                or offset > self.SERIALS // 2:
+            self.sync()
+            offset = 0
+        self._operations.append((offset, operation))
+
+    def sync(self):
+        """Waits for the server to process all queued requests.
+
+        :raises X11Error: if any queued operation caused an error
+        """
+        self._display.sync()
+        errors = [
+            (self._operation(args), args)
+            for args in self._errors]
+        del self._errors[:]
+        del self._operations[:]
+        self._base = self._serial()
+        if errors:
+            raise X11Error(errors)
+
+    def handler(self, *args):
+        """The *Xlib* error handler.
+        """
+        self._errors.append(args)
+
+    def _serial(self):
+        """The serial number of the next request sent to the display.
+        """
+        return self._display.display.request_serial
+
+    def _operation(self, args):
+        """Finds the operation causing an error.
+
+        :param args: The arguments passed to the error handler.
+
+        :return: the operation, or ``None`` if it cannot be determined
+        """
+        sequence_number = getattr(args[0], 'sequence_number', None)
+        if sequence_number is None or not self._operations:
+            return None
+        offset = (sequence_number - self._base) % self.SERIALS
+        index = bisect.bisect_right(
+            [start for start, _ in self._operations], offset) - 1
+        return self._operations[index][1] if index >= 0 else None
+
+
+@contextlib.contextmanager
+def display_batch(display, size=None):
+    """Executes a block with the requests of all :func:`display_manager` blocks
+    for a display queued.
+
+    A single error handler is installed for the duration of the block, and the
+    display is sync'd only at the end of the block, or once for every ``size``
+    operations. Errors are attributed to the operation causing them, and are
+    raised as an :class:`X11Error` when the batch is sync'd; an error may thus
+    be raised by an operation later than the one causing it, or when the block
+    exits.
+
+    Batches do not nest; if a batch is already active for the display, this is
+    a no-op.
+
+    :param Xlib.display.Display display: The *X* display.
+
+    :param size: The maximum number of operations to queue before waiting for
+        the server.
+
+    :return: the batch
+    :rtype: DisplayBatch
+    """
+    batch = getattr(display, '__batch', None)
+    if batch is not None:
+        yield batch
+        return
+
+    batch = DisplayBatch(display, size)
+    old_handler = display.set_error_handler(batch.handler)
+    setattr(display, '__batch', batch)
+    try:
+        yield batch
+        batch.sync()
+    finally:
+        setattr(display, '__batch', None)
+        display.set_error_handler(old_handler)
+
+
+def string_to_keysym(symbol):
+    """Converts a symbol name to a *keysym* using :mod:`Xlib.XK`.
+
+    Loading all *keysym* groups of :mod:`Xlib.keysymdef` is slow, so they are
+    loaded only when a symbol cannot be found in the already loaded groups.
+
+    :param str symbol: The name of the symbol.
+
+    :return: the corresponding *keysym*, or ``0`` if it cannot be found
+    """
+    keysym = Xlib.XK.string_to_keysym(symbol)
+    if keysym:
+        return keysym
+
+    # Media keys are all in the xf86 group
+    groups = [
+        group
+        for group in (
+            ('xf86',) if symbol.startswith('XF86')
+            else Xlib.keysymdef.__all__)
+        if group not in _KEYSYM_GROUPS]
+    if not groups:
+        return 0
+    for group in groups:
+        Xlib.XK.load_keysym_group(group)
+        _KEYSYM_GROUPS.add(group)
+    return Xlib.XK.string_to_keysym(symbol)
+
+
 def _find_mask(display, symbol):
     """Returns the mode flags to use for a modifier symbol.
 
@@ -148,6 +329,19 @@ def numlock_mask(display):
     return display.__numlock_mask
 
 
+def reset_masks(display):
+    """Clears the modifier masks cached for a display.
+
+    This must be called when the modifier or keyboard mapping changes, as
+    announced by a ``MappingNotify`` event.
+
+    :param Xlib.display.Display display: The *X* display.
+    """
+    for name in ('__alt_mask', '__altgr_mask', '__numlock_mask'):
+        if hasattr(display, name):
+            delattr(display, name)
+
+
 def keysym_is_latin_upper(keysym):
     """Determines whether a *keysym* is an upper case *latin* character.
 
@@ -351,6 +545,28 @@ def char_to_keysym(char):
         return ordinal | 0x01000000
 
 
+def keysym_to_chars(keysym):
+    """Lists the unicode characters possibly represented by a *keysym*.
+
+    This is the inverse of :func:`char_to_keysym` combined with a lookup in
+    the table of named *keysyms*; the caller must verify that a character
+    actually maps to the *keysym*.
+
+    :param int keysym: The *keysym*.
+
+    :return: a list of characters
+    """
+    chars = []
+    name = KEYSYMS.get(keysym, None)
+    if name is not None and SYMBOLS[name][1]:
+        chars.append(SYMBOLS[name][1])
+    if keysym < 0x100:
+        chars.append(six.unichr(keysym))
+    elif keysym & 0xff000000 == 0x01000000:
+        chars.append(six.unichr(keysym & 0x00ffffff))
+    return chars
+
+
 def symbol_to_keysym(symbol):
     """Converts a symbol name to a *keysym*.
 
@@ -359,26 +575,145 @@ def symbol_to_keysym(symbol):
     :return: the corresponding *keysym*, or ``0`` if it cannot be found
     """
     # First try simple translation, the try a module attribute of
-    # Xlib.keysymdef.xkb and fall back on our pre-generated table
+    # Xlib.keysymdef.xkb, then our pre-generated table, and finally fall back
+    # on loading all keysym groups
     return (0
         or Xlib.XK.string_to_keysym(symbol)
         or getattr(Xlib.keysymdef.xkb, "XK_" + symbol, 0)
-        or SYMBOLS.get(symbol, (0,))[0])
+        or SYMBOLS.get(symbol, (0,))[0]
+        or string_to_keysym(symbol))
+
+
+#: A core input event as decoded by :func:`parse_events`.
+#:
+#: The fields are named as the fields of the corresponding
+#: :mod:`Xlib.protocol.event` classes; ``root``, ``window`` and ``child`` are
+#: resource IDs and not resource objects.
+CoreEvent = collections.namedtuple('CoreEvent', (
+    'type',
+    'send_event',
+    'detail',
+    'sequence_number',
+    'time',
+    'root',
+    'window',
+    'child',
+    'root_x',
+    'root_y',
+    'event_x',
+    'event_y',
+    'state',
+    'same_screen'))
+
+#: The binary layout of core input events; data received from the *X* server
+#: is in the byte order of the client, which is the native byte order
+_CORE_EVENT = struct.Struct('=BBHIIIIhhhhHBx')
+
+#: The event types with the layout described by :data:`_CORE_EVENT`
+_CORE_EVENT_TYPES = frozenset((
+    Xlib.X.KeyPress,
+    Xlib.X.KeyRelease,
+    Xlib.X.ButtonPress,
+    Xlib.X.ButtonRelease,
+    Xlib.X.MotionNotify))
+
+#: The generic event parser used for events not in :data:`_CORE_EVENT_TYPES`
+_EVENT_PARSER = Xlib.protocol.rq.EventField(None)
+
+
+def parse_events(data, display):
+    """Parses a block of events as received from the *RECORD* extension.
+
+    Key, button and motion events are decoded into :class:`CoreEvent`
+    instances, and any other events are parsed by *Xlib*.
+
+    :param bytes data: The binary data.
+
+    :param display: The low level display, ``Xlib.display.Display.display``,
+        used when falling back on the *Xlib* parser.
+
+    :return: an iterable of events
+    """
+    size = _CORE_EVENT.size
+    length = len(data)
+    offset = 0
+    while offset < length:
+        event_type = six.indexbytes(data, offset)
+        if event_type & 0x7f in _CORE_EVENT_TYPES \
+                and offset + size <= length:
+            values = _CORE_EVENT.unpack_from(data, offset)
+            offset += size
+            yield CoreEvent(
+                event_type & 0x7f,
+                bool(event_type & 0x80),
+                *values[1:])
+        else:
+            event, rest = _EVENT_PARSER.parse_binary_value(
+                data[offset:], display, None, None)
+            offset = length - len(rest)
+            yield event
 
 
 class ListenerMixin(object):
     """A mixin for *X* event listeners.
 
     Subclasses should set a value for :attr:`_EVENTS` and implement
-    :meth:`_handle_message`.
+    :meth:`_handle_message` and :meth:`_event_types`.
+
+    If any of the options ``buffer_size`` or ``on_events`` are passed, events
+    are not delivered on the thread receiving them from the *X* server, but
+    are passed through a :class:`pynput._util.RingBuffer` to a separate
+    delivery thread. This prevents slow callbacks from stalling the *X*
+    server.
     """
     #: The events for which to listen
     _EVENTS = tuple()
 
-    #: We use this instance for parsing the binary data
-    _EVENT_PARSER = Xlib.protocol.rq.EventField(None)
+    #: The range of events delivered to other clients for which to listen, as
+    #: the tuple ``(first, last)``
+    _DELIVERED_EVENTS = (0, 0)
+
+    #: The default size of the buffer used for delayed delivery
+    _BUFFER_SIZE = 1024
+
+    #: The buffer used for delayed delivery, or ``None`` if events are
+    #: delivered immediately
+    _buffer = None
+
+    #: The events accumulated for the batch callback, or ``None`` if it is not
+    #: used
+    _batch = None
+
+    @property
+    def events_dropped(self):
+        """The number of events discarded since the delivery buffer was full.
+
+        This is always ``0`` if events are delivered immediately.
+        """
+        return self._buffer.dropped if self._buffer is not None else 0
+
+    @property
+    def events_lagging(self):
+        """The number of events that had to wait for previous events to be
+        delivered.
+
+        This is always ``0`` if events are delivered immediately.
+        """
+        return self._buffer.lagging if self._buffer is not None else 0
 
     def _run(self):
+        options = getattr(self, '_options', {})
+        on_events = options.get('on_events', None)
+        if on_events is not None or options.get('buffer_size', None):
+            self._buffer = RingBuffer(
+                options.get('buffer_size', None) or self._BUFFER_SIZE,
+                options.get('overflow', RingBuffer.BLOCK))
+            self._delivery = threading.Thread(target=self._deliver_loop)
+            self._delivery.daemon = True
+        if on_events is not None:
+            self._batch = []
+            self._batch_callback(on_events)
+
         self._display_stop = Xlib.display.Display()
         self._display_record = Xlib.display.Display()
         self._stopped = False
@@ -391,7 +726,7 @@ class ListenerMixin(object):
                     'core_replies': (0, 0),
                     'ext_requests': (0, 0, 0, 0),
                     'ext_replies': (0, 0, 0, 0),
-                    'delivered_events': (0, 0),
+                    'delivered_events': self._DELIVERED_EVENTS,
                     'device_events': self._EVENTS,
                     'errors': (0, 0),
                     'client_started': False,
@@ -400,6 +735,8 @@ class ListenerMixin(object):
         # pylint: disable=W0702; we want to silence errors
         try:
             self._initialize(self._display_stop)
+            if self._buffer is not None:
+                self._delivery.start()
             self._mark_ready()
             if self.suppress:
                 with display_manager(self._display_stop) as dm:
@@ -410,6 +747,10 @@ class ListenerMixin(object):
             # This exception will have been passed to the main thread
             pass
         finally:
+            if self._buffer is not None:
+                self._buffer.close()
+                if self._delivery.ident is not None:
+                    self._delivery.join()
             if self.suppress:
                 with display_manager(self._display_stop) as dm:
                     self._suppress_stop(dm)
@@ -457,19 +798,100 @@ class ListenerMixin(object):
         on initialisation.
 
         :param events: The events passed by *X*. This is a binary block
-            parsable by :attr:`_EVENT_PARSER`.
+            parsable by :func:`parse_events`.
         """
         if not self.running:
             raise self.StopException()
 
-        data = events.data
+        for event in parse_events(
+                events.data, self._display_record.display):
+            injected = event.send_event
+            if self._buffer is None:
+                self._handle_message(self._display_stop, event, injected)
+            else:
+                self._buffer.put((
+                    self._handle_message,
+                    (self._display_stop, event, injected)))
 
-        while data and len(data):
-            event, data = self._EVENT_PARSER.parse_binary_value(
-                data, self._display_record.display, None, None)
+    def _deliver(self, f, *args):
+        """Calls a function delivering an event.
 
-            injected = event.send_event
-            self._handle_message(self._display_stop, event, injected)
+        If events are delivered immediately, or this method is called from
+        the delivery thread, the function is called directly, otherwise it is
+        added to the delivery buffer. The delivery thread is the only reader
+        of the buffer, so it must never wait for room in it; this happens for
+        example when a callback uses a controller.
+
+        :param callable f: The function to call.
+
+        :param args: The arguments to pass.
+        """
+        if self._buffer is None \
+                or threading.current_thread() is self._delivery:
+            f(*args)
+        else:
+            self._buffer.put((f, args))
+
+    def _deliver_loop(self):
+        """The runner for the delivery thread.
+
+        This method delivers events from the delivery buffer until the buffer
+        is closed or the listener is stopped.
+        """
+        # pylint: disable=W0702; exceptions have been passed to the main thread
+        try:
+            while self.running:
+                items = self._buffer.get_many()
+                if not items or not self.running:
+                    break
+                self._deliver_batch(items)
+        except:
+            pass
+        finally:
+            self._buffer.close()
+        # pylint: enable=W0702
+
+    @AbstractListener._emitter
+    def _deliver_batch(self, items):
+        """Delivers a batch of events read from the delivery buffer.
+
+        :param list items: The items read from the buffer. These are tuples
+            ``(f, args)`` as passed to :meth:`_deliver`.
+        """
+        for f, args in items:
+            f(*args)
+        if self._batch:
+            batch, self._batch = self._batch, []
+            self.on_events(batch)
+
+    def _batch_callback(self, on_events):
+        """Registers the batch callback.
+
+        The callbacks passed to the constructor are wrapped to also collect
+        event objects for the batch callback.
+
+        :param callable on_events: The batch callback.
+        """
+        def wrapper(f, event_type):
+            def inner(*args):
+                self._batch.append(event_type(*args))
+                return f(*args)
+            return inner
+
+        def on_events_wrapper(events):
+            if on_events(events) is False:
+                raise self.StopException()
+
+        for name, event_type in self._event_types().items():
+            setattr(self, name, wrapper(getattr(self, name), event_type))
+        self.on_events = on_events_wrapper
+
+    def _event_types(self):
+        """Returns the event classes used for the batch callback.
+
+        :return: a mapping from callback name to event class
+        """
+        raise NotImplementedError()
 
     def _initialize(self, display):
         """Initialises this listener.
@@ -24,8 +24,10 @@ See the documentation for more information.
 # KeyCode, Key, Controller and Listener are not constants
 
 import itertools
+import sys
+import time
 
-from pynput._util import backend, Events
+from pynput._util import backend, Events, RingBuffer
 
 
 backend = backend(__name__)
@@ -73,6 +75,13 @@ class Events(Events):
 
     :class:`Events.Release`
         A key was released.
+
+    :param maxsize: The maximum number of events held until read, or ``None``
+        to not limit the number of events.
+    :type maxsize: int or None
+
+    :param str overflow: What to do when an event arrives and ``maxsize``
+        events are already held; see :class:`pynput._util.RingBuffer`.
     """
     _Listener = Listener
 
@@ -96,12 +105,68 @@ class Events(Events):
             #: Whether this event is synthetic.
             self.injected = injected
 
-    def __init__(self):
+    def __init__(self, maxsize=None, overflow=RingBuffer.DROP_NEWEST):
         super(Events, self).__init__(
+            maxsize=maxsize,
+            overflow=overflow,
             on_press=self.Press,
             on_release=self.Release)
 
 
+# The asyncio support uses syntax and functions not available in older
+# versions of Python
+if sys.version_info >= (3, 7):
+    from pynput._util.asynchronous import AsyncController, AsyncEvents
+
+    class AsyncEvents(AsyncEvents):
+        """A keyboard event listener supporting asynchronous iteration over the
+        events.
+
+        This class must be used as an asynchronous context manager::
+
+            async with AsyncEvents() as events:
+                async for event in events:
+                    ...
+
+        The events are the same as for :class:`Events`. This class requires
+        *Python 3.7* or later.
+
+        :param maxsize: The maximum number of events held until read, or
+            ``None`` to not limit the number of events.
+        :type maxsize: int or None
+
+        :param str overflow: What to do when an event arrives and ``maxsize``
+            events are already held; see :class:`pynput._util.RingBuffer`. By
+            default the listener is blocked until events are read.
+        """
+        _Listener = Listener
+
+        Press = Events.Press
+        Release = Events.Release
+
+        def __init__(self, maxsize=None, overflow=RingBuffer.BLOCK):
+            super(AsyncEvents, self).__init__(
+                maxsize=maxsize,
+                overflow=overflow,
+                on_press=self.Press,
+                on_release=self.Release)
+
+    class AsyncController(AsyncController):
+        """A keyboard controller for use with :mod:`asyncio`.
+
+        All methods of :class:`Controller` are available as coroutines, and
+        are performed in order from a dedicated thread. This class requires
+        *Python 3.7* or later::
+
+            async with AsyncController() as controller:
+                await controller.type('Hello World')
+
+        :param Controller controller: The controller to use. If this is not
+            passed, a new controller is created.
+        """
+        _Controller = Controller
+
+
 class HotKey(object):
     """A combination of keys acting as a hotkey.
 
@@ -177,6 +242,33 @@ class HotKey(object):
         else:
             return parsed_parts
 
+    @staticmethod
+    def parse_sequence(keys):
+        """Parses a key sequence string.
+
+        Key sequence strings are key combination strings, as accepted by
+        :meth:`parse`, separated by ``','``, such as ``'<ctrl>+k, <ctrl>+c'``.
+        A ``','`` directly following a ``'+'`` is the comma key. Whitespace
+        around combinations is ignored.
+
+        :return: a list of key combinations, as returned by :meth:`parse`
+
+        :raises ValueError: if a part of the keys string is invalid
+        """
+        def chords():
+            start = 0
+            for i, c in enumerate(keys):
+                chord = keys[start:i].strip()
+                if c == ',' and chord and (
+                        chord[-1] != '+' or chord.endswith('++')):
+                    yield chord
+                    start = i + 1
+            yield keys[start:].strip()
+
+        return [
+            HotKey.parse(chord)
+            for chord in chords()]
+
     def press(self, key):
         """Updates the hotkey state for a pressed key.
 
@@ -203,6 +295,95 @@ class HotKey(object):
             self._state.remove(key)
 
 
+class HotKeyMatcher(object):
+    """A collection of hotkeys sharing one keyboard state.
+
+    Unlike a list of :class:`HotKey` instances, which must all be updated for
+    every key event, this class looks up the hotkeys affected by a key, so the
+    cost of an event does not grow with the number of hotkeys.
+
+    Hotkeys may be sequences of key combinations, such as
+    ``'<ctrl>+k, <ctrl>+c'``. A sequence is activated when its combinations are
+    pressed in order, with at most ``timeout`` seconds between them. Pressing a
+    key not part of the next combination cancels the sequence.
+
+    :param dict hotkeys: A mapping from hotkey description to hotkey action.
+        Keys are strings passed to :meth:`HotKey.parse_sequence`.
+
+    :param float timeout: The maximum number of seconds between the
+        combinations of a sequence.
+
+    :raises ValueError: if any hotkey description is invalid
+    """
+    def __init__(self, hotkeys, timeout=1.0):
+        self._timeout = timeout
+
+        #: The hotkeys, as a list of ``(combinations, action)``, where
+        #: ``combinations`` is a tuple of frozensets
+        self._hotkeys = [
+            (tuple(frozenset(chord) for chord in HotKey.parse_sequence(key)),
+                value)
+            for key, value in hotkeys.items()]
+
+        #: A mapping from key to the hotkeys it is part of, as a list of
+        #: ``(index, step)``, where ``step`` is the index of the combination
+        self._index = {}
+        for index, (chords, _) in enumerate(self._hotkeys):
+            for step, chord in enumerate(chords):
+                for key in chord:
+                    self._index.setdefault(key, []).append((index, step))
+
+        #: The keys currently pressed
+        self._pressed = set()
+
+        #: The sequences in progress, as a mapping from hotkey index to the
+        #: tuple ``(step, deadline)``
+        self._progress = {}
+
+    def press(self, key):
+        """Updates the state for a pressed key.
+
+        If the key completes a hotkey, its action is invoked. Please note that
+        the action will only be invoked once, even if the key repeats.
+
+        :param key: The key being pressed.
+        :type key: Key or KeyCode
+        """
+        if key in self._pressed:
+            return
+        self._pressed.add(key)
+        now = time.monotonic()
+
+        # Cancel sequences which have timed out or been interrupted
+        if self._progress:
+            for index, (step, deadline) in list(self._progress.items()):
+                if now > deadline or key not in self._hotkeys[index][0][step]:
+                    del self._progress[index]
+
+        activated = []
+        for index, step in self._index.get(key, ()):
+            chords, action = self._hotkeys[index]
+            if step != self._progress.get(index, (0,))[0] \
+                    or not chords[step] <= self._pressed:
+                continue
+            if step + 1 == len(chords):
+                self._progress.pop(index, None)
+                activated.append(action)
+            else:
+                self._progress[index] = (step + 1, now + self._timeout)
+
+        for action in activated:
+            action()
+
+    def release(self, key):
+        """Updates the state for a released key.
+
+        :param key: The key being released.
+        :type key: Key or KeyCode
+        """
+        self._pressed.discard(key)
+
+
 class GlobalHotKeys(Listener):
     """A keyboard listener supporting a number of global hotkeys.
 
@@ -210,14 +391,17 @@ class GlobalHotKeys(Listener):
     hotkeys.
 
     :param dict hotkeys: A mapping from hotkey description to hotkey action.
-        Keys are strings passed to :meth:`HotKey.parse`.
+        Keys are strings passed to :meth:`HotKey.parse_sequence`; see
+        :class:`HotKeyMatcher`.
+
+    :param float timeout: The maximum number of seconds between the
+        combinations of a sequence.
 
     :raises ValueError: if any hotkey description is invalid
     """
     def __init__(self, hotkeys, *args, **kwargs):
-        self._hotkeys = [
-            HotKey(HotKey.parse(key), value)
-            for key, value in hotkeys.items()]
+        self._hotkeys = HotKeyMatcher(
+            hotkeys, kwargs.pop('timeout', 1.0))
         super(GlobalHotKeys, self).__init__(
             on_press=self._on_press,
             on_release=self._on_release,
@@ -233,8 +417,7 @@ class GlobalHotKeys(Listener):
         :param injected: Whether the event was injected.
         """
         if not injected:
-            for hotkey in self._hotkeys:
-                hotkey.press(self.canonical(key))
+            self._hotkeys.press(self.canonical(key))
 
     def _on_release(self, key, injected):
         """The release callback.
@@ -245,5 +428,4 @@ class GlobalHotKeys(Listener):
         :param injected: Whether the event was injected.
         """
         if not injected:
-            for hotkey in self._hotkeys:
-                hotkey.release(self.canonical(key))
+            self._hotkeys.release(self.canonical(key))
@@ -39,32 +39,58 @@ class KeyCode(object):
     """
     A :class:`KeyCode` represents the description of a key code used by the
     operating system.
+
+    Key codes are immutable. The key codes returned by :meth:`from_vk`,
+    :meth:`from_char` and :meth:`from_dead` are shared, so creating a key code
+    for every key event does not allocate any memory once the keys have been
+    seen.
     """
+    # Subclasses must list their platform extensions in __slots__
+    __slots__ = ('vk', 'char', 'is_dead', 'combining', '_hash')
+
     #: The names of attributes used as platform extensions.
     _PLATFORM_EXTENSIONS = []
 
+    #: The maximum number of shared instances
+    _INTERNED_SIZE = 1 << 16
+
     def __init__(self, vk=None, char=None, is_dead=False, **kwargs):
-        self.vk = vk
-        self.char = six.text_type(char) if char is not None else None
-        self.is_dead = is_dead
+        char = six.text_type(char) if char is not None else None
 
-        if self.is_dead:
+        if is_dead:
             try:
-                self.combining = unicodedata.lookup(
-                    'COMBINING ' + unicodedata.name(self.char))
+                combining = unicodedata.lookup(
+                    'COMBINING ' + unicodedata.name(char))
             except KeyError:
-                self.is_dead = False
-                self.combining = None
-            if self.is_dead and not self.combining:
+                is_dead = False
+                combining = None
+            if is_dead and not combining:
                 raise KeyError(char)
         else:
-            self.combining = None
-
+            combining = None
+
+        # We are immutable, so we must bypass __setattr__
+        set_ = object.__setattr__
+        set_(self, 'vk', vk)
+        set_(self, 'char', char)
+        set_(self, 'is_dead', is_dead)
+        set_(self, 'combining', combining)
         for key in self._PLATFORM_EXTENSIONS:
-            setattr(self, key, kwargs.pop(key, None))
+            set_(self, key, kwargs.pop(key, None))
         if kwargs:
             raise ValueError(kwargs)
 
+    def __setattr__(self, name, value):
+        raise AttributeError(name)
+
+    def __delattr__(self, name):
+        raise AttributeError(name)
+
+    def __reduce__(self):
+        return (self._intern, (self.vk, self.char, self.is_dead) + tuple(
+            getattr(self, key)
+            for key in self._PLATFORM_EXTENSIONS))
+
 
     def __repr__(self):
         if self.is_dead:
@@ -78,6 +104,8 @@ class KeyCode(object):
         return repr(self)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, self.__class__):
             return False
         if self.char is not None and other.char is not None:
@@ -88,7 +116,12 @@ class KeyCode(object):
                 for f in self._PLATFORM_EXTENSIONS)
 
     def __hash__(self):
-        return hash(repr(self))
+        try:
+            return self._hash
+        except AttributeError:
+            value = hash(repr(self))
+            object.__setattr__(self, '_hash', value)
+            return value
 
     def join(self, key):
         """Applies this dead key to another key and returns the result.
@@ -134,7 +167,7 @@ class KeyCode(object):
 
         :return: a key code
         """
-        return cls(vk=vk, **kwargs)
+        return cls._intern(vk=vk, **kwargs)
 
     @classmethod
     def from_char(cls, char, **kwargs):
@@ -144,7 +177,7 @@ class KeyCode(object):
 
         :return: a key code
         """
-        return cls(char=char, **kwargs)
+        return cls._intern(char=char, **kwargs)
 
     @classmethod
     def from_dead(cls, char, **kwargs):
@@ -156,7 +189,41 @@ class KeyCode(object):
 
         :return: a key code
         """
-        return cls(char=char, is_dead=True, **kwargs)
+        return cls._intern(char=char, is_dead=True, **kwargs)
+
+    @classmethod
+    def _intern(cls, vk=None, char=None, is_dead=False, *args, **kwargs):
+        """Returns the shared key code for a set of constructor arguments,
+        creating it if necessary.
+
+        :param args: The values of the platform extensions, in the order of
+            :attr:`_PLATFORM_EXTENSIONS`. These may also be passed as keyword
+            arguments.
+
+        :return: a key code
+        """
+        if args:
+            kwargs.update(zip(cls._PLATFORM_EXTENSIONS, args))
+        identity = (cls, vk, char, is_dead)
+        if kwargs:
+            identity += tuple(
+                kwargs.get(key, None)
+                for key in cls._PLATFORM_EXTENSIONS)
+
+        try:
+            return _INTERNED[identity]
+        except KeyError:
+            result = cls(vk=vk, char=char, is_dead=is_dead, **kwargs)
+            if len(_INTERNED) < cls._INTERNED_SIZE:
+                _INTERNED[identity] = result
+            return result
+        except TypeError:
+            # An argument is not hashable, so we cannot share the instance
+            return cls(vk=vk, char=char, is_dead=is_dead, **kwargs)
+
+
+#: The shared key codes, keyed by class and constructor arguments
+_INTERNED = {}
 
 
 class Key(enum.Enum):
@@ -473,6 +540,23 @@ class Controller(object):
             for key in reversed(args):
                 self.release(key)
 
+    @contextlib.contextmanager
+    def batch(self):
+        """Executes a block with all events sent together.
+
+        On some platforms, every event sent requires waiting for the system to
+        process it. Within this block, events are instead queued, and the
+        controller waits only once, when the block exits. Errors caused by
+        events sent in the block may therefore not be raised until then.
+
+        Nested blocks are merged with the outermost one.
+
+        The default implementation sends events immediately.
+
+        :return: this controller
+        """
+        yield self
+
     def type(self, string):
         """Types a string.
 
@@ -573,8 +657,9 @@ class Controller(object):
 
         :return: a key code, or ``None`` if it cannot be resolved
         """
-        # Use the value for the key constants
-        if key in (k for k in self._Key):
+        # Use the value for the key constants; enum members equal only
+        # themselves, so this is the same as looking for the key among them
+        if isinstance(key, self._Key):
             return key.value
 
         # Convert strings to key codes
@@ -586,7 +671,7 @@ class Controller(object):
         # Assume this is a proper key
         if isinstance(key, self._KeyCode):
             if key.char is not None and self.shift_pressed:
-                return self._KeyCode(vk=key.vk, char=key.char.upper())
+                return self._KeyCode.from_char(key.char.upper(), vk=key.vk)
             else:
                 return key
 
@@ -699,8 +784,10 @@ class Listener(AbstractListener):
 
             If this is specified, *pynput* will limit the number of devices
             checked for the capabilities needed to those passed, otherwise all
-            system devices will be used. Passing this might be required if an
-            incorrect device is chosen.
+            system devices will be used, and devices added while the listener
+            is running will be picked up. Events are read from all devices
+            with keys. Passing this might be required if an incorrect device
+            is chosen.
 
         ``win32_event_filter``
             A callable taking the arguments ``(msg, data)``, where ``msg`` is
@@ -712,6 +799,30 @@ class Listener(AbstractListener):
 
             If ``self.suppress_event()`` is called, the event is suppressed
             system wide.
+
+        ``xorg_buffer_size``
+            The maximum number of events waiting for delivery.
+
+            If this is specified, events are delivered from a separate thread,
+            so that slow callbacks do not stall the *X* server. The number of
+            events discarded and delayed are available as
+            ``self.events_dropped`` and ``self.events_lagging``.
+
+        ``xorg_overflow``
+            What to do when an event arrives while ``xorg_buffer_size`` events
+            are waiting for delivery: ``'drop-oldest'`` discards the oldest
+            waiting event, ``'drop-newest'`` discards the new event and
+            ``'block'``, the default, waits until there is room.
+
+        ``xorg_on_events``
+            A callable taking the argument ``(events)``, where ``events`` is a
+            list of event objects, such as :class:`pynput.keyboard.Events.Press`,
+            delivered together.
+
+            It is called once for every batch of events read from the buffer,
+            after the other callbacks. Passing this enables a buffer as if
+            ``xorg_buffer_size`` was passed. If this callback returns
+            ``False``, the listener is stopped.
     """
     def __init__(self, on_press=None, on_release=None, suppress=False,
                  **kwargs):
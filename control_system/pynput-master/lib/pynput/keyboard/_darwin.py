@@ -90,8 +90,7 @@ class KeyCode(_base.KeyCode):
         '_is_media',
     )
 
-    # Be explicit about fields
-    _is_media = None
+    __slots__ = _PLATFORM_EXTENSIONS
 
     @classmethod
     def _from_media(cls, vk, **kwargs):
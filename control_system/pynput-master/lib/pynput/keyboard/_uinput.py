@@ -24,18 +24,24 @@ The keyboard implementation for *uinput*.
 # pylint: disable=R0903
 # We implement stubs
 
+import contextlib
 import enum
 import errno
-import functools
+import hashlib
+import json
 import os
 import re
+import struct
 import subprocess
+import tempfile
+import time
 
 import evdev
 
 from evdev.events import KeyEvent
 
-from pynput._util import xorg_keysyms
+from pynput._info import __version__
+from pynput._util import AbstractListener, xorg_keysyms
 from pynput._util.uinput import ListenerMixin
 from . import _base
 
@@ -47,9 +53,7 @@ class KeyCode(_base.KeyCode):
         '_kernel_name',
     )
 
-    # Be explicit about fields
-    _x_name = None
-    _kernel_name = None
+    __slots__ = _PLATFORM_EXTENSIONS
 # pylint: enable=W0212
 
     @classmethod
@@ -137,8 +141,30 @@ class Key(enum.Enum):
 # pylint: enable=W0212
 
 
+# pylint: disable=W0212
+#: A mapping from *X* name to special key; we iterate in reverse order so that
+#: the first key with a name takes precedence
+_X_NAME_KEYS = {
+    key.value._x_name: key
+    for key in reversed(Key)}
+# pylint: enable=W0212
+
+#: A mapping from virtual key code to special key; we iterate in reverse order
+#: so that the first key with a virtual key code takes precedence
+_VK_KEYS = {
+    key.value.vk: key
+    for key in reversed(Key)
+    if key.value.vk is not None}
+
+
 class Layout(object):
     """A description of the keyboard layout.
+
+    Parsing the layout is slow, so the parsed layout is cached on disk, in
+    ``$XDG_CACHE_HOME/pynput``, keyed by a hash of the ``dumpkeys`` output. If
+    the cache cannot be read or written, the layout is parsed every time.
+
+    :param bool cache: Whether to use the on-disk cache.
     """
     #: A regular expression to parse keycodes in the dumpkeys output
     #:
@@ -146,6 +172,10 @@ class Layout(object):
     KEYCODE_RE = re.compile(
         r'keycode\s+(\d+)\s+=(.*)')
 
+    #: The version of the cache format; this must be incremented when the
+    #: format, or the parsing of layouts, changes
+    _CACHE_VERSION = 1
+
     class Key(object):
         """A key in a keyboard layout.
         """
@@ -196,19 +226,17 @@ class Layout(object):
             """
             return self._values[3]
 
-    def __init__(self):
-        def as_char(k):
-            return k.value.char if isinstance(k, Key) else k.char
-        self._vk_table = self._load()
-        self._char_table = {
-            as_char(key): (
-                vk,
-                set()
-                    | {Key.shift} if i & 1 else set()
-                    | {Key.alt_gr} if i & 2 else set())
-            for vk, keys in self._vk_table.items()
-            for i, key in enumerate(keys)
-            if key is not None and as_char(key) is not None}
+    def __init__(self, cache=True):
+        self._cache = cache
+        self._update(self._load())
+
+    def refresh(self):
+        """Reloads the keyboard layout.
+
+        Call this method if the keyboard layout has changed. Any cached layout
+        is ignored and replaced.
+        """
+        self._update(self._load(refresh=True))
 
     def for_vk(self, vk, modifiers):
         """Reads a key for a virtual key code and modifier state.
@@ -237,17 +265,141 @@ class Layout(object):
         """
         return self._char_table[char]
 
-    @functools.lru_cache()
-    def _load(self):
+    def _update(self, vk_table):
+        """Replaces the layout tables.
+
+        :param dict vk_table: The new mapping from virtual key code to
+            :class:`Layout.Key`.
+        """
+        def as_char(k):
+            return k.value.char if isinstance(k, Key) else k.char
+        self._vk_table = vk_table
+        self._char_table = {
+            as_char(key): (
+                vk,
+                set()
+                    | {Key.shift} if i & 1 else set()
+                    | {Key.alt_gr} if i & 2 else set())
+            for vk, keys in self._vk_table.items()
+            for i, key in enumerate(keys)
+            if key is not None and as_char(key) is not None}
+
+    def _load(self, refresh=False):
         """Loads the keyboard layout.
 
         For simplicity, we call out to the ``dumpkeys`` binary. In the future,
         we may want to implement this ourselves.
+
+        :param bool refresh: Whether to ignore any cached layout.
+
+        :return: a mapping from virtual key code to :class:`Layout.Key`
+        """
+        dump = self._dump()
+        path = self._cache_path(dump) if self._cache else None
+
+        if path is not None and not refresh:
+            try:
+                with open(path, 'r') as f:
+                    return self._deserialize(json.load(f))
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+
+        result = self._parse_dump(dump.decode('utf-8'))
+
+        if path is not None:
+            # Write to a temporary file to make sure that readers never see a
+            # partial cache, and remove it if it cannot be moved in place
+            name = None
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with tempfile.NamedTemporaryFile(
+                        'w',
+                        dir=os.path.dirname(path),
+                        delete=False) as f:
+                    name = f.name
+                    json.dump(self._serialize(result), f)
+                os.replace(name, path)
+                name = None
+            except OSError:
+                pass
+            finally:
+                if name is not None:
+                    try:
+                        os.unlink(name)
+                    except OSError:
+                        pass
+
+        return result
+
+    def _dump(self):
+        """Reads the current keyboard layout using ``dumpkeys``.
+
+        :return: the output of ``dumpkeys``
+
+        :raises subprocess.CalledProcessError: if ``dumpkeys`` fails
+        """
+        return subprocess.check_output(
+            ['dumpkeys', '--full-table', '--keys-only'])
+
+    def _cache_path(self, dump):
+        """Returns the path of the cached layout for a ``dumpkeys`` output.
+
+        :param bytes dump: The output of ``dumpkeys``.
+
+        :return: a path
+        """
+        digest = hashlib.sha256()
+        digest.update(repr((__version__, self._CACHE_VERSION)).encode('utf-8'))
+        digest.update(dump)
+        return os.path.join(
+            os.environ.get('XDG_CACHE_HOME', None)
+            or os.path.join(os.path.expanduser('~'), '.cache'),
+            'pynput',
+            'uinput-layout-{}.json'.format(digest.hexdigest()))
+
+    def _serialize(self, vk_table):
+        """Converts a layout table to a value that can be stored as *JSON*.
+
+        Special keys are stored as their names, and other keys as the list
+        ``[char, vk]``.
+
+        :param dict vk_table: The mapping from virtual key code to
+            :class:`Layout.Key`.
+
+        :return: a list
+        """
+        return [
+            [vk, [
+                None if key is None
+                else key.name if isinstance(key, Key)
+                else [key.char, key.vk]
+                for key in keys]]
+            for vk, keys in vk_table.items()]
+
+    def _deserialize(self, data):
+        """Converts a value created by :meth:`_serialize` to a layout table.
+
+        :param list data: The stored value.
+
+        :return: a mapping from virtual key code to :class:`Layout.Key`
+        """
+        return {
+            vk: self.Key(*(
+                None if key is None
+                else Key[key] if isinstance(key, str)
+                else KeyCode.from_char(key[0], vk=key[1])
+                for key in keys))
+            for vk, keys in data}
+
+    def _parse_dump(self, dump):
+        """Parses the output of ``dumpkeys``.
+
+        :param str dump: The output of ``dumpkeys``.
+
+        :return: a mapping from virtual key code to :class:`Layout.Key`
         """
         result = {}
-        for keycode, names in self.KEYCODE_RE.findall(
-                subprocess.check_output(
-                    ['dumpkeys', '--full-table', '--keys-only']).decode('utf-8')):
+        for keycode, names in self.KEYCODE_RE.findall(dump):
             vk = int(keycode)
             keys = tuple(
                 self._parse(vk, name)
@@ -267,11 +419,8 @@ class Layout(object):
         """
         try:
             # First try special keys...
-            return next(
-                key
-                for key in Key
-                if key.value._x_name == name)
-        except StopIteration:
+            return _X_NAME_KEYS[name]
+        except KeyError:
             # ...then characters...
             try:
                 _, char = xorg_keysyms.SYMBOLS[name.lstrip('+')]
@@ -301,15 +450,109 @@ class Controller(_base.Controller):
     _KeyCode = KeyCode
     _Key = Key
 
+    #: The binary layout of ``struct input_event``: a ``struct timeval``
+    #: followed by the type, code and value; the kernel ignores the time for
+    #: events written to *uinput*
+    _INPUT_EVENT = struct.Struct('@llHHi')
+
     def __init__(self, *args, **kwargs):
         super(Controller, self).__init__(*args, **kwargs)
         self._layout = LAYOUT
-        self._dev = evdev.UInput()
+        self._dev = self._device()
+
+        #: The events collected by :meth:`_batch`, or ``None``
+        self._pending = None
+
+        #: The offsets in :attr:`_pending` at which ``SYN_REPORT`` events end
+        self._frames = None
+
+        #: The number of seconds to wait after each ``SYN_REPORT`` frame when
+        #: writing batched events, such as when typing a string, or ``None``
+        #: to send all events at once.
+        #:
+        #: Set this if the receiver drops events arriving too quickly.
+        self.pacing = None
 
     def __del__(self):
         if hasattr(self, '_dev'):
             self._dev.close()
 
+    @contextlib.contextmanager
+    def batch(self):
+        with self._batch():
+            yield self
+
+    def type(self, string):
+        # Collect all events and write them at once
+        with self._batch():
+            super(Controller, self).type(string)
+
+    @contextlib.contextmanager
+    def _batch(self):
+        """Collects all events sent in a code block and writes them when the
+        block exits.
+
+        If :attr:`pacing` is set, the events are written one ``SYN_REPORT``
+        at a time with a delay in between, otherwise in as few ``write`` calls
+        as possible.
+
+        Nested calls are merged with the outermost one. If the block raises
+        an exception, the events collected so far are still written, but any
+        error when writing them is ignored in favour of the original
+        exception.
+        """
+        if self._pending is not None:
+            yield
+            return
+
+        self._pending = bytearray()
+        self._frames = []
+        try:
+            yield
+        except BaseException:
+            # pylint: disable=W0702; the original exception is reraised
+            try:
+                self._flush()
+            except:
+                pass
+            # pylint: enable=W0702
+            raise
+        else:
+            self._flush()
+
+    def _flush(self):
+        """Writes the events collected by :meth:`_batch` and ends the batch.
+        """
+        pending, frames = memoryview(self._pending), self._frames
+        self._pending = None
+        self._frames = None
+
+        if self.pacing:
+            start = 0
+            for end in frames:
+                self._write(pending[start:end])
+                start = end
+                time.sleep(self.pacing)
+            self._write(pending[start:])
+        else:
+            self._write(pending)
+
+    def _device(self):
+        """Creates the virtual keyboard device.
+
+        :return: a device
+        """
+        return evdev.UInput()
+
+    def _write(self, data):
+        """Writes a block of packed events to the device.
+
+        :param data: The packed events.
+        :type data: bytes or memoryview
+        """
+        while len(data):
+            data = data[os.write(self._dev.fd, data):]
+
     def _handle(self, key, is_press):
         # Resolve the key to a virtual key code and a possible set of required
         # modifiers
@@ -354,7 +597,7 @@ class Controller(_base.Controller):
                     pass
                 # pylint: enable E722
 
-            self._dev.syn()
+            self._syn()
 
     def _to_vk_and_modifiers(self, key):
         """Resolves a key to a virtual key code and a modifier set.
@@ -380,7 +623,21 @@ class Controller(_base.Controller):
 
         :param bool is_press: Whether this is a press event.
         """
-        self._dev.write(evdev.ecodes.EV_KEY, vk, int(is_press))
+        if self._pending is None:
+            self._dev.write(evdev.ecodes.EV_KEY, vk, int(is_press))
+        else:
+            self._pending += self._INPUT_EVENT.pack(
+                0, 0, evdev.ecodes.EV_KEY, vk, int(is_press))
+
+    def _syn(self):
+        """Sends a ``SYN_REPORT`` event.
+        """
+        if self._pending is None:
+            self._dev.syn()
+        else:
+            self._pending += self._INPUT_EVENT.pack(
+                0, 0, evdev.ecodes.EV_SYN, evdev.ecodes.SYN_REPORT, 0)
+            self._frames.append(len(self._pending))
 
 
 class Listener(ListenerMixin, _base.Listener):
@@ -402,6 +659,14 @@ class Listener(ListenerMixin, _base.Listener):
         self._layout = LAYOUT
         self._modifiers = set()
 
+    def _is_compatible(self, capabilities):
+        # Only devices with actual keys are keyboards; mice report buttons,
+        # which have codes from BTN_MISC and up
+        return any(
+            code < evdev.ecodes.BTN_MISC
+            for code in capabilities.get(evdev.ecodes.EV_KEY, []))
+
+    @AbstractListener._emitter
     def _handle_message(self, event):
         is_press = event.value in (KeyEvent.key_down, KeyEvent.key_hold)
         vk = event.code
@@ -418,12 +683,8 @@ class Listener(ListenerMixin, _base.Listener):
         try:
             key = self._layout.for_vk(vk, self._modifiers)
         except KeyError:
-            try:
-                key = next(
-                    key
-                    for key in Key
-                    if key.value.vk == vk)
-            except StopIteration:
+            key = _VK_KEYS.get(vk, None)
+            if key is None:
                 key = KeyCode.from_vk(vk)
 
         # We do not know whether these events are injected
@@ -0,0 +1,93 @@
+# coding=utf-8
+# pynput
+# Copyright (C) 2015-2024 Moses Palmér
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+The keyboard implementation for the *virtual* backend.
+
+Events are not sent to the system, but recorded in
+:data:`pynput._util.virtual.DESKTOP` and delivered to running listeners.
+"""
+
+# pylint: disable=C0111
+# The documentation is extracted from the base classes
+
+# pylint: disable=E1101,E1102
+# We dynamically generate the Key class
+
+# pylint: disable=R0903
+# We implement stubs
+
+import contextlib
+import enum
+
+from pynput._util import NotifierMixin
+from pynput._util.virtual import DESKTOP, ListenerMixin
+from . import _base
+
+
+KeyCode = _base.KeyCode
+
+
+#: The first virtual key code used for special keys; this is beyond the range
+#: of *Unicode* to not clash with any character
+_VK_BASE = 0x110000
+
+
+# pylint: disable=C0103
+Key = enum.Enum(
+    'Key',
+    module=__name__,
+    names=[
+        (name, KeyCode.from_vk(_VK_BASE + i))
+        for i, name in enumerate(_base.Key.__members__)])
+# pylint: enable=C0103
+
+
+class Controller(NotifierMixin, _base.Controller):
+    _KeyCode = KeyCode
+    _Key = Key
+
+    def __init__(self, *args, **kwargs):
+        super(Controller, self).__init__(*args, **kwargs)
+
+    @contextlib.contextmanager
+    def batch(self):
+        with self._emit_batch():
+            yield self
+
+    def type(self, string):
+        # Notify running listeners of all events at once
+        with self.batch():
+            super(Controller, self).type(string)
+
+    def _handle(self, key, is_press):
+        if key.vk is None and key.char is None:
+            raise self.InvalidKeyException(key)
+        DESKTOP.key(key, is_press, self._as_modifier(key))
+        self._emit(
+            '_on_fake_event', 'on_press' if is_press else 'on_release', key)
+
+
+@Controller._receiver
+class Listener(ListenerMixin, _base.Listener):
+    #: A mapping from virtual key codes to special keys
+    _SPECIAL_KEYS = {
+        key.value.vk: key
+        for key in Key}
+
+    def _translate(self, action, args):
+        key, = args
+        return (self._SPECIAL_KEYS.get(key.vk, key),)
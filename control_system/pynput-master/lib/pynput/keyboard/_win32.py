@@ -56,9 +56,7 @@ class KeyCode(_base.KeyCode):
         '_scan',
     )
 
-    # Be explicit about fields
-    _flags = None
-    _scan = None
+    __slots__ = _PLATFORM_EXTENSIONS
 
     def _parameters(self, is_press):
         """The parameters to pass to ``SendInput`` to generate this key.
@@ -360,7 +358,7 @@ class Listener(ListenerMixin, _base.Listener):
         if vk in self._SPECIAL_KEYS:
             return self._SPECIAL_KEYS[vk]
         else:
-            return KeyCode(**self._translate(
+            return KeyCode._intern(**self._translate(
                 vk,
                 msg in self._PRESS_MESSAGES))
 
@@ -31,6 +31,8 @@ except Exception as e:
     raise ImportError('failed to acquire X connection: {}'.format(str(e)), e)
 # pylint: enable=W0611
 
+import collections
+import contextlib
 import enum
 import threading
 
@@ -47,12 +49,15 @@ from pynput._util.xorg import (
     alt_mask,
     alt_gr_mask,
     char_to_keysym,
+    display_batch,
     display_manager,
     index_to_shift,
     keyboard_mapping,
+    keysym_to_chars,
     ListenerMixin,
     numlock_mask,
-    shift_to_index,
+    reset_masks,
+    string_to_keysym,
     symbol_to_keysym)
 from pynput._util.xorg_keysyms import (
     CHARS,
@@ -69,8 +74,7 @@ class KeyCode(_base.KeyCode):
         '_symbol',
     )
 
-    # Be explicit about fields
-    _symbol = None
+    __slots__ = _PLATFORM_EXTENSIONS
 
     @classmethod
     def _from_symbol(cls, symbol, **kwargs):
@@ -81,7 +85,7 @@ class KeyCode(_base.KeyCode):
         :return: a key code
         """
         # First try simple translation
-        keysym = Xlib.XK.string_to_keysym(symbol)
+        keysym = string_to_keysym(symbol)
         if keysym:
             return cls.from_vk(keysym, _symbol=symbol, **kwargs)
 
@@ -191,12 +195,32 @@ class Controller(NotifierMixin, _base.Controller):
     #: The shift mask for :attr:`Key.shift`
     SHIFT_MASK = Xlib.X.ShiftMask
 
+    #: The maximum number of key events sent by :meth:`type` before waiting for
+    #: the *X* server to process them
+    TYPE_BATCH_SIZE = 256
+
+    #: The events which may indicate that the focus window has changed
+    _FOCUS_EVENTS = (
+        Xlib.X.FocusIn,
+        Xlib.X.FocusOut,
+        Xlib.X.DestroyNotify,
+        Xlib.X.UnmapNotify)
+
+    #: The event mask used to receive :attr:`_FOCUS_EVENTS` for a window
+    _FOCUS_EVENT_MASK = Xlib.X.FocusChangeMask | Xlib.X.StructureNotifyMask
+
     def __init__(self, *args, **kwargs):
         super(Controller, self).__init__(*args, **kwargs)
         self._display = Xlib.display.Display()
         self._keyboard_mapping = None
-        self._borrows = {}
+        self._chars = None
+        self._mapping_changes = {}
+        self._mirror = None
+        self._borrows = collections.OrderedDict()
         self._borrow_lock = threading.RLock()
+        self._focus_window = None
+        self._focus_hits = 0
+        self._focus_misses = 0
 
         # pylint: disable=C0103; this is treated as a class scope constant, but
         # we cannot set it in the class scope, as it requires a Display instance
@@ -220,6 +244,49 @@ class Controller(NotifierMixin, _base.Controller):
             self._update_keyboard_mapping()
         return self._keyboard_mapping
 
+    @property
+    def _char_mapping(self):
+        """A mapping from characters to *key codes*.
+
+        Each value is the tuple ``(key_code, shift_state)``, and the keys are
+        all characters that can be typed using :attr:`keyboard_mapping`.
+        """
+        if not self._keyboard_mapping:
+            self._update_keyboard_mapping()
+        return self._chars
+
+    @property
+    def focus_cache_hits(self):
+        """The number of key events sent to a cached focus window.
+
+        Every hit is a round trip to the *X* server avoided.
+        """
+        return self._focus_hits
+
+    @property
+    def focus_cache_misses(self):
+        """The number of key events for which the focus window had to be
+        requested from the *X* server.
+        """
+        return self._focus_misses
+
+    @contextlib.contextmanager
+    def batch(self):
+        with display_batch(self._display), self._emit_batch():
+            yield self
+
+    def type(self, string):
+        # Resolve all characters before sending any events, since typing a
+        # character not present in the current layout requires a modification
+        # of the keyboard mapping, and then queue all events; the focus window
+        # is refreshed for every string; running listeners are notified of
+        # all events at once
+        self._prepare(string)
+        self._focus_invalidate()
+        with display_batch(self._display, self.TYPE_BATCH_SIZE), \
+                self._emit_batch():
+            super(Controller, self).type(string)
+
     def _handle(self, key, is_press):
         """Resolves a key identifier and sends a keyboard event.
 
@@ -228,42 +295,92 @@ class Controller(NotifierMixin, _base.Controller):
         """
         event = Xlib.display.event.KeyPress if is_press \
             else Xlib.display.event.KeyRelease
-        keysym = self._keysym(key)
-
-        # Make sure to verify that the key was resolved
-        if keysym is None:
-            raise self.InvalidKeyException(key)
-
-        # If the key has a virtual key code, use that immediately with
-        # fake_input; fake input,being an X server extension, has access to
-        # more internal state that we do
-        if key.vk is not None:
-            with display_manager(self._display) as dm:
+        self._process_events()
+
+        # Characters present in the current layout are resolved with a single
+        # lookup
+        mapped = self._char_mapping.get(key.char) \
+            if key.vk is None and not key.is_dead \
+            else None
+        if mapped is None:
+            keysym = self._keysym(key)
+
+            # Make sure to verify that the key was resolved
+            if keysym is None:
+                raise self.InvalidKeyException(key)
+
+        with display_manager(self._display, (key, is_press)) as dm:
+            if mapped is not None:
+                self._send_key(dm, event, *mapped)
+
+            # If the key has a virtual key code, use that immediately with
+            # fake_input; fake input,being an X server extension, has access
+            # to more internal state that we do
+            elif key.vk is not None:
                 Xlib.ext.xtest.fake_input(
                     dm,
                     Xlib.X.KeyPress if is_press else Xlib.X.KeyRelease,
                     dm.keysym_to_keycode(key.vk))
 
-        # Otherwise use XSendEvent; we need to use this in the general case to
-        # work around problems with keyboard layouts
-        else:
-            try:
-                keycode, shift_state = self.keyboard_mapping[keysym]
-                self._send_key(event, keycode, shift_state)
-
-            except KeyError:
-                with self._borrow_lock:
-                    keycode, index, count = self._borrows[keysym]
-                    self._send_key(
-                        event,
-                        keycode,
-                        index_to_shift(self._display, index))
-                    count += 1 if is_press else -1
-                    self._borrows[keysym] = (keycode, index, count)
+            # Otherwise use XSendEvent; we need to use this in the general case
+            # to work around problems with keyboard layouts
+            else:
+                try:
+                    keycode, shift_state = self.keyboard_mapping[keysym]
+                    self._send_key(dm, event, keycode, shift_state)
+
+                except KeyError:
+                    with self._borrow_lock:
+                        keycode, index, count = self._borrows[keysym]
+                        self._send_key(
+                            dm,
+                            event,
+                            keycode,
+                            index_to_shift(dm, index))
+                        count += 1 if is_press else -1
+                        self._borrows[keysym] = (keycode, index, count)
+                        self._borrows.move_to_end(keysym)
 
         # Notify any running listeners
         self._emit('_on_fake_event', key, is_press)
 
+    def _prepare(self, string):
+        """Borrows *key codes* for all characters in a string not present in
+        the current layout.
+
+        All modifications of the keyboard mapping are sent in a single
+        request. Characters that cannot be resolved are ignored; they are
+        reported when typed.
+
+        :param str string: The string about to be typed.
+        """
+        from . import _CONTROL_CODES
+        missing = {}
+        for character in set(string):
+            try:
+                key = self._resolve(_CONTROL_CODES.get(character, character))
+            except ValueError:
+                continue
+            if key is None or key.is_dead or key.vk is not None \
+                    or key.char in self._char_mapping:
+                continue
+            keysym = self._key_to_keysym(key)
+            if keysym is not None and keysym not in self.keyboard_mapping:
+                missing[keysym] = key
+
+        with self._borrow_lock:
+            keycodes = set()
+            for keysym, key in missing.items():
+                # Upper and lower case forms may be borrowed together
+                if self._resolve_borrowed(key) is not None:
+                    continue
+                keycode = self._borrow(key, keysym, missing)
+                if keycode is None:
+                    break
+                keycodes.add(keycode)
+            if keycodes:
+                self._borrow_commit(keycodes)
+
     def _keysym(self, key):
         """Converts a key to a *keysym*.
 
@@ -275,9 +392,14 @@ class Controller(NotifierMixin, _base.Controller):
             or self._resolve_borrowed(key) \
             or self._resolve_borrowing(key)
 
-    def _send_key(self, event, keycode, shift_state):
+    def _send_key(self, dm, event, keycode, shift_state):
         """Sends a single keyboard event.
 
+        This method must be called from within a :func:`display_manager`
+        block.
+
+        :param Xlib.display.Display dm: The managed *X* display.
+
         :param event: The *X* keyboard event.
 
         :param int keycode: The calculated keycode.
@@ -285,23 +407,106 @@ class Controller(NotifierMixin, _base.Controller):
         :param int shift_state: The shift state. The actual value used is
             :attr:`shift_state` or'd with this value.
         """
-        with display_manager(self._display) as dm, self.modifiers as modifiers:
-            # Under certain cimcumstances, such as when running under Xephyr,
-            # the value returned by dm.get_input_focus is an int
-            window = dm.get_input_focus().focus
+        with self.modifiers as modifiers:
+            window = self._focus(dm)
             send_event = getattr(
                 window,
                 'send_event',
-                lambda event: dm.send_event(window, event))
-            send_event(event(
-                detail=keycode,
-                state=shift_state | self._shift_mask(modifiers),
-                time=0,
-                root=dm.screen().root,
-                window=window,
-                same_screen=0,
-                child=Xlib.X.NONE,
-                root_x=0, root_y=0, event_x=0, event_y=0))
+                lambda event, onerror: dm.send_event(window, event))
+            send_event(
+                event(
+                    detail=keycode,
+                    state=shift_state | self._shift_mask(modifiers),
+                    time=0,
+                    root=dm.screen().root,
+                    window=window,
+                    same_screen=0,
+                    child=Xlib.X.NONE,
+                    root_x=0, root_y=0, event_x=0, event_y=0),
+                onerror=self._focus_error)
+
+    def _process_events(self):
+        """Processes all events received by the display of this controller.
+
+        We receive focus change events for the cached focus window, and
+        mapping notifications.
+        """
+        while self._display.pending_events():
+            event = self._display.next_event()
+            if event.type == Xlib.X.MappingNotify:
+                self._mapping_notify(event)
+            elif event.type in self._FOCUS_EVENTS:
+                self._focus_invalidate()
+
+    def _mapping_notify(self, event):
+        """Handles a mapping notification.
+
+        Notifications caused by the temporary modifications of the keyboard
+        mapping made by this controller are ignored, otherwise the keyboard
+        mapping is reloaded when next used.
+
+        :param event: The *X* ``MappingNotify`` event.
+        """
+        if event.request == Xlib.X.MappingKeyboard:
+            with self._borrow_lock:
+                change = (event.first_keycode, event.count)
+                changes = self._mapping_changes.get(change, 0)
+                if changes:
+                    self._mapping_changes[change] = changes - 1
+                    return
+                self._mirror = None
+            self._display.refresh_keyboard_mapping(event)
+            self._keyboard_mapping = None
+
+        elif event.request == Xlib.X.MappingModifier:
+            self._keyboard_mapping = None
+
+    def _focus(self, dm):
+        """Returns the window currently having input focus.
+
+        The focus window is cached, and the cache is invalidated when an event
+        indicating a focus change is received for the cached window. If the
+        focus window does not support receiving such events, it is not cached.
+
+        :param Xlib.display.Display dm: The managed *X* display.
+
+        :return: the focus window
+        """
+        window = self._focus_window
+        if window is not None:
+            self._focus_hits += 1
+            return window
+
+        # Under certain cimcumstances, such as when running under Xephyr, the
+        # value returned by dm.get_input_focus is an int
+        self._focus_misses += 1
+        window = dm.get_input_focus().focus
+        if hasattr(window, 'change_attributes'):
+            window.change_attributes(
+                onerror=self._focus_error,
+                event_mask=self._FOCUS_EVENT_MASK)
+            self._focus_window = window
+        return window
+
+    def _focus_invalidate(self):
+        """Invalidates the cached focus window.
+
+        The next key event will request the focus window from the *X* server.
+        """
+        window, self._focus_window = self._focus_window, None
+        if window is not None:
+            # Ignore errors, since the window may have been destroyed
+            window.change_attributes(
+                onerror=lambda *args: None,
+                event_mask=Xlib.X.NoEventMask)
+
+    def _focus_error(self, *args):
+        """The error handler for requests sent to the cached focus window.
+
+        An error causes the cache to be invalidated, so that the focus window
+        is requested from the *X* server for the next key event.
+        """
+        self._focus_window = None
 
     def _resolve_dead(self, key):
         """Tries to resolve a dead key.
@@ -362,6 +567,10 @@ class Controller(NotifierMixin, _base.Controller):
             return None
 
         with self._borrow_lock:
+            # If the keyboard mapping has been changed by someone else, we
+            # must verify that our borrowed keysyms remain
+            if self._mirror is None and self._borrows:
+                self._borrow_mapping()
             if keysym not in self._borrows:
                 return None
 
@@ -379,7 +588,55 @@ class Controller(NotifierMixin, _base.Controller):
         if keysym is None:
             return None
 
-        mapping = self._display.get_keyboard_mapping(8, 255 - 8)
+        with self._borrow_lock:
+            keycode = self._borrow(key, keysym, ())
+            if keycode is None:
+                return None
+            self._borrow_commit((keycode,))
+
+        return keysym
+
+    def _borrow_mapping(self):
+        """Returns the in-memory mirror of the keyboard mapping used when
+        borrowing *keysyms*.
+
+        The mirror is a list of *keysym* lists, where the first item corresponds to
+        *key code* ``8``. It is loaded from the *X* server when first used, and
+        then kept updated with our own modifications. It is reloaded if the
+        keyboard mapping is modified by someone else.
+
+        This method must be called with :attr:`_borrow_lock` held.
+        """
+        if self._mirror is None:
+            self._mirror = [
+                list(keysyms)
+                for keysyms in self._display.get_keyboard_mapping(8, 255 - 8)]
+
+            # Forget borrowed keysyms that have been overwritten
+            for keysym, (keycode, index, _) in list(self._borrows.items()):
+                if self._mirror[keycode - 8][index] != keysym:
+                    del self._borrows[keysym]
+
+        return self._mirror
+
+    def _borrow(self, key, keysym, protected):
+        """Temporarily adds a *keysym* to the in-memory keyboard mapping.
+
+        The modification must be sent to the *X* server using
+        :meth:`_borrow_commit`.
+
+        This method must be called with :attr:`_borrow_lock` held.
+
+        :param KeyCode key: The key being resolved.
+
+        :param int keysym: The *keysym* of the key.
+
+        :param protected: Borrowed *keysyms* that must not be overwritten.
+
+        :return: the *key code* modified, or ``None`` if no *key code* is
+            available
+        """
+        mapping = self._borrow_mapping()
 
         def i2kc(index):
             return index + 8
@@ -403,49 +660,74 @@ class Controller(NotifierMixin, _base.Controller):
                 if not any(keycodes):
                     return i2kc(i), 0
 
-        #: Finds a keycode and index by reusing an old, unused one
+        #: Finds a keycode and index by reusing the least recently used one
+        #: that is not currently pressed
         def overwrite():
             for keysym, (keycode, index, count) in self._borrows.items():
-                if count < 1:
+                if count < 1 and keysym not in protected:
                     del self._borrows[keysym]
                     return keycode, index
 
-        #: Registers a keycode for a specific key and modifier state
-        def register(dm, keycode, index):
-            i = kc2i(keycode)
-
-            # Check for use of empty mapping with a character that has upper
-            # and lower forms
-            lower = key.char.lower()
-            upper = key.char.upper()
-            if lower != upper and len(lower) == 1 and len(upper) == 1 and all(
-                    m == Xlib.XK.NoSymbol
-                    for m in mapping[i]):
-                lower = self._key_to_keysym(KeyCode.from_char(lower))
-                upper = self._key_to_keysym(KeyCode.from_char(upper))
-                if lower:
-                    mapping[i][0] = lower
-                    self._borrows[lower] = (keycode, 0, 0)
-                if upper:
-                    mapping[i][1] = upper
-                    self._borrows[upper] = (keycode, 1, 0)
+        # First try an already used keycode, then try a new one, and fall back
+        # on reusing one that is not currently pressed
+        slot = reuse() or borrow() or overwrite()
+        if slot is None:
+            return None
+        keycode, index = slot
+        i = kc2i(keycode)
+
+        # Check for use of empty mapping with a character that has upper and
+        # lower forms
+        lower = key.char.lower()
+        upper = key.char.upper()
+        if lower != upper and len(lower) == 1 and len(upper) == 1 and all(
+                m == Xlib.XK.NoSymbol
+                for m in mapping[i]):
+            lower = self._key_to_keysym(KeyCode.from_char(lower))
+            upper = self._key_to_keysym(KeyCode.from_char(upper))
+            if lower:
+                mapping[i][0] = lower
+                self._borrows[lower] = (keycode, 0, 0)
+            if upper:
+                mapping[i][1] = upper
+                self._borrows[upper] = (keycode, 1, 0)
+        else:
+            mapping[i][index] = keysym
+            self._borrows[keysym] = (keycode, index, 0)
+
+        return keycode
+
+    def _borrow_commit(self, keycodes):
+        """Sends modifications of the in-memory keyboard mapping to the *X*
+        server.
+
+        Every run of consecutive modified *key codes* is sent in a single
+        request, so that *key codes* not modified by us are never overwritten
+        with a possibly stale mirror.
+
+        This method must be called with :attr:`_borrow_lock` held.
+
+        :param keycodes: The modified *key codes*.
+
+        :raises X11Error: if the keyboard mapping cannot be modified
+        """
+        runs = []
+        for keycode in sorted(set(keycodes)):
+            if runs and runs[-1][0] + runs[-1][1] == keycode:
+                runs[-1][1] += 1
             else:
-                mapping[i][index] = keysym
-                self._borrows[keysym] = (keycode, index, 0)
-            dm.change_keyboard_mapping(keycode, mapping[i:i + 1])
+                runs.append([keycode, 1])
 
-        try:
-            with display_manager(self._display) as dm, self._borrow_lock as _:
-                # First try an already used keycode, then try a new one, and
-                # fall back on reusing one that is not currently pressed
-                register(dm, *(
-                    reuse() or
-                    borrow() or
-                    overwrite()))
-            return keysym
+        with display_manager(self._display) as dm:
+            for first, count in runs:
+                dm.change_keyboard_mapping(
+                    first,
+                    self._mirror[first - 8:first - 8 + count])
 
-        except TypeError:
-            return None
+        # Make sure to ignore the notifications sent for these changes
+        for first, count in runs:
+            self._mapping_changes[(first, count)] = \
+                self._mapping_changes.get((first, count), 0) + 1
 
     def _key_to_keysym(self, key):
         """Converts a character key code to a *keysym*.
@@ -500,7 +782,28 @@ class Controller(NotifierMixin, _base.Controller):
         """Updates the keyboard mapping.
         """
         with display_manager(self._display) as dm:
-            self._keyboard_mapping = keyboard_mapping(dm)
+            mapping = keyboard_mapping(dm)
+
+        # Ignore key codes temporarily borrowed by us
+        with self._borrow_lock:
+            borrowed = set(
+                keycode
+                for keycode, _, _ in self._borrows.values())
+        mapping = {
+            keysym: value
+            for keysym, value in mapping.items()
+            if value[0] not in borrowed}
+
+        chars = {}
+        for keysym, value in mapping.items():
+            for char in keysym_to_chars(keysym):
+                # Only add characters that would actually resolve to this
+                # keysym
+                if self._key_to_keysym(KeyCode.from_char(char)) == keysym:
+                    chars[char] = value
+
+        self._chars = chars
+        self._keyboard_mapping = mapping
 
 
 @Controller._receiver
@@ -509,6 +812,18 @@ class Listener(ListenerMixin, _base.Listener):
         Xlib.X.KeyPress,
         Xlib.X.KeyRelease)
 
+    # We must know when the keyboard mapping changes
+    _DELIVERED_EVENTS = (
+        Xlib.X.MappingNotify,
+        Xlib.X.MappingNotify)
+
+    #: The number of key codes
+    _KEYCODES = 256
+
+    #: The number of entries for every key code in the key table; these are
+    #: indexed by shift state index and whether *num lock* is active
+    _KEYS_PER_KEYCODE = 8
+
     #: A mapping from keysym to special key
     _SPECIAL_KEYS = {
         key.value.vk: key
@@ -552,21 +867,38 @@ class Listener(ListenerMixin, _base.Listener):
 
     def __init__(self, *args, **kwargs):
         super(Listener, self).__init__(*args, **kwargs)
-        self._keyboard_mapping = None
+
+        #: The keys for all key codes and modifier states; see
+        #: :meth:`_event_to_key`
+        self._keys = [None] * (self._KEYCODES * self._KEYS_PER_KEYCODE)
+
+        #: The modifier masks used when indexing :attr:`_keys`
+        self._alt_gr_mask = 0
+        self._numlock_mask = 0
+
+        #: The mapping notifications received since :attr:`_keys` was
+        #: updated, keyed by the range of key codes
+        self._mapping_events = {}
 
     def _run(self):
         with self._receive():
             super(Listener, self)._run()
 
     def _initialize(self, display):
-        # Get the keyboard mapping to be able to translate event details to
-        # key codes
-        min_keycode = display.display.info.min_keycode
-        keycode_count = display.display.info.max_keycode - min_keycode + 1
-        self._keyboard_mapping = display.get_keyboard_mapping(
-            min_keycode, keycode_count)
+        # Translate all key codes up front, so that events are translated
+        # with a single lookup
+        self._update_keys(display, 0, self._KEYCODES)
 
     def _handle_message(self, display, event, injected):
+        if event.type == Xlib.X.MappingNotify:
+            # Every client receives a notification, so we will see the same
+            # change several times; we update the keys once when next used
+            if event.request in (
+                    Xlib.X.MappingKeyboard, Xlib.X.MappingModifier):
+                self._mapping_events[
+                    (event.request, event.first_keycode, event.count)] = event
+            return
+
         # Convert the event to a KeyCode; this may fail, and in that case we
         # pass None
         try:
@@ -588,6 +920,12 @@ class Listener(ListenerMixin, _base.Listener):
     def _suppress_stop(self, display):
         display.ungrab_keyboard(Xlib.X.CurrentTime)
 
+    def _event_types(self):
+        from pynput.keyboard import Events
+        return {
+            'on_press': Events.Press,
+            'on_release': Events.Release}
+
     def _on_fake_event(self, key, is_press):
         """The handler for fake press events sent by the controllers.
 
@@ -595,7 +933,8 @@ class Listener(ListenerMixin, _base.Listener):
 
         :param bool is_press: Whether this is a press event.
         """
-        (self.on_press if is_press else self.on_release)(
+        self._deliver(
+            self.on_press if is_press else self.on_release,
             self._SPECIAL_KEYS.get(key.vk, key), True)
 
     def _keycode_to_keysym(self, display, keycode, index):
@@ -630,13 +969,84 @@ class Listener(ListenerMixin, _base.Listener):
 
         :param event: The event to convert.
 
-        :return: a :class:`pynput.keyboard.KeyCode`
+        :return: a :class:`pynput.keyboard.KeyCode`, or ``None`` if the key
+            code could not be translated
 
         :raises IndexError: if the key code is invalid
         """
-        keycode = event.detail
-        index = shift_to_index(display, event.state)
+        if self._mapping_events:
+            self._apply_mapping_events(display)
+
+        state = event.state
+        return self._keys[
+            event.detail * self._KEYS_PER_KEYCODE
+            + (4 if state & self._numlock_mask else 0)
+            + (2 if state & self._alt_gr_mask else 0)
+            + (state & 1)]
+
+    def _apply_mapping_events(self, display):
+        """Updates the keyboard mapping of a display and :attr:`_keys` for all
+        mapping notifications received.
+
+        :param display: The current *X* display.
+        """
+        events, self._mapping_events = self._mapping_events, {}
+
+        # The masks depend both on the modifier mapping and on the key codes
+        # of the modifier keys, so any change may invalidate them
+        reset_masks(display)
+
+        first, last = self._KEYCODES, 0
+        for event in events.values():
+            if event.request == Xlib.X.MappingModifier:
+                first, last = 0, self._KEYCODES
+            else:
+                display.refresh_keyboard_mapping(event)
+                first = min(first, event.first_keycode)
+                last = max(last, event.first_keycode + event.count)
+        if first < last:
+            self._update_keys(display, first, last - first)
+
+    def _update_keys(self, display, first, count):
+        """Translates a range of key codes for all modifier states and stores
+        the keys in :attr:`_keys`.
+
+        :param display: The current *X* display.
+
+        :param int first: The first key code to translate.
+
+        :param int count: The number of key codes to translate.
+        """
+        def translate(keycode, index, numlock):
+            try:
+                return self._keycode_to_key(display, keycode, index, numlock)
+            except IndexError:
+                return None
+
+        self._alt_gr_mask = alt_gr_mask(display)
+        self._numlock_mask = numlock_mask(display)
+        size = self._KEYS_PER_KEYCODE
+        self._keys[first * size:(first + count) * size] = [
+            translate(keycode, index, numlock)
+            for keycode in range(first, first + count)
+            for numlock in (False, True)
+            for index in range(4)]
+
+    def _keycode_to_key(self, display, keycode, index, numlock):
+        """Converts a key code and modifier state to a :class:`KeyCode`.
+
+        :param display: The current *X* display.
 
+        :param int keycode: The key code.
+
+        :param int index: The shift state index.
+
+        :param bool numlock: Whether *num lock* is active.
+
+        :return: a :class:`pynput.keyboard.KeyCode`
+
+        :raises IndexError: if the key code is invalid
+        """
         # First try special keys...
         keysym = self._keycode_to_keysym(display, keycode, index)
         if keysym in self._SPECIAL_KEYS:
@@ -649,7 +1059,7 @@ class Listener(ListenerMixin, _base.Listener):
                     self._keycode_to_keysym(
                         display,
                         keycode,
-                        bool(event.state & numlock_mask(display)))]
+                        int(numlock))]
             except KeyError:
                 # Since we recalculated the key, this may happen
                 pass
@@ -23,7 +23,9 @@ See the documentation for more information.
 # pylint: disable=C0103
 # Button, Controller and Listener are not constants
 
-from pynput._util import backend, Events
+import sys
+
+from pynput._util import backend, Events, RingBuffer
 
 
 backend = backend(__name__)
@@ -46,13 +48,24 @@ class Events(Events):
 
     :class:`Events.Scroll`
         The device was scrolled.
+
+    :param maxsize: The maximum number of events held until read, or ``None``
+        to not limit the number of events.
+    :type maxsize: int or None
+
+    :param str overflow: What to do when an event arrives and ``maxsize``
+        events are already held; see :class:`pynput._util.RingBuffer`.
+
+    :param coalesce: The minimum number of seconds between move events; see
+        :class:`Listener`.
+    :type coalesce: float or None
     """
     _Listener = Listener
 
     class Move(Events.Event):
         """A move event.
         """
-        def __init__(self, x, y, injected):
+        def __init__(self, x, y, injected, distance=None, velocity=None):
             #: The X screen coordinate.
             self.x = x
 
@@ -62,6 +75,14 @@ class Events(Events):
             #: Whether this event is synthetic.
             self.injected = injected
 
+            #: The distance travelled since the previous move event, or
+            #: ``None`` if move events are not coalesced.
+            self.distance = distance
+
+            #: The velocity since the previous move event, or ``None`` if
+            #: move events are not coalesced.
+            self.velocity = velocity
+
     class Click(Events.Event):
         """A click event.
         """
@@ -100,8 +121,69 @@ class Events(Events):
             #: Whether this event is synthetic.
             self.injected = injected
 
-    def __init__(self):
+    def __init__(self, maxsize=None, overflow=RingBuffer.DROP_NEWEST,
+                 coalesce=None):
         super(Events, self).__init__(
+            maxsize=maxsize,
+            overflow=overflow,
+            coalesce=coalesce,
             on_move=self.Move,
             on_click=self.Click,
             on_scroll=self.Scroll)
+
+
+# The asyncio support uses syntax and functions not available in older
+# versions of Python
+if sys.version_info >= (3, 7):
+    from pynput._util.asynchronous import AsyncController, AsyncEvents
+
+    class AsyncEvents(AsyncEvents):
+        """A mouse event listener supporting asynchronous iteration over the
+        events.
+
+        This class must be used as an asynchronous context manager::
+
+            async with AsyncEvents() as events:
+                async for event in events:
+                    ...
+
+        The events are the same as for :class:`Events`. This class requires
+        *Python 3.7* or later.
+
+        :param maxsize: The maximum number of events held until read, or
+            ``None`` to not limit the number of events.
+        :type maxsize: int or None
+
+        :param str overflow: What to do when an event arrives and ``maxsize``
+            events are already held; see :class:`pynput._util.RingBuffer`. By
+            default the listener is blocked until events are read.
+        """
+        _Listener = Listener
+
+        Move = Events.Move
+        Click = Events.Click
+        Scroll = Events.Scroll
+
+        def __init__(self, maxsize=None, overflow=RingBuffer.BLOCK):
+            super(AsyncEvents, self).__init__(
+                maxsize=maxsize,
+                overflow=overflow,
+                on_move=self.Move,
+                on_click=self.Click,
+                on_scroll=self.Scroll)
+
+    class AsyncController(AsyncController):
+        """A mouse controller for use with :mod:`asyncio`.
+
+        All methods of :class:`Controller` are available as coroutines, and
+        are performed in order from a dedicated thread. This class requires
+        *Python 3.7* or later::
+
+            async with AsyncController() as controller:
+                await controller.click(Button.left)
+                position = await controller.run(lambda c: c.position)
+
+        :param Controller controller: The controller to use. If this is not
+            passed, a new controller is created.
+        """
+        _Controller = Controller
@@ -24,7 +24,14 @@ is located in a platform dependent module.
 # pylint: disable=R0903
 # We implement stubs
 
+import bisect
+import collections
+import contextlib
 import enum
+import math
+import numbers
+import threading
+import time
 
 from pynput._util import AbstractListener, prefix
 from pynput import _logger
@@ -50,9 +57,31 @@ class Button(enum.Enum):
     right = 3
 
 
+#: The result of :meth:`Controller.move_along`.
+#:
+#: ``points`` is the number of points in the planned trajectory, ``sent`` the
+#: number of positions actually sent and ``skipped`` the number of points
+#: skipped because their deadline had passed. ``elapsed`` is the number of
+#: seconds taken, ``error`` the distance, in pixels, between the final pointer
+#: position and the end of the trajectory, ``lateness`` the largest number of
+#: seconds a position was sent after its deadline and ``jitter`` the standard
+#: deviation of these delays.
+Motion = collections.namedtuple(
+    'Motion',
+    ('points', 'sent', 'skipped', 'elapsed', 'error', 'lateness', 'jitter'))
+
+
 class Controller(object):
     """A controller for sending virtual mouse events to the system.
     """
+    #: The velocity profiles supported by :meth:`move_along`; these map the
+    #: fraction of the duration elapsed to the fraction of the path travelled
+    PROFILES = {
+        'linear': lambda t: t,
+        'ease': lambda t: 0.5 - 0.5 * math.cos(math.pi * t),
+        'min_jerk': lambda t: t * t * t * (10.0 + t * (6.0 * t - 15.0)),
+        'bezier': lambda t: t}
+
     def __init__(self):
         self._log = _logger(self.__class__)
 
@@ -68,7 +97,7 @@ class Controller(object):
     def position(self, pos):
         self._position_set(pos)
 
-    def scroll(self, dx, dy):
+    def scroll(self, dx, dy, duration=None):
         """Sends scroll events.
 
         :param int dx: The horizontal scroll. The units of scrolling is
@@ -77,10 +106,42 @@ class Controller(object):
         :param int dy: The vertical scroll. The units of scrolling is
             undefined.
 
+        :param duration: The number of seconds over which to distribute the
+            scroll. If this is specified, the scroll is sent one unit at a
+            time at regular intervals; units falling due while this method is
+            sending are sent together, so that the scroll does not take
+            longer than requested. If this is not specified, the scroll is
+            sent at once.
+        :type duration: float or None
+
         :raises ValueError: if the values are invalid, for example out of
             bounds
         """
-        self._scroll(dx, dy)
+        steps = max(abs(int(dx)), abs(int(dy)))
+        if not duration or steps < 2:
+            self._scroll(dx, dy)
+            return
+
+        interval = float(duration) / steps
+        start = time.monotonic()
+        sent_x, sent_y = 0, 0
+        due = 0
+        while due < steps:
+            # Send all units due at this time
+            due = min(
+                steps,
+                int((time.monotonic() - start) / interval) + 1)
+            x = int(round(float(dx) * due / steps))
+            y = int(round(float(dy) * due / steps))
+            if x != sent_x or y != sent_y:
+                self._scroll(x - sent_x, y - sent_y)
+                sent_x, sent_y = x, y
+
+            # Wait until the next unit is due
+            if due < steps:
+                delay = start + due * interval - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
 
     def press(self, button):
         """Emits a button press event at the current position.
@@ -109,6 +170,100 @@ class Controller(object):
         """
         self.position = tuple(sum(i) for i in zip(self.position, (dx, dy)))
 
+    def move_along(self, path, duration, rate_hz=100, profile='linear'):
+        """Moves the mouse pointer smoothly along a path.
+
+        The entire trajectory is calculated before the pointer is moved. Every
+        point has a deadline, measured from the start of the motion using a
+        monotonic clock; if a deadline has passed when the point is due, the
+        point is skipped in favour of the latest point due, so that the motion
+        does not take longer than requested.
+
+        :param path: Either the target position ``(x, y)``, or a sequence of
+            positions through which to move. The path starts at the current
+            pointer position.
+
+        :param float duration: The number of seconds the motion should take.
+
+        :param float rate_hz: The number of positions to send per second.
+
+        :param str profile: The velocity profile. This is one of
+            ``'linear'``, for constant velocity, ``'ease'``, for a motion
+            accelerating and decelerating smoothly, ``'min_jerk'``, for the
+            minimum jerk profile of human arm movements, and ``'bezier'``, in
+            which case the positions in ``path`` are used as the control points
+            of a Bézier curve rather than as corners of a polyline.
+
+        :return: a description of the achieved motion
+        :rtype: Motion
+
+        :raises ValueError: if ``profile`` is unknown, or the path or duration
+            is invalid
+        """
+        if profile not in self.PROFILES:
+            raise ValueError(profile)
+        if duration < 0 or rate_hz <= 0:
+            raise ValueError((duration, rate_hz))
+
+        count = max(1, int(round(duration * rate_hz)))
+        points = _trajectory(
+            self.position, path, count, profile, self.PROFILES[profile])
+        interval = float(duration) / count
+        delays = []
+        sent = 0
+        last = None
+
+        start = time.monotonic()
+        done = 0
+        while done < count:
+            now = time.monotonic()
+            due = min(count, int((now - start) / interval)) if interval \
+                else count
+            if due <= done:
+                time.sleep(max(0.0, start + (done + 1) * interval - now))
+                continue
+
+            # Send only the latest point due
+            point = points[due - 1]
+            delays.append(now - (start + due * interval))
+            if point != last:
+                self.position = point
+                last = point
+                sent += 1
+            done = due
+        elapsed = time.monotonic() - start
+
+        target = points[-1]
+        position = self.position
+        mean = sum(delays) / len(delays)
+        return Motion(
+            points=count,
+            sent=sent,
+            skipped=count - len(delays),
+            elapsed=elapsed,
+            error=math.hypot(
+                position[0] - target[0], position[1] - target[1]),
+            lateness=max(delays),
+            jitter=math.sqrt(
+                sum((delay - mean) ** 2 for delay in delays) / len(delays)))
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Executes a block with all events sent together.
+
+        On some platforms, every event sent requires waiting for the system to
+        process it. Within this block, events are instead queued, and the
+        controller waits only once, when the block exits. Errors caused by
+        events sent in the block may therefore not be raised until then.
+
+        Nested blocks are merged with the outermost one.
+
+        The default implementation sends events immediately.
+
+        :return: this controller
+        """
+        yield self
+
     def click(self, button, count=1):
         """Emits a button click event at the current position.
 
@@ -239,9 +394,26 @@ class Listener(AbstractListener):
         will prevent the input events from being passed to the rest of the
         system.
 
+    :param coalesce: The minimum number of seconds between calls to
+        ``on_move``, or ``None`` to pass every move event. Pass for example
+        ``1.0 / 60`` to receive at most one move event per frame.
+
+        When this is set, move events arriving too soon after the previous
+        call are held back, and only the latest position is passed. A held
+        back move event is always passed before any following click or scroll
+        event, and otherwise when the interval has passed; in that case,
+        ``on_move`` is called from a separate thread.
+
+        ``on_move`` may then also accept the arguments ``(x, y, injected,
+        distance, velocity)``, where ``distance`` is the length of the path
+        travelled by the pointer since the previous call, and ``velocity``
+        the distance divided by the number of seconds since the previous
+        call.
+    :type coalesce: float or None
+
     :param kwargs: Any non-standard platform dependent options. These should be
-        prefixed with the platform name thus: ``darwin_``, ``xorg_`` or
-        ``win32_``.
+        prefixed with the platform name thus: ``darwin_``, ``uinput_``,
+        ``xorg_`` or ``win32_``.
 
         Supported values are:
 
@@ -254,6 +426,23 @@ class Listener(AbstractListener):
             ``Quartz.CGEventSetIntegerValueField``. If this callable does not
             return the event, the event is suppressed system wide.
 
+        ``uinput_device_paths``
+            A list of device paths.
+
+            If this is specified, *pynput* will limit the number of devices
+            checked for the capabilities needed to those passed, otherwise all
+            system devices will be used, and devices added while the listener
+            is running will be picked up. Events are read from all pointing
+            devices.
+
+        ``uinput_screen_size``
+            The size of the screen, as the tuple ``(width, height)``.
+
+            This is used to limit the tracked pointer position, and to scale
+            the coordinates of absolute pointing devices. If this is not
+            specified, ``$PYNPUT_UINPUT_SCREEN_SIZE`` or the size of the
+            framebuffer console is used.
+
         ``win32_event_filter``
             A callable taking the arguments ``(msg, data)``, where ``msg`` is
             the current message, and ``data`` associated data as a
@@ -264,9 +453,33 @@ class Listener(AbstractListener):
 
             If ``self.suppress_event()`` is called, the event is suppressed
             system wide.
+
+        ``xorg_buffer_size``
+            The maximum number of events waiting for delivery.
+
+            If this is specified, events are delivered from a separate thread,
+            so that slow callbacks do not stall the *X* server. The number of
+            events discarded and delayed are available as
+            ``self.events_dropped`` and ``self.events_lagging``.
+
+        ``xorg_overflow``
+            What to do when an event arrives while ``xorg_buffer_size`` events
+            are waiting for delivery: ``'drop-oldest'`` discards the oldest
+            waiting event, ``'drop-newest'`` discards the new event and
+            ``'block'``, the default, waits until there is room.
+
+        ``xorg_on_events``
+            A callable taking the argument ``(events)``, where ``events`` is a
+            list of event objects, such as :class:`pynput.mouse.Events.Move`,
+            delivered together.
+
+            It is called once for every batch of events read from the buffer,
+            after the other callbacks. Passing this enables a buffer as if
+            ``xorg_buffer_size`` was passed. If this callback returns
+            ``False``, the listener is stopped.
     """
     def __init__(self, on_move=None, on_click=None, on_scroll=None,
-                 suppress=False, **kwargs):
+                 suppress=False, coalesce=None, **kwargs):
         self._log = _logger(self.__class__)
         option_prefix = prefix(Listener, self.__class__)
         self._options = {
@@ -274,8 +487,212 @@ class Listener(AbstractListener):
             for key, value in kwargs.items()
             if key.startswith(option_prefix)}
         super(Listener, self).__init__(
-            on_move=self._wrap(on_move, 3),
+            on_move=self._wrap(on_move, 3 if coalesce is None else 5),
             on_click=self._wrap(on_click, 5),
             on_scroll=self._wrap(on_scroll, 5),
             suppress=suppress)
+
+        if coalesce is not None:
+            self._coalescer = _MoveCoalescer(self, coalesce, self.on_move)
+            self.on_move = self._coalescer.move
+            self.on_click = self._coalescer.wrap(self.on_click)
+            self.on_scroll = self._coalescer.wrap(self.on_scroll)
+        else:
+            self._coalescer = None
+
+    def stop(self):
+        super(Listener, self).stop()
+        if self._coalescer is not None:
+            self._coalescer.close()
+
+    @AbstractListener._emitter
+    def _flush_moves(self):
+        """Passes any held back move event to ``on_move``.
+
+        This is called from the thread of the move event coalescer.
+        """
+        self._coalescer.flush()
 # pylint: enable=W0223
+
+
+def _trajectory(origin, path, count, profile, f):
+    """Calculates the points of a trajectory.
+
+    :param tuple origin: The start position.
+
+    :param path: The target position, or a sequence of positions.
+
+    :param int count: The number of points to calculate.
+
+    :param str profile: The name of the velocity profile.
+
+    :param callable f: The velocity profile.
+
+    :return: a list of ``count`` integer positions, the last of which is the
+        end of the path
+
+    :raises ValueError: if the path is empty
+    """
+    if len(path) == 2 and all(isinstance(v, numbers.Real) for v in path):
+        path = [path]
+    vertices = [tuple(float(v) for v in origin)] + [
+        (float(x), float(y))
+        for x, y in path]
+    if len(vertices) < 2:
+        raise ValueError(path)
+    progress = [f(float(i) / count) for i in range(1, count + 1)]
+
+    if profile == 'bezier':
+        # Evaluate the curve using de Casteljau's algorithm
+        def point(t):
+            ps = vertices
+            while len(ps) > 1:
+                ps = [
+                    (a[0] + (b[0] - a[0]) * t, a[1] + (b[1] - a[1]) * t)
+                    for a, b in zip(ps, ps[1:])]
+            return ps[0]
+        points = [point(t) for t in progress]
+
+    else:
+        # Locate every point by its distance along the polyline
+        lengths = [0.0]
+        for a, b in zip(vertices, vertices[1:]):
+            lengths.append(lengths[-1] + math.hypot(b[0] - a[0], b[1] - a[1]))
+        total = lengths[-1]
+        points = []
+        for t in progress:
+            distance = t * total
+            i = min(
+                max(bisect.bisect_right(lengths, distance) - 1, 0),
+                len(vertices) - 2)
+            segment = lengths[i + 1] - lengths[i]
+            u = (distance - lengths[i]) / segment if segment else 1.0
+            a, b = vertices[i], vertices[i + 1]
+            points.append((a[0] + (b[0] - a[0]) * u, a[1] + (b[1] - a[1]) * u))
+
+    return [(int(round(x)), int(round(y))) for x, y in points]
+
+
+class _MoveCoalescer(object):
+    """Coalesces mouse move events for a listener.
+
+    :param Listener listener: The listener.
+
+    :param float interval: The minimum number of seconds between calls to
+        ``on_move``.
+
+    :param callable on_move: The callback. This is called with the arguments
+        ``(x, y, injected, distance, velocity)``.
+    """
+    def __init__(self, listener, interval, on_move):
+        self._listener = listener
+        self._interval = interval
+        self._on_move = on_move
+        self._condition = threading.Condition()
+        self._thread = None
+
+        #: A lock held while calling callbacks, so that events are passed in
+        #: order without holding ``_condition`` while user code runs
+        self._delivery = threading.RLock()
+        self._closed = False
+
+        #: The held back event as the tuple ``(x, y, injected)``, or ``None``
+        self._pending = None
+
+        #: The last position received
+        self._position = None
+
+        #: The distance travelled since the last call
+        self._distance = 0.0
+
+        #: The time of the last call
+        self._time = None
+
+    def move(self, x, y, injected):
+        """Receives a move event from the listener.
+
+        :param int x: The X screen coordinate.
+
+        :param int y: The Y screen coordinate.
+
+        :param bool injected: Whether the event was injected.
+        """
+        with self._condition:
+            if self._position is not None:
+                self._distance += math.hypot(
+                    x - self._position[0], y - self._position[1])
+            self._position = (x, y)
+            self._pending = (x, y, injected)
+
+            due = self._time is None \
+                or time.monotonic() - self._time >= self._interval
+            if not due and self._thread is None:
+                self._thread = threading.Thread(target=self._run)
+                self._thread.daemon = True
+                self._thread.start()
+            elif not due:
+                self._condition.notify()
+
+        if due:
+            self.flush()
+
+    def wrap(self, f):
+        """Wraps a callback for other events to pass any held back move event
+        first.
+
+        :param callable f: The callback to wrap.
+
+        :return: a callback
+        """
+        def inner(*args):
+            with self._delivery:
+                self.flush()
+                return f(*args)
+
+        return inner
+
+    def flush(self):
+        """Passes any held back move event to the callback.
+        """
+        with self._delivery:
+            with self._condition:
+                if self._pending is None:
+                    return
+                x, y, injected = self._pending
+                now = time.monotonic()
+                elapsed = now - self._time if self._time is not None else 0.0
+                distance = self._distance
+                self._pending = None
+                self._distance = 0.0
+                self._time = now
+            self._on_move(
+                x, y, injected,
+                distance, distance / elapsed if elapsed > 0 else 0.0)
+
+    def close(self):
+        """Stops the thread passing held back events.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+    def _run(self):
+        """Passes held back events once the interval has passed.
+        """
+        # pylint: disable=W0702; exceptions have been passed to the main thread
+        try:
+            while True:
+                with self._condition:
+                    if self._closed:
+                        break
+                    if self._pending is None:
+                        self._condition.wait()
+                        continue
+                    remaining = self._time + self._interval - time.monotonic()
+                    if remaining > 0:
+                        self._condition.wait(remaining)
+                        continue
+                self._listener._flush_moves()
+        except:
+            pass
+        # pylint: enable=W0702
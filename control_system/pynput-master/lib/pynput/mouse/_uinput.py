@@ -0,0 +1,447 @@
+# coding=utf-8
+# pynput
+# Copyright (C) 2015-2024 Moses Palmér
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+The mouse implementation for *uinput*.
+"""
+
+# pylint: disable=C0111
+# The documentation is extracted from the base classes
+
+# pylint: disable=E1101,E1102
+# We dynamically generate the Button class
+
+# pylint: disable=R0903
+# We implement stubs
+
+import contextlib
+import enum
+import os
+import struct
+
+import evdev
+
+from pynput._util import AbstractListener
+from pynput._util.uinput import ListenerMixin
+from pynput._util.uinput import screen_size as _screen_size
+from . import _base
+
+
+# pylint: disable=C0103
+Button = enum.Enum(
+    'Button',
+    module=__name__,
+    names=[
+        ('unknown', None),
+        ('left', evdev.ecodes.BTN_LEFT),
+        ('middle', evdev.ecodes.BTN_MIDDLE),
+        ('right', evdev.ecodes.BTN_RIGHT),
+        ('button8', evdev.ecodes.BTN_SIDE),
+        ('button9', evdev.ecodes.BTN_EXTRA),
+        ('button10', evdev.ecodes.BTN_FORWARD),
+        ('button11', evdev.ecodes.BTN_BACK),
+        ('button12', evdev.ecodes.BTN_TASK)])
+# pylint: enable=C0103
+
+
+class Controller(_base.Controller):
+    """A controller for sending virtual mouse events to the system.
+
+    Two virtual devices are created: a relative mouse, used by :meth:`move`,
+    and an absolute tablet, used when setting :attr:`position`. The tablet
+    covers the screen, so its coordinates are pixels.
+
+    Since *uinput* cannot query the pointer, :attr:`position` is the position
+    tracked by this controller. It is exact after :attr:`position` has been
+    set, but relative motion is subject to pointer acceleration, and the
+    pointer may be moved by other devices.
+
+    Within a :meth:`batch` block, all events are collected and written to the
+    devices when the block exits, even if it raises an exception.
+
+    :param tuple screen_size: The size of the screen, as the tuple
+        ``(width, height)``. If not specified, :func:`screen_size` is used.
+    """
+    #: The binary layout of ``struct input_event``; see
+    #: :attr:`pynput.keyboard._uinput.Controller._INPUT_EVENT`
+    _INPUT_EVENT = struct.Struct('@llHHi')
+
+    #: A packed ``SYN_REPORT`` event
+    _SYN_REPORT = _INPUT_EVENT.pack(
+        0, 0, evdev.ecodes.EV_SYN, evdev.ecodes.SYN_REPORT, 0)
+
+    #: The wheel axes, present on both devices
+    _WHEEL = [
+        evdev.ecodes.REL_WHEEL,
+        evdev.ecodes.REL_HWHEEL]
+
+    def __init__(self, screen_size=None):
+        super(Controller, self).__init__()
+        self._width, self._height = screen_size or _screen_size()
+        buttons = [
+            button.value
+            for button in Button
+            if button.value is not None]
+
+        self._mouse = self._device(
+            events={
+                evdev.ecodes.EV_KEY: buttons,
+                evdev.ecodes.EV_REL: [
+                    evdev.ecodes.REL_X,
+                    evdev.ecodes.REL_Y] + self._WHEEL},
+            name='pynput mouse')
+        self._tablet = self._device(
+            events={
+                # The buttons make udev classify the tablet as a mouse
+                evdev.ecodes.EV_KEY: buttons,
+                evdev.ecodes.EV_REL: self._WHEEL,
+                evdev.ecodes.EV_ABS: [
+                    (evdev.ecodes.ABS_X, evdev.AbsInfo(
+                        value=0, min=0, max=self._width - 1,
+                        fuzz=0, flat=0, resolution=0)),
+                    (evdev.ecodes.ABS_Y, evdev.AbsInfo(
+                        value=0, min=0, max=self._height - 1,
+                        fuzz=0, flat=0, resolution=0))]},
+            name='pynput tablet')
+
+        #: The device last used for motion; button and wheel events are sent
+        #: through it to keep them ordered with the motion
+        self._dev = self._mouse
+
+        #: The tracked pointer position
+        self._position = (0, 0)
+
+        #: The last position reported by the tablet
+        self._tablet_position = (0, 0)
+
+        #: The events collected while in a :meth:`batch` block, as a list of
+        #: ``(device, data)``, or ``None``
+        self._segments = None
+
+    def __del__(self):
+        for name in ('_mouse', '_tablet'):
+            if hasattr(self, name):
+                getattr(self, name).close()
+
+    @contextlib.contextmanager
+    def batch(self):
+        if self._segments is not None:
+            yield self
+            return
+
+        self._segments = []
+        try:
+            yield self
+        except BaseException:
+            # Make sure that buttons released in the block are not left
+            # pressed
+            # pylint: disable=W0702; the original exception is reraised
+            try:
+                self._flush()
+            except:
+                pass
+            # pylint: enable=W0702
+            raise
+        else:
+            self._flush()
+
+    def move(self, dx, dy):
+        dx, dy = int(dx), int(dy)
+        self._send(self._mouse, [
+            (evdev.ecodes.EV_REL, code, value)
+            for code, value in (
+                (evdev.ecodes.REL_X, dx),
+                (evdev.ecodes.REL_Y, dy))
+            if value])
+        self._position = self._clamp(
+            self._position[0] + dx, self._position[1] + dy)
+
+    def _position_get(self):
+        return self._position
+
+    def _position_set(self, pos):
+        px, py = self._clamp(*pos)
+
+        # The kernel drops absolute events repeating the last value of an
+        # axis, so we move away first, since the pointer may have been moved
+        # by other devices since
+        if (px, py) == self._tablet_position:
+            self._send(self._tablet, [
+                (evdev.ecodes.EV_ABS, evdev.ecodes.ABS_X, px + 1 - 2 * (
+                    px == self._width - 1))])
+
+        self._send(self._tablet, [
+            (evdev.ecodes.EV_ABS, evdev.ecodes.ABS_X, px),
+            (evdev.ecodes.EV_ABS, evdev.ecodes.ABS_Y, py)])
+        self._position = self._tablet_position = (px, py)
+
+    def _scroll(self, dx, dy):
+        self._send(self._dev, [
+            (evdev.ecodes.EV_REL, code, int(value))
+            for code, value in (
+                (evdev.ecodes.REL_WHEEL, dy),
+                (evdev.ecodes.REL_HWHEEL, dx))
+            if value])
+
+    def _press(self, button):
+        self._send(self._dev, [(evdev.ecodes.EV_KEY, self._code(button), 1)])
+
+    def _release(self, button):
+        self._send(self._dev, [(evdev.ecodes.EV_KEY, self._code(button), 0)])
+
+    def _clamp(self, x, y):
+        """Limits a position to the screen.
+
+        :param x: The horizontal coordinate.
+
+        :param y: The vertical coordinate.
+
+        :return: the tuple ``(x, y)`` as integers within the screen
+        """
+        return (
+            min(max(int(x), 0), self._width - 1),
+            min(max(int(y), 0), self._height - 1))
+
+    def _code(self, button):
+        """Converts a button to an event code.
+
+        :param Button button: The button.
+
+        :raises ValueError: if the button is unknown
+        """
+        if button.value is None:
+            raise ValueError(button)
+        return button.value
+
+    def _device(self, events, name):
+        """Creates a virtual input device.
+
+        :param dict events: The events supported by the device.
+
+        :param str name: The name of the device.
+
+        :return: a device
+        """
+        return evdev.UInput(events=events, name=name)
+
+    def _flush(self):
+        """Writes the events collected in a :meth:`batch` block and ends the
+        batch.
+        """
+        segments, self._segments = self._segments, None
+        for dev, data in segments:
+            self._write(dev, memoryview(data))
+
+    def _send(self, dev, events):
+        """Sends a number of events, followed by ``SYN_REPORT``, to a device.
+
+        All events are written in one call, unless a :meth:`batch` block is
+        active, in which case they are appended to the pending events.
+
+        :param dev: The device.
+
+        :param events: A sequence of ``(type, code, value)``.
+        """
+        if not events:
+            return
+
+        self._dev = dev
+        data = b''.join(
+            self._INPUT_EVENT.pack(0, 0, *event)
+            for event in events) + self._SYN_REPORT
+        if self._segments is None:
+            self._write(dev, data)
+        elif self._segments and self._segments[-1][0] is dev:
+            self._segments[-1][1].extend(data)
+        else:
+            self._segments.append((dev, bytearray(data)))
+
+    def _write(self, dev, data):
+        """Writes a block of packed events to a device.
+
+        :param dev: The device.
+
+        :param data: The packed events.
+        :type data: bytes or memoryview
+        """
+        while len(data):
+            data = data[os.write(dev.fd, data):]
+
+
+class Listener(ListenerMixin, _base.Listener):
+    _EVENTS = (
+        evdev.ecodes.EV_SYN,
+        evdev.ecodes.EV_KEY,
+        evdev.ecodes.EV_REL,
+        evdev.ecodes.EV_ABS)
+
+    #: A mapping from event codes to buttons
+    _BUTTONS = {
+        button.value: button
+        for button in Button
+        if button.value is not None}
+
+    def __init__(self, *args, **kwargs):
+        super(Listener, self).__init__(*args, **kwargs)
+        self._width, self._height = self._options.get(
+            'screen_size', None) or _screen_size()
+
+        #: The tracked pointer position
+        self._position = (0, 0)
+
+        #: The frame being read, for each device path
+        self._frames = {}
+
+        #: The ranges of the absolute axes, for each device path
+        self._ranges = {}
+
+        #: The device currently being read
+        self._device = None
+
+    def _is_compatible(self, capabilities):
+        # Pointing devices have either relative axes, or absolute axes and
+        # mouse buttons; touch screens and joysticks have neither
+        rel = capabilities.get(evdev.ecodes.EV_REL, [])
+        abs_ = [
+            code[0] if isinstance(code, tuple) else code
+            for code in capabilities.get(evdev.ecodes.EV_ABS, [])]
+        keys = capabilities.get(evdev.ecodes.EV_KEY, [])
+        return evdev.ecodes.REL_X in rel or evdev.ecodes.REL_WHEEL in rel or (
+            evdev.ecodes.ABS_X in abs_
+            and any(code in self._BUTTONS for code in keys))
+
+    def _read(self, selector, dev):
+        # Absolute coordinates depend on the device, so we need to know which
+        # device an event comes from
+        self._device = dev
+        super(Listener, self)._read(selector, dev)
+
+    @AbstractListener._emitter
+    def _handle_message(self, event):
+        frame = self._frames.get(self._device.path, None)
+        if frame is None:
+            frame = self._frames[self._device.path] = _Frame()
+
+        if event.type == evdev.ecodes.EV_REL:
+            if event.code == evdev.ecodes.REL_X:
+                frame.dx += event.value
+            elif event.code == evdev.ecodes.REL_Y:
+                frame.dy += event.value
+            elif event.code == evdev.ecodes.REL_WHEEL:
+                frame.scroll_dy += event.value
+            elif event.code == evdev.ecodes.REL_HWHEEL:
+                frame.scroll_dx += event.value
+
+        elif event.type == evdev.ecodes.EV_ABS:
+            if event.code == evdev.ecodes.ABS_X:
+                frame.x = self._scale(event.code, event.value, self._width)
+                frame.absolute = True
+            elif event.code == evdev.ecodes.ABS_Y:
+                frame.y = self._scale(event.code, event.value, self._height)
+                frame.absolute = True
+
+        elif event.type == evdev.ecodes.EV_KEY:
+            # Ignore key repeat
+            if event.code in self._BUTTONS and event.value in (0, 1):
+                frame.buttons.append(
+                    (self._BUTTONS[event.code], bool(event.value)))
+
+        elif event.code == evdev.ecodes.SYN_REPORT:
+            self._dispatch(frame)
+            frame.reset()
+
+        else:
+            # The kernel dropped events, so this frame is incomplete
+            frame.reset()
+
+    def _dispatch(self, frame):
+        """Calls the callbacks for a complete frame.
+
+        :param _Frame frame: The frame.
+        """
+        px, py = self._position
+        if frame.dx or frame.dy:
+            px = min(max(px + frame.dx, 0), self._width - 1)
+            py = min(max(py + frame.dy, 0), self._height - 1)
+        if frame.absolute:
+            # Axes not reported in this frame keep their previous values
+            px = frame.x if frame.x is not None else px
+            py = frame.y if frame.y is not None else py
+
+        # We do not know whether these events are injected
+        if (px, py) != self._position:
+            self._position = (px, py)
+            self.on_move(px, py, False)
+        for button, pressed in frame.buttons:
+            self.on_click(px, py, button, pressed, False)
+        if frame.scroll_dx or frame.scroll_dy:
+            self.on_scroll(px, py, frame.scroll_dx, frame.scroll_dy, False)
+
+    def _scale(self, code, value, size):
+        """Converts an absolute axis value from the current device to a screen
+        coordinate.
+
+        :param int code: The axis.
+
+        :param int value: The axis value.
+
+        :param int size: The size of the screen along the axis.
+
+        :return: a screen coordinate
+        """
+        path = self._device.path
+        ranges = self._ranges.get(path, None)
+        if ranges is None:
+            ranges = self._ranges[path] = dict(
+                self._device.capabilities().get(evdev.ecodes.EV_ABS, []))
+        info = ranges.get(code, None)
+        if info is None or info.max <= info.min:
+            return value
+        return min(max(
+            (value - info.min) * (size - 1) // (info.max - info.min),
+            0), size - 1)
+
+
+class _Frame(object):
+    """The events read from a device until ``SYN_REPORT``.
+    """
+    __slots__ = (
+        'dx', 'dy', 'x', 'y', 'absolute', 'scroll_dx', 'scroll_dy', 'buttons')
+
+    def __init__(self):
+        #: The last absolute position reported by the device; this is kept
+        #: between frames, since unchanged axes are not reported
+        self.x = None
+        self.y = None
+
+        self.reset()
+
+    def reset(self):
+        """Clears all events of the frame.
+        """
+        #: The relative motion
+        self.dx = 0
+        self.dy = 0
+
+        #: Whether an absolute position was reported
+        self.absolute = False
+
+        #: The wheel motion
+        self.scroll_dx = 0
+        self.scroll_dy = 0
+
+        #: The button events, as a list of ``(button, pressed)``
+        self.buttons = []
@@ -0,0 +1,72 @@
+# coding=utf-8
+# pynput
+# Copyright (C) 2015-2024 Moses Palmér
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+The mouse implementation for the *virtual* backend.
+
+Events are not sent to the system, but recorded in
+:data:`pynput._util.virtual.DESKTOP` and delivered to running listeners.
+"""
+
+# pylint: disable=C0111
+# The documentation is extracted from the base classes
+
+# pylint: disable=R0903
+# We implement stubs
+
+import contextlib
+
+from pynput._util import NotifierMixin
+from pynput._util.virtual import DESKTOP, ListenerMixin
+from . import _base
+
+
+Button = _base.Button
+
+
+class Controller(NotifierMixin, _base.Controller):
+    def __init__(self, *args, **kwargs):
+        super(Controller, self).__init__(*args, **kwargs)
+
+    @contextlib.contextmanager
+    def batch(self):
+        with self._emit_batch():
+            yield self
+
+    def _position_get(self):
+        return DESKTOP.position
+
+    def _position_set(self, pos):
+        px, py = DESKTOP.move(*pos)
+        self._emit('_on_fake_event', 'on_move', px, py)
+
+    def _scroll(self, dx, dy):
+        if dx or dy:
+            px, py = DESKTOP.scroll(dx, dy)
+            self._emit('_on_fake_event', 'on_scroll', px, py, dx, dy)
+
+    def _press(self, button):
+        px, py = DESKTOP.click(button, True)
+        self._emit('_on_fake_event', 'on_click', px, py, button, True)
+
+    def _release(self, button):
+        px, py = DESKTOP.click(button, False)
+        self._emit('_on_fake_event', 'on_click', px, py, button, False)
+
+
+@Controller._receiver
+class Listener(ListenerMixin, _base.Listener):
+    pass
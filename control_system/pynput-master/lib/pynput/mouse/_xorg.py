@@ -35,6 +35,7 @@ except Exception as e:
     raise ImportError('failed to acquire X connection: {}'.format(str(e)), e)
 # pylint: enable=W0611
 
+import contextlib
 import enum
 import Xlib.display
 import Xlib.ext
@@ -43,6 +44,7 @@ import Xlib.X
 import Xlib.protocol
 
 from pynput._util.xorg import (
+    display_batch,
     display_manager,
     ListenerMixin)
 from . import _base
@@ -75,6 +77,16 @@ class Controller(_base.Controller):
         if hasattr(self, '_display'):
             self._display.close()
 
+    @contextlib.contextmanager
+    def batch(self):
+        with display_batch(self._display):
+            yield self
+
+    def click(self, button, count=1):
+        # Wait for the server only once all clicks have been sent
+        with self.batch():
+            super(Controller, self).click(button, count)
+
     def _position_get(self):
         with display_manager(self._display) as dm:
             qp = dm.screen().root.query_pointer()
@@ -82,27 +94,32 @@ class Controller(_base.Controller):
 
     def _position_set(self, pos):
         px, py = self._check_bounds(*pos)
-        with display_manager(self._display) as dm:
+        with display_manager(self._display, ('position', (px, py))) as dm:
             Xlib.ext.xtest.fake_input(dm, Xlib.X.MotionNotify, x=px, y=py)
 
     def _scroll(self, dx, dy):
         dx, dy = self._check_bounds(dx, dy)
-        if dy:
-            self.click(
-                button=Button.scroll_up if dy > 0 else Button.scroll_down,
-                count=abs(dy))
 
-        if dx:
-            self.click(
-                button=Button.scroll_right if dx > 0 else Button.scroll_left,
-                count=abs(dx))
+        # Scrolling is performed by clicking the scroll buttons; send all
+        # clicks before waiting for the server
+        with self.batch():
+            if dy:
+                self.click(
+                    button=Button.scroll_up if dy > 0 else Button.scroll_down,
+                    count=abs(dy))
+
+            if dx:
+                self.click(
+                    button=Button.scroll_right if dx > 0
+                    else Button.scroll_left,
+                    count=abs(dx))
 
     def _press(self, button):
-        with display_manager(self._display) as dm:
+        with display_manager(self._display, ('press', button)) as dm:
             Xlib.ext.xtest.fake_input(dm, Xlib.X.ButtonPress, button.value)
 
     def _release(self, button):
-        with display_manager(self._display) as dm:
+        with display_manager(self._display, ('release', button)) as dm:
             Xlib.ext.xtest.fake_input(dm, Xlib.X.ButtonRelease, button.value)
 
     def _check_bounds(self, *args):
@@ -159,6 +176,13 @@ class Listener(ListenerMixin, _base.Listener):
             self.on_move(px, py, injected)
 
 
+    def _event_types(self):
+        from pynput.mouse import Events
+        return {
+            'on_move': Events.Move,
+            'on_click': Events.Click,
+            'on_scroll': Events.Scroll}
+
     def _suppress_start(self, display):
         display.screen().root.grab_pointer(
             True, self._event_mask, Xlib.X.GrabModeAsync, Xlib.X.GrabModeAsync,
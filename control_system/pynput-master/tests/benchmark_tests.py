@@ -0,0 +1,235 @@
+# coding=utf-8
+# pystray
+# Copyright (C) 2015-2024 Moses Palmér
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+Non-interactive benchmarks for the controllers and listeners.
+
+These run with any backend able to both send and receive events, such as
+*Xorg* under *Xvfb* or the *virtual* backend. They type text and click the
+mouse, so with any backend but the *virtual* one they only run when
+``$PYNPUT_BENCHMARK`` is set; ``tools/benchmark.py suite`` does this::
+
+    PYNPUT_BACKEND=virtual python -m unittest tests.benchmark_tests
+    xvfb-run python tools/benchmark.py suite
+
+The results are written as *JSON* to the file named by
+``$PYNPUT_BENCHMARK_OUTPUT``, or printed if it is not set. The number of
+iterations is read from ``$PYNPUT_BENCHMARK_COUNT``.
+"""
+
+import json
+import os
+import platform
+import threading
+import time
+import unittest
+
+from pynput import keyboard, mouse
+from pynput._info import __version__
+
+from . import BACKEND, notify
+
+
+#: The number of iterations for every measurement
+COUNT = int(os.environ.get('PYNPUT_BENCHMARK_COUNT', '1000'))
+
+#: The file to which to write the results
+OUTPUT = os.environ.get('PYNPUT_BENCHMARK_OUTPUT', None)
+
+#: The number of seconds to wait for a single event before failing
+TIMEOUT = 5.0
+
+#: Whether to run the benchmarks; they never affect the real desktop with the
+#: virtual backend
+ENABLED = BACKEND == 'virtual' \
+    or os.environ.get('PYNPUT_BENCHMARK', '') not in ('', '0')
+
+
+def percentile(values, p):
+    """Calculates a percentile using the nearest rank method.
+
+    :param values: The sorted values.
+
+    :param float p: The percentile, between ``0`` and ``100``.
+
+    :return: the percentile
+    """
+    return values[max(0, min(
+        len(values) - 1,
+        int(round(p / 100.0 * len(values) + 0.5)) - 1))]
+
+
+# The dummy backend uses the abstract base classes
+@unittest.skipIf(
+    keyboard.Controller.__module__.endswith('._base'),
+    'the dummy backend cannot send events')
+@unittest.skipUnless(ENABLED, 'set $PYNPUT_BENCHMARK to run the benchmarks')
+class BenchmarkTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.results = {}
+        if BACKEND != 'virtual':
+            notify(
+                'This benchmark types text and clicks the mouse; do not '
+                'touch the keyboard or mouse',
+                4)
+
+    @classmethod
+    def tearDownClass(cls):
+        data = json.dumps({
+            'backend': BACKEND,
+            'pynput': '.'.join(str(v) for v in __version__),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'count': COUNT,
+            'results': cls.results}, indent=2, sort_keys=True)
+        if OUTPUT:
+            with open(OUTPUT, 'w') as f:
+                f.write(data)
+        else:
+            print(data)
+
+    def rate(self, name, unit, f, count=COUNT):
+        """Measures the number of iterations per second of a function.
+
+        :param str name: The name of the result.
+
+        :param str unit: The unit of the result.
+
+        :param callable f: The function to measure. It is called once, and
+            must perform ``count`` iterations.
+
+        :param int count: The number of iterations performed by ``f``.
+        """
+        start = time.perf_counter()
+        f()
+        elapsed = time.perf_counter() - start
+        self.results[name] = {
+            'value': count / elapsed,
+            'unit': unit}
+
+    def latency(self, name, listener_class, callback, f, identify,
+            count=COUNT):
+        """Measures the time from calling a controller method until a listener
+        callback is invoked.
+
+        Some backends invoke the callback more than once for every event, so
+        only the first callback identified as belonging to the current
+        iteration is measured.
+
+        :param str name: The name of the result.
+
+        :param listener_class: The listener class.
+
+        :param str callback: The name of the listener callback to measure.
+
+        :param callable f: A function sending a single event; it is called
+            with the iteration number.
+
+        :param callable identify: A function returning the iteration number,
+            modulo ``2``, of the event for the arguments passed to the
+            callback. This is used to ignore late callbacks for the previous
+            iteration.
+
+        :param int count: The number of iterations.
+        """
+        lock = threading.Lock()
+        received = threading.Event()
+        samples = [None] * count
+
+        # The current iteration and its start time
+        current = [None, None]
+
+        def on_event(*args):
+            now = time.perf_counter()
+            with lock:
+                i, start = current
+                if i is None or samples[i] is not None \
+                        or identify(*args) != i % 2:
+                    return
+                samples[i] = now - start
+            received.set()
+
+        with listener_class(**{callback: on_event}):
+            for i in range(count):
+                received.clear()
+                with lock:
+                    current[:] = [i, time.perf_counter()]
+                f(i)
+                self.assertTrue(
+                    received.wait(TIMEOUT),
+                    'no event received for {}'.format(name))
+
+        values = sorted(1000.0 * sample for sample in samples)
+        self.results[name] = {
+            'p50': percentile(values, 50),
+            'p95': percentile(values, 95),
+            'p99': percentile(values, 99),
+            'max': values[-1],
+            'unit': 'ms'}
+
+    def test_keyboard_type(self):
+        controller = keyboard.Controller()
+        text = ('the quick brown fox jumps over the lazy dog '
+            * (COUNT // 44 + 1))[:COUNT]
+        self.rate(
+            'keyboard.type', 'chars/s',
+            lambda: controller.type(text),
+            len(text))
+
+    def test_mouse_position(self):
+        controller = mouse.Controller()
+
+        def set_position():
+            for i in range(COUNT):
+                controller.position = (i % 100 + 10, i % 50 + 10)
+
+        def get_position():
+            for _ in range(COUNT):
+                controller.position
+
+        self.rate('mouse.position.set', 'positions/s', set_position)
+        self.rate('mouse.position.get', 'positions/s', get_position)
+
+    def test_mouse_click(self):
+        controller = mouse.Controller()
+
+        def click():
+            for _ in range(COUNT):
+                controller.click(mouse.Button.left)
+
+        self.rate('mouse.click', 'clicks/s', click)
+
+    def test_keyboard_latency(self):
+        controller = keyboard.Controller()
+
+        # Shift has no effect on any application receiving the events; we
+        # alternate between the left and right keys to identify iterations
+        keys = (keyboard.Key.shift_l, keyboard.Key.shift_r)
+        self.latency(
+            'keyboard.latency', keyboard.Listener, 'on_press',
+            lambda i: controller.tap(keys[i % 2]),
+            lambda key, *args: int(key == keys[1]))
+
+    def test_mouse_latency(self):
+        controller = mouse.Controller()
+
+        # Alternate between two positions, so that every call moves the
+        # pointer
+        self.latency(
+            'mouse.latency', mouse.Listener, 'on_move',
+            lambda i: setattr(controller, 'position', (10 + i % 2, 10)),
+            lambda x, y, *args: x - 10)
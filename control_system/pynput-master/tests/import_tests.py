@@ -0,0 +1,74 @@
+# coding=utf-8
+# pystray
+# Copyright (C) 2015-2024 Moses Palmér
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import subprocess
+import sys
+import unittest
+
+import pynput
+
+
+class ImportTest(unittest.TestCase):
+    def modules(self, lazy, *statements):
+        """Runs statements in a new interpreter and returns the names of the
+        *pynput* submodules imported afterwards.
+
+        :param bool lazy: Whether to enable deferred imports.
+
+        :param statements: The statements to execute.
+
+        :return: a set of module names
+        """
+        env = dict(os.environ)
+        env['PYNPUT_LAZY'] = '1' if lazy else '0'
+        env['PYTHONPATH'] = os.pathsep.join(
+            [os.path.dirname(os.path.dirname(pynput.__file__))]
+            + ([env['PYTHONPATH']] if 'PYTHONPATH' in env else []))
+        return set(subprocess.check_output(
+            [sys.executable, '-c', '\n'.join(statements + (
+                'import sys',
+                'print(" ".join(m for m in sys.modules'
+                ' if m in ("pynput.keyboard", "pynput.mouse")))'))],
+            env=env).decode('utf-8').split())
+
+    def test_eager(self):
+        self.assertEqual(
+            {'pynput.keyboard', 'pynput.mouse'},
+            self.modules(False, 'import pynput'))
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'requires Python 3.7')
+    def test_lazy(self):
+        self.assertEqual(
+            set(),
+            self.modules(True, 'import pynput'))
+        self.assertEqual(
+            {'pynput.keyboard'},
+            self.modules(True, 'import pynput', 'pynput.keyboard.Controller'))
+        self.assertEqual(
+            {'pynput.mouse'},
+            self.modules(True, 'from pynput import mouse'))
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'requires Python 3.7')
+    def test_asynchronous(self):
+        from pynput import keyboard, mouse
+        from pynput._util import asynchronous
+        for module in (keyboard, mouse):
+            self.assertTrue(issubclass(
+                module.AsyncEvents, asynchronous.AsyncEvents))
+            self.assertTrue(issubclass(
+                module.AsyncController, asynchronous.AsyncController))
@@ -15,6 +15,7 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
+import time
 import unittest
 
 from six.moves import queue
@@ -22,6 +23,7 @@ from six.moves import queue
 from pynput.keyboard import (
     GlobalHotKeys,
     HotKey,
+    HotKeyMatcher,
     Key as k,
     KeyCode as kc,
 )
@@ -136,6 +138,83 @@ class KeyboardHotKeyTest(unittest.TestCase):
         hk.press(kc.from_char('a'))
         self.assertEqual(3, len(activations))
 
+    def test_parse_sequence(self):
+        self.assertSequenceEqual(
+            HotKey.parse_sequence('<ctrl>+k, <ctrl>+c'),
+            [
+                [k.ctrl, kc.from_char('k')],
+                [k.ctrl, kc.from_char('c')]])
+        self.assertSequenceEqual(
+            HotKey.parse_sequence('<ctrl>+,,a'),
+            [
+                [k.ctrl, kc.from_char(',')],
+                [kc.from_char('a')]])
+        self.assertSequenceEqual(
+            HotKey.parse_sequence('<ctrl>+a'),
+            [
+                [k.ctrl, kc.from_char('a')]])
+
+        with self.assertRaises(ValueError):
+            HotKey.parse_sequence('<ctrl>+a,')
+
+    def test_matcher_combo(self):
+        activations = []
+        matcher = HotKeyMatcher({
+            '<ctrl>+a': lambda: activations.append('a'),
+            '<ctrl>+b': lambda: activations.append('b'),
+            'a': lambda: activations.append('plain')})
+
+        matcher.press(k.ctrl)
+        matcher.press(kc.from_char('a'))
+        self.assertEqual(['a', 'plain'], activations)
+        matcher.press(kc.from_char('a'))
+        self.assertEqual(['a', 'plain'], activations)
+        matcher.release(kc.from_char('a'))
+        matcher.press(kc.from_char('b'))
+        self.assertEqual(['a', 'plain', 'b'], activations)
+        matcher.release(k.ctrl)
+        matcher.release(kc.from_char('b'))
+        matcher.press(kc.from_char('b'))
+        self.assertEqual(['a', 'plain', 'b'], activations)
+
+    def test_matcher_sequence(self):
+        activations = []
+        matcher = HotKeyMatcher({
+            '<ctrl>+k, <ctrl>+c': lambda: activations.append(True)},
+            timeout=0.1)
+
+        def chord(*keys):
+            for key in keys:
+                matcher.press(key)
+            for key in reversed(keys):
+                matcher.release(key)
+
+        # The second combination alone does nothing
+        chord(k.ctrl, kc.from_char('c'))
+        self.assertEqual(0, len(activations))
+
+        chord(k.ctrl, kc.from_char('k'))
+        chord(k.ctrl, kc.from_char('c'))
+        self.assertEqual(1, len(activations))
+
+        # Another key cancels the sequence
+        chord(k.ctrl, kc.from_char('k'))
+        chord(kc.from_char('x'))
+        chord(k.ctrl, kc.from_char('c'))
+        self.assertEqual(1, len(activations))
+
+        # The sequence times out
+        chord(k.ctrl, kc.from_char('k'))
+        time.sleep(0.15)
+        chord(k.ctrl, kc.from_char('c'))
+        self.assertEqual(1, len(activations))
+
+        # Repeating the first combination restarts the sequence
+        chord(k.ctrl, kc.from_char('k'))
+        chord(k.ctrl, kc.from_char('k'))
+        chord(k.ctrl, kc.from_char('c'))
+        self.assertEqual(2, len(activations))
+
     def test_hotkeys(self):
         q = queue.Queue()
 
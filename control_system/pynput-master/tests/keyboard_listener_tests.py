@@ -20,6 +20,8 @@ import six
 import six.moves.queue as queue
 import time
 import threading
+import types
+import unittest
 
 import pynput.keyboard
 
@@ -266,6 +268,37 @@ class KeyboardListenerTest(EventTest):
                 win32_test=False,
                 xorg_test=True)._options['test'])
 
+    @xorg
+    def test_buffer_type_from_callback(self):
+        """Tests that a callback may type more characters than fit in the
+        delivery buffer"""
+        from pynput.keyboard import Controller, KeyCode
+        self.notify('Do not touch the keyboard')
+
+        controller = Controller()
+        string = 'bcdefghij'
+        received = []
+        done = threading.Event()
+
+        def on_press(key, injected):
+            if not injected:
+                return
+            received.append(key)
+            if key == KeyCode.from_char('a'):
+                controller.type(string)
+            elif key == KeyCode.from_char(string[-1]):
+                done.set()
+
+        with self.listener(
+                on_press=on_press,
+                xorg_buffer_size=len(string) // 2) as listener:
+            time.sleep(0.1)
+            controller.tap('a')
+            self.assertTrue(
+                done.wait(5.0),
+                'Listener did not receive all characters')
+            self.assertTrue(listener.running)
+
     def test_events(self):
         """Tests that events are correctly yielded"""
         from pynput.keyboard import Key, KeyCode, Events
@@ -293,3 +326,94 @@ class KeyboardListenerTest(EventTest):
         self.notify('Do not touch the keyboard', delay=2.0)
         with Events() as events:
             self.assertIsNone(events.get(1.0))
+
+
+@xorg
+class XorgKeyboardListenerTest(unittest.TestCase):
+    """Tests for the translation of key codes by the *Xorg* listener, which
+    do not require any interaction.
+    """
+    def setUp(self):
+        import Xlib.display
+        self.display = Xlib.display.Display()
+        self.listener = pynput.keyboard.Listener()
+        self.listener._initialize(self.display)
+
+    def tearDown(self):
+        self.display.close()
+
+    def translate(self, keycode, state):
+        """Translates a key code and state without the precomputed table.
+        """
+        from pynput._util.xorg import alt_gr_mask, numlock_mask
+        try:
+            return self.listener._keycode_to_key(
+                self.display,
+                keycode,
+                (state & 1) | (2 if state & alt_gr_mask(self.display) else 0),
+                bool(state & numlock_mask(self.display)))
+        except IndexError:
+            return None
+
+    def event(self, keycode, state):
+        return types.SimpleNamespace(detail=keycode, state=state)
+
+    def assert_table(self, keycodes):
+        """Asserts that the table gives the same keys as translating every key
+        code and modifier state.
+        """
+        from pynput._util.xorg import alt_gr_mask, numlock_mask
+        altgr = alt_gr_mask(self.display)
+        numlock = numlock_mask(self.display)
+        states = sorted({
+            shift | a | n
+            for shift in (0, 1)
+            for a in (0, altgr)
+            for n in (0, numlock)})
+        for keycode in keycodes:
+            for state in states:
+                self.assertEqual(
+                    self.translate(keycode, state),
+                    self.listener._event_to_key(
+                        self.display, self.event(keycode, state)),
+                    'key code {}, state {}'.format(keycode, state))
+
+    def test_table(self):
+        """Tests that the table gives the same result as translating every key
+        code"""
+        self.assert_table(range(8, self.listener._KEYCODES))
+
+    def test_mapping_keyboard(self):
+        """Tests that the table is updated for a changed keyboard mapping"""
+        import Xlib.X
+        from pynput._util.xorg import char_to_keysym
+
+        mapping = self.display.get_keyboard_mapping(8, 255 - 8)
+        keycode = next(
+            i + 8
+            for i, keysyms in enumerate(mapping)
+            if not any(keysyms))
+        keysym = char_to_keysym(u'\u00f8')
+        self.assertIsNone(self.listener._event_to_key(
+            self.display, self.event(keycode, 0)).char)
+
+        try:
+            self.display.change_keyboard_mapping(keycode, [(keysym,) * 4])
+            self.display.sync()
+            event = types.SimpleNamespace(
+                type=Xlib.X.MappingNotify,
+                request=Xlib.X.MappingKeyboard,
+                first_keycode=keycode,
+                count=1)
+            self.listener._handle_message(self.display, event, False)
+
+            self.assertEqual(
+                pynput.keyboard.KeyCode.from_char(u'\u00f8'),
+                self.listener._event_to_key(
+                    self.display, self.event(keycode, 0)))
+            self.assert_table([keycode])
+
+        finally:
+            self.display.change_keyboard_mapping(
+                keycode, [mapping[keycode - 8]])
+            self.display.sync()
@@ -0,0 +1,681 @@
+# coding=utf-8
+# pystray
+# Copyright (C) 2015-2024 Moses Palmér
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+Tests for the parts of the *uinput* backend that do not require access to
+input devices.
+"""
+
+import collections
+import json
+import logging
+import os
+import selectors
+import shutil
+import struct
+import tempfile
+import unittest
+
+try:
+    import evdev
+    from pynput._util import uinput
+    from pynput.mouse import _uinput as mouse_uinput
+except ImportError:
+    evdev = None
+
+try:
+    from pynput.keyboard import _uinput as keyboard_uinput
+except ImportError:
+    keyboard_uinput = None
+
+from pynput._util import AbstractListener
+
+
+#: An event read from a fake device
+Event = collections.namedtuple('Event', ('type', 'code', 'value'))
+
+#: The binary layout of ``struct input_event``
+INPUT_EVENT = struct.Struct('@llHHi')
+
+
+class FakeDevice(object):
+    """An input device reading events from a pipe.
+
+    :param str path: The device path.
+
+    :param dict capabilities: The device capabilities.
+    """
+    def __init__(self, path, capabilities):
+        self.path = path
+        self._capabilities = capabilities
+        self._read_fd, self._write_fd = os.pipe()
+        os.set_blocking(self._read_fd, False)
+        self._events = collections.deque()
+        self.grabbed = False
+        self.closed = False
+
+    def fileno(self):
+        return self._read_fd
+
+    def capabilities(self):
+        return self._capabilities
+
+    def grab(self):
+        self.grabbed = True
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            os.close(self._read_fd)
+            os.close(self._write_fd)
+
+    def send(self, *events):
+        """Makes events available for reading.
+        """
+        self._events.extend(events)
+        os.write(self._write_fd, b'\0')
+
+    def read(self):
+        os.read(self._read_fd, 4096)
+        events = list(self._events)
+        self._events.clear()
+        return events
+
+
+class FakeUInput(object):
+    """A virtual input device writing events to a pipe.
+    """
+    def __init__(self):
+        self._read_fd, self.fd = os.pipe()
+        os.set_blocking(self._read_fd, False)
+
+    def close(self):
+        for fd in (self._read_fd, self.fd):
+            if fd is not None:
+                os.close(fd)
+        self._read_fd = self.fd = None
+
+    def disconnect(self):
+        """Closes the reading end of the pipe, so that writes fail.
+        """
+        os.close(self._read_fd)
+        self._read_fd = None
+
+    def read(self):
+        """Reads all events written to the device.
+
+        :return: a list of :class:`Event`
+        """
+        data = b''
+        try:
+            while True:
+                data += os.read(self._read_fd, 4096)
+        except BlockingIOError:
+            pass
+        return [
+            Event(*values[2:])
+            for values in INPUT_EVENT.iter_unpack(data)]
+
+
+@unittest.skipIf(evdev is None, 'evdev is not available')
+class UinputListenerTest(unittest.TestCase):
+    def setUp(self):
+        class Listener(uinput.ListenerMixin, AbstractListener):
+            _EVENTS = (evdev.ecodes.EV_KEY,)
+            _log = logging.getLogger(__name__)
+
+            def __init__(self, devices, **kwargs):
+                self._options = {
+                    'device_paths': [dev.path for dev in devices]}
+                self._fake_devices = {dev.path: dev for dev in devices}
+                super(Listener, self).__init__(**kwargs)
+
+            def _open(self, path):
+                dev = self._fake_devices.get(path, None)
+                if dev is not None and self._is_compatible(
+                        dev.capabilities()):
+                    return dev
+
+            @AbstractListener._emitter
+            def _handle_message(self, event):
+                self.on_event(event.value)
+
+        self.Listener = Listener
+        self.devices = [
+            FakeDevice('/dev/input/event0', {
+                evdev.ecodes.EV_KEY: [30]}),
+            FakeDevice('/dev/input/event1', {
+                evdev.ecodes.EV_REL: [evdev.ecodes.REL_X]})]
+
+    def tearDown(self):
+        for dev in self.devices:
+            dev.close()
+
+    def test_is_compatible(self):
+        listener = self.Listener(self.devices[:1], on_event=None)
+        self.assertTrue(listener._is_compatible({
+            evdev.ecodes.EV_KEY: [30]}))
+        self.assertFalse(listener._is_compatible({
+            evdev.ecodes.EV_KEY: []}))
+        self.assertFalse(listener._is_compatible({
+            evdev.ecodes.EV_REL: [evdev.ecodes.REL_X]}))
+
+    def test_incompatible(self):
+        with self.assertRaises(OSError):
+            self.Listener(self.devices[1:], on_event=None)
+
+    def test_events(self):
+        values = []
+        listener = self.Listener(self.devices, on_event=values.append)
+        self.assertEqual([self.devices[0]], listener._devices)
+        with listener:
+            self.devices[0].send(
+                Event(evdev.ecodes.EV_KEY, 30, 1),
+                Event(evdev.ecodes.EV_SYN, 0, 0),
+                Event(evdev.ecodes.EV_KEY, 30, 0))
+            self.devices[0].send(Event(evdev.ecodes.EV_KEY, 30, 2))
+            self.devices[0].send(Event(evdev.ecodes.EV_KEY, 30, 3))
+            listener.join(0.2)
+        listener.join(1.0)
+        self.assertFalse(listener.is_alive())
+        self.assertEqual([1, 0, 2, 3], values)
+        self.assertIsNone(listener._wake)
+        self.assertTrue(self.devices[0].closed)
+
+    def test_stop_from_callback(self):
+        listener = self.Listener(
+            self.devices[:1], on_event=lambda value: value != 0)
+        listener.start()
+        listener.wait()
+        self.devices[0].send(
+            Event(evdev.ecodes.EV_KEY, 30, 1),
+            Event(evdev.ecodes.EV_KEY, 30, 0))
+        listener.join(1.0)
+        self.assertFalse(listener.is_alive())
+
+    def test_exception_from_callback(self):
+        class Error(Exception):
+            pass
+
+        def on_event(value):
+            raise Error()
+
+        listener = self.Listener(self.devices[:1], on_event=on_event)
+        listener.start()
+        listener.wait()
+        self.devices[0].send(Event(evdev.ecodes.EV_KEY, 30, 1))
+        with self.assertRaises(Error):
+            listener.join(1.0)
+
+    def test_stop_unstarted(self):
+        listener = self.Listener(self.devices[:1], on_event=None)
+        listener.stop()
+        self.assertIsNone(listener._wake)
+
+    def test_hotplug(self):
+        new = [
+            FakeDevice('/dev/input/event2', {
+                evdev.ecodes.EV_KEY: [31]}),
+            FakeDevice('/dev/input/event3', {
+                evdev.ecodes.EV_REL: [evdev.ecodes.REL_X]}),
+            FakeDevice('/dev/input/mouse0', {
+                evdev.ecodes.EV_KEY: [32]})]
+        self.devices.extend(new)
+
+        listener = self.Listener(
+            self.devices[:1], on_event=None, suppress=True)
+        listener._fake_devices.update((dev.path, dev) for dev in new)
+        selector = selectors.DefaultSelector()
+        try:
+            listener._hotplug_devices(
+                selector, [dev.path for dev in self.devices])
+            self.assertEqual(
+                [self.devices[0], new[0]],
+                listener._devices)
+            self.assertIs(new[0], selector.get_key(new[0]).data)
+            self.assertTrue(new[0].grabbed)
+            for dev in new[1:]:
+                self.assertRaises(KeyError, selector.get_key, dev)
+        finally:
+            selector.close()
+
+    def test_inotify(self):
+        directory = tempfile.mkdtemp()
+        try:
+            try:
+                inotify = uinput._Inotify(directory)
+            except OSError:
+                self.skipTest('inotify is not available')
+            try:
+                self.assertEqual([], inotify.read())
+                path = os.path.join(directory, 'event4')
+                with open(path, 'w'):
+                    pass
+                os.chmod(path, 0o600)
+                self.assertEqual(set([path]), set(inotify.read()))
+            finally:
+                inotify.close()
+        finally:
+            shutil.rmtree(directory)
+
+
+@unittest.skipIf(keyboard_uinput is None, 'dumpkeys is not available')
+class UinputLayoutTest(unittest.TestCase):
+    #: A partial output of dumpkeys
+    DUMP = b'''keycode   2 = one              exclam           onesuperior      exclamdown
+keycode  16 = +q               +Q               at               Greek_OMEGA
+keycode  28 = Return           Return           Return           Return
+keycode  30 = +a               +A               ae               AE
+'''
+
+    def setUp(self):
+        self.environ = os.environ.get('XDG_CACHE_HOME', None)
+        self.directory = tempfile.mkdtemp()
+        os.environ['XDG_CACHE_HOME'] = self.directory
+        self.parsed = 0
+        test = self
+
+        class Layout(keyboard_uinput.Layout):
+            def _dump(self):
+                return test.DUMP
+
+            def _parse_dump(self, dump):
+                test.parsed += 1
+                return super(Layout, self)._parse_dump(dump)
+
+        self.Layout = Layout
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        if self.environ is not None:
+            os.environ['XDG_CACHE_HOME'] = self.environ
+        else:
+            os.environ.pop('XDG_CACHE_HOME', None)
+
+    def cached(self):
+        """Lists the files in the cache directory.
+        """
+        directory = os.path.join(self.directory, 'pynput')
+        return sorted(os.listdir(directory)) \
+            if os.path.isdir(directory) else []
+
+    def assertTablesEqual(self, expected, actual):
+        self.assertEqual(
+            {vk: list(keys) for vk, keys in expected.items()},
+            {vk: list(keys) for vk, keys in actual.items()})
+
+    def test_parse(self):
+        layout = self.Layout(cache=False)
+        self.assertEqual(
+            keyboard_uinput.KeyCode.from_char('Q', vk=16),
+            layout.for_vk(16, {keyboard_uinput.Key.shift}))
+        self.assertEqual(
+            keyboard_uinput.Key.enter,
+            layout.for_vk(28, set()))
+        self.assertEqual((30, set()), layout.for_char('a'))
+        self.assertEqual([], self.cached())
+
+    def test_serialize(self):
+        layout = self.Layout(cache=False)
+        self.assertTablesEqual(
+            layout._vk_table,
+            layout._deserialize(json.loads(json.dumps(
+                layout._serialize(layout._vk_table)))))
+
+    def test_cache(self):
+        first = self.Layout()
+        self.assertEqual(1, self.parsed)
+        self.assertEqual(1, len(self.cached()))
+
+        second = self.Layout()
+        self.assertEqual(1, self.parsed)
+        self.assertTablesEqual(first._vk_table, second._vk_table)
+
+        second.refresh()
+        self.assertEqual(2, self.parsed)
+        self.assertEqual(1, len(self.cached()))
+
+    def test_cache_invalidated(self):
+        self.Layout()
+        self.DUMP += (
+            b'keycode  31 = +s               +S               '
+            b'ssharp           section\n')
+        layout = self.Layout()
+        self.assertEqual(2, self.parsed)
+        self.assertEqual(2, len(self.cached()))
+        self.assertEqual((31, set()), layout.for_char('s'))
+
+    def test_cache_corrupt(self):
+        self.Layout()
+        path = os.path.join(self.directory, 'pynput', self.cached()[0])
+        with open(path, 'w') as f:
+            f.write('[[30, ["invalid"]]]')
+        layout = self.Layout()
+        self.assertEqual(2, self.parsed)
+        self.assertEqual((30, set()), layout.for_char('a'))
+
+    def test_cache_write_failure(self):
+        class Layout(self.Layout):
+            def _serialize(self, vk_table):
+                raise OSError()
+
+        layout = Layout()
+        self.assertEqual((30, set()), layout.for_char('a'))
+        self.assertEqual([], self.cached())
+
+
+@unittest.skipIf(keyboard_uinput is None, 'dumpkeys is not available')
+class UinputKeyboardControllerTest(unittest.TestCase):
+    def setUp(self):
+        self.writes = []
+        test = self
+
+        class Controller(keyboard_uinput.Controller):
+            def _device(self):
+                return FakeUInput()
+
+            def _write(self, data):
+                test.writes.append(bytes(data))
+                super(Controller, self)._write(data)
+
+        self.controller = Controller()
+        self.size = keyboard_uinput.Controller._INPUT_EVENT.size
+
+    def tearDown(self):
+        self.controller._dev.close()
+
+    def tap(self, vk):
+        """The events expected when tapping a key.
+        """
+        return [
+            Event(evdev.ecodes.EV_KEY, vk, 1),
+            Event(evdev.ecodes.EV_SYN, evdev.ecodes.SYN_REPORT, 0),
+            Event(evdev.ecodes.EV_KEY, vk, 0),
+            Event(evdev.ecodes.EV_SYN, evdev.ecodes.SYN_REPORT, 0)]
+
+    def test_batch(self):
+        with self.controller.batch() as controller:
+            self.assertIs(self.controller, controller)
+            controller.tap(keyboard_uinput.KeyCode.from_vk(30))
+            with controller.batch():
+                controller.tap(keyboard_uinput.KeyCode.from_vk(48))
+            self.assertEqual([], self.controller._dev.read())
+
+        self.assertEqual(
+            self.tap(30) + self.tap(48),
+            self.controller._dev.read())
+        self.assertEqual([8 * self.size], [len(w) for w in self.writes])
+
+    def test_pacing(self):
+        self.controller.pacing = 0.001
+        with self.controller.batch() as controller:
+            controller.tap(keyboard_uinput.KeyCode.from_vk(30))
+            controller.tap(keyboard_uinput.KeyCode.from_vk(48))
+
+        self.assertEqual(
+            self.tap(30) + self.tap(48),
+            self.controller._dev.read())
+
+        # Every write ends with a SYN_REPORT
+        self.assertEqual(
+            [2 * self.size] * 4,
+            [len(w) for w in self.writes if w])
+
+    def test_batch_exception(self):
+        with self.assertRaises(ValueError):
+            with self.controller.batch() as controller:
+                controller.tap(keyboard_uinput.KeyCode.from_vk(30))
+                raise ValueError()
+
+        self.assertEqual(self.tap(30), self.controller._dev.read())
+        self.assertIsNone(self.controller._pending)
+
+    def test_batch_exception_write(self):
+        self.controller._dev.disconnect()
+        with self.assertRaises(ValueError):
+            with self.controller.batch() as controller:
+                controller.tap(keyboard_uinput.KeyCode.from_vk(30))
+                raise ValueError()
+        with self.assertRaises(OSError):
+            with self.controller.batch() as controller:
+                controller.tap(keyboard_uinput.KeyCode.from_vk(30))
+
+
+@unittest.skipIf(evdev is None, 'evdev is not available')
+class UinputScreenSizeTest(unittest.TestCase):
+    def setUp(self):
+        self.environ = os.environ.pop(uinput.SCREEN_SIZE_ENVIRONMENT, None)
+        self.directory = tempfile.mkdtemp()
+        self.framebuffer = uinput._FRAMEBUFFER_SIZE
+        uinput._FRAMEBUFFER_SIZE = os.path.join(self.directory, 'size')
+
+    def tearDown(self):
+        uinput._FRAMEBUFFER_SIZE = self.framebuffer
+        shutil.rmtree(self.directory)
+        os.environ.pop(uinput.SCREEN_SIZE_ENVIRONMENT, None)
+        if self.environ is not None:
+            os.environ[uinput.SCREEN_SIZE_ENVIRONMENT] = self.environ
+
+    def test_default(self):
+        self.assertEqual(uinput._DEFAULT_SCREEN_SIZE, uinput.screen_size())
+
+    def test_framebuffer(self):
+        with open(uinput._FRAMEBUFFER_SIZE, 'w') as f:
+            f.write('1280,1024\n')
+        self.assertEqual((1280, 1024), uinput.screen_size())
+
+    def test_framebuffer_invalid(self):
+        with open(uinput._FRAMEBUFFER_SIZE, 'w') as f:
+            f.write('0,1024\n')
+        self.assertEqual(uinput._DEFAULT_SCREEN_SIZE, uinput.screen_size())
+
+    def test_environment(self):
+        with open(uinput._FRAMEBUFFER_SIZE, 'w') as f:
+            f.write('1280,1024\n')
+        os.environ[uinput.SCREEN_SIZE_ENVIRONMENT] = '800X600'
+        self.assertEqual((800, 600), uinput.screen_size())
+
+    def test_environment_invalid(self):
+        for value in ('800', '800x', 'axb', '0x600', '800x600x2'):
+            os.environ[uinput.SCREEN_SIZE_ENVIRONMENT] = value
+            with self.assertRaises(ValueError):
+                uinput.screen_size()
+
+
+@unittest.skipIf(evdev is None, 'evdev is not available')
+class UinputMouseListenerTest(unittest.TestCase):
+    def setUp(self):
+        abs_info = evdev.AbsInfo(
+            value=0, min=0, max=32767, fuzz=0, flat=0, resolution=0)
+        self.mouse = FakeDevice('/dev/input/event0', {
+            evdev.ecodes.EV_REL: [evdev.ecodes.REL_X, evdev.ecodes.REL_Y],
+            evdev.ecodes.EV_KEY: [evdev.ecodes.BTN_LEFT]})
+        self.tablet = FakeDevice('/dev/input/event1', {
+            evdev.ecodes.EV_ABS: [
+                (evdev.ecodes.ABS_X, abs_info),
+                (evdev.ecodes.ABS_Y, abs_info)],
+            evdev.ecodes.EV_KEY: [evdev.ecodes.BTN_LEFT]})
+        self.events = []
+
+        devices = {dev.path: dev for dev in (self.mouse, self.tablet)}
+
+        class Listener(mouse_uinput.Listener):
+            def _open(self, path):
+                return devices.get(path, None)
+
+        self.listener = Listener(
+            on_move=lambda *args: self.events.append(('move',) + args),
+            on_click=lambda *args: self.events.append(('click',) + args),
+            on_scroll=lambda *args: self.events.append(('scroll',) + args),
+            uinput_device_paths=sorted(devices),
+            uinput_screen_size=(1000, 500))
+
+    def tearDown(self):
+        self.mouse.close()
+        self.tablet.close()
+
+    def send(self, dev, *events):
+        """Passes events from a device to the listener.
+        """
+        self.listener._device = dev
+        for event in events:
+            self.listener._handle_message(Event(*event))
+
+    def test_is_compatible(self):
+        ecodes = evdev.ecodes
+        compatible = self.listener._is_compatible
+        self.assertTrue(compatible(self.mouse.capabilities()))
+        self.assertTrue(compatible(self.tablet.capabilities()))
+        self.assertTrue(compatible({
+            ecodes.EV_REL: [ecodes.REL_WHEEL]}))
+
+        # Touch screens and joysticks
+        self.assertFalse(compatible({
+            ecodes.EV_ABS: [(ecodes.ABS_X, None)],
+            ecodes.EV_KEY: [ecodes.BTN_TOUCH]}))
+        self.assertFalse(compatible({
+            ecodes.EV_KEY: [ecodes.BTN_LEFT]}))
+
+    def test_frame(self):
+        ecodes = evdev.ecodes
+        self.listener._running = True
+        self.send(
+            self.mouse,
+            (ecodes.EV_REL, ecodes.REL_X, 10),
+            (ecodes.EV_REL, ecodes.REL_Y, 5),
+            (ecodes.EV_REL, ecodes.REL_X, 10))
+        self.assertEqual([], self.events)
+
+        self.send(
+            self.mouse,
+            (ecodes.EV_KEY, ecodes.BTN_LEFT, 1),
+            (ecodes.EV_REL, ecodes.REL_WHEEL, -1),
+            (ecodes.EV_SYN, ecodes.SYN_REPORT, 0))
+        self.assertEqual([
+            ('move', 20, 5, False),
+            ('click', 20, 5, mouse_uinput.Button.left, True, False),
+            ('scroll', 20, 5, 0, -1, False)],
+            self.events)
+
+    def test_frame_dropped(self):
+        ecodes = evdev.ecodes
+        self.listener._running = True
+        self.send(
+            self.mouse,
+            (ecodes.EV_REL, ecodes.REL_X, 10),
+            (ecodes.EV_SYN, ecodes.SYN_DROPPED, 0),
+            (ecodes.EV_REL, ecodes.REL_Y, 5),
+            (ecodes.EV_KEY, ecodes.BTN_LEFT, 2),
+            (ecodes.EV_SYN, ecodes.SYN_REPORT, 0))
+        self.assertEqual([('move', 0, 5, False)], self.events)
+
+    def test_frame_absolute(self):
+        ecodes = evdev.ecodes
+        self.listener._running = True
+        self.send(
+            self.tablet,
+            (ecodes.EV_ABS, ecodes.ABS_X, 32767),
+            (ecodes.EV_ABS, ecodes.ABS_Y, 0),
+            (ecodes.EV_SYN, ecodes.SYN_REPORT, 0))
+
+        # Axes not reported keep their value, and relative motion from other
+        # devices is applied to the same position
+        self.send(
+            self.tablet,
+            (ecodes.EV_ABS, ecodes.ABS_Y, 32767),
+            (ecodes.EV_SYN, ecodes.SYN_REPORT, 0))
+        self.send(
+            self.mouse,
+            (ecodes.EV_REL, ecodes.REL_X, -100),
+            (ecodes.EV_SYN, ecodes.SYN_REPORT, 0))
+        self.assertEqual([
+            ('move', 999, 0, False),
+            ('move', 999, 499, False),
+            ('move', 899, 499, False)],
+            self.events)
+
+    def test_scale(self):
+        ecodes = evdev.ecodes
+        self.listener._device = self.tablet
+        scale = self.listener._scale
+        self.assertEqual(0, scale(ecodes.ABS_X, 0, 1000))
+        self.assertEqual(499, scale(ecodes.ABS_X, 16384, 1000))
+        self.assertEqual(999, scale(ecodes.ABS_X, 32767, 1000))
+        self.assertEqual(0, scale(ecodes.ABS_X, -10, 1000))
+        self.assertEqual(999, scale(ecodes.ABS_X, 40000, 1000))
+
+        # Axes without a range are passed through
+        self.assertEqual(123, scale(ecodes.ABS_Z, 123, 1000))
+
+
+@unittest.skipIf(evdev is None, 'evdev is not available')
+class UinputMouseControllerTest(unittest.TestCase):
+    def setUp(self):
+        class Controller(mouse_uinput.Controller):
+            def _device(self, events, name):
+                return FakeUInput()
+
+        self.controller = Controller((1000, 500))
+
+    def tearDown(self):
+        self.controller._mouse.close()
+        self.controller._tablet.close()
+
+    def click(self, code):
+        """The events expected when clicking a button.
+        """
+        return [
+            Event(evdev.ecodes.EV_KEY, code, 1),
+            Event(evdev.ecodes.EV_SYN, evdev.ecodes.SYN_REPORT, 0),
+            Event(evdev.ecodes.EV_KEY, code, 0),
+            Event(evdev.ecodes.EV_SYN, evdev.ecodes.SYN_REPORT, 0)]
+
+    def test_batch(self):
+        with self.controller.batch() as controller:
+            self.assertIs(self.controller, controller)
+            controller.position = (10, 20)
+            controller.click(mouse_uinput.Button.left)
+            self.assertEqual([], self.controller._tablet.read())
+
+        self.assertEqual([
+            Event(evdev.ecodes.EV_ABS, evdev.ecodes.ABS_X, 10),
+            Event(evdev.ecodes.EV_ABS, evdev.ecodes.ABS_Y, 20),
+            Event(evdev.ecodes.EV_SYN, evdev.ecodes.SYN_REPORT, 0)]
+            + self.click(evdev.ecodes.BTN_LEFT),
+            self.controller._tablet.read())
+        self.assertIsNone(self.controller._segments)
+
+    def test_batch_exception(self):
+        with self.assertRaises(ValueError):
+            with self.controller.batch() as controller:
+                controller.click(mouse_uinput.Button.left)
+                raise ValueError()
+
+        # The release must not be lost
+        self.assertEqual(
+            self.click(evdev.ecodes.BTN_LEFT),
+            self.controller._mouse.read())
+        self.assertIsNone(self.controller._segments)
+
+    def test_batch_exception_write(self):
+        self.controller._mouse.disconnect()
+        with self.assertRaises(ValueError):
+            with self.controller.batch() as controller:
+                controller.click(mouse_uinput.Button.left)
+                raise ValueError()
+        with self.assertRaises(OSError):
+            with self.controller.batch() as controller:
+                controller.click(mouse_uinput.Button.left)
@@ -0,0 +1,317 @@
+# coding=utf-8
+# pystray
+# Copyright (C) 2015-2024 Moses Palmér
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+import asyncio
+import threading
+import time
+import unittest
+
+from pynput._util import Events, NotifierMixin, RingBuffer
+from pynput._util.asynchronous import AsyncController, AsyncEvents
+
+
+class RingBufferTest(unittest.TestCase):
+    def test_get_many(self):
+        buffer = RingBuffer(10)
+        for i in range(5):
+            self.assertTrue(buffer.put(i))
+        self.assertEqual([0, 1], buffer.get_many(2))
+        self.assertEqual([2, 3, 4], buffer.get_many())
+        self.assertEqual([], buffer.get_many(timeout=0.01))
+        self.assertEqual(5, buffer.peak)
+        self.assertEqual(4, buffer.lagging)
+
+    def test_drop_oldest(self):
+        buffer = RingBuffer(3, RingBuffer.DROP_OLDEST)
+        for i in range(5):
+            self.assertTrue(buffer.put(i))
+        self.assertEqual([2, 3, 4], buffer.get_many())
+        self.assertEqual(2, buffer.dropped)
+
+    def test_drop_newest(self):
+        buffer = RingBuffer(3, RingBuffer.DROP_NEWEST)
+        self.assertEqual(
+            [True, True, True, False, False],
+            [buffer.put(i) for i in range(5)])
+        self.assertEqual([0, 1, 2], buffer.get_many())
+        self.assertEqual(2, buffer.dropped)
+
+    def test_block(self):
+        buffer = RingBuffer(2, RingBuffer.BLOCK)
+        buffer.put(0)
+        buffer.put(1)
+        self.assertFalse(buffer.put(2, timeout=0.01))
+
+        def consume():
+            time.sleep(0.05)
+            buffer.get_many(1)
+
+        thread = threading.Thread(target=consume)
+        thread.start()
+        self.assertTrue(buffer.put(2, timeout=1.0))
+        thread.join()
+        self.assertEqual([1, 2], buffer.get_many())
+
+    def test_close(self):
+        buffer = RingBuffer(1)
+        buffer.put(0)
+
+        def close():
+            time.sleep(0.05)
+            buffer.close()
+
+        thread = threading.Thread(target=close)
+        thread.start()
+        self.assertFalse(buffer.put(1))
+        thread.join()
+        self.assertEqual([0], buffer.get_many())
+        self.assertEqual([], buffer.get_many())
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            RingBuffer(0)
+        with self.assertRaises(ValueError):
+            RingBuffer(1, 'invalid')
+
+
+class EventsTest(unittest.TestCase):
+    class Listener(object):
+        def __init__(self, on_event):
+            self.on_event = on_event
+            self.start = lambda: None
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+    class Events(Events):
+        class Event(Events.Event):
+            def __init__(self, value):
+                self.value = value
+
+        def __init__(self, **kwargs):
+            super(EventsTest.Events, self).__init__(
+                on_event=self.Event,
+                **kwargs)
+
+    Events._Listener = Listener
+
+    def test_get_many(self):
+        with self.Events() as events:
+            for i in range(5):
+                events._listener.on_event(i)
+            self.assertEqual(
+                [0, 1, 2],
+                [e.value for e in events.get_many(3)])
+            self.assertEqual(
+                [3, 4],
+                [e.value for e in events.get_many(timeout=0.01)])
+            self.assertEqual([], events.get_many(timeout=0.01))
+            self.assertEqual(5, events.peak)
+
+        self.assertIsNone(events.get())
+
+    def test_bounded(self):
+        with self.Events(maxsize=2, overflow=RingBuffer.DROP_OLDEST) as events:
+            for i in range(5):
+                events._listener.on_event(i)
+            self.assertEqual(3, events.dropped)
+            self.assertEqual(3, events.get().value)
+            self.assertEqual(4, events.get().value)
+
+
+class AsyncEventsTest(unittest.TestCase):
+    class Listener(EventsTest.Listener):
+        def __init__(self, on_event):
+            super(AsyncEventsTest.Listener, self).__init__(on_event)
+            self.wait = lambda: None
+            self.stop = lambda: None
+
+    class AsyncEvents(AsyncEvents):
+        Event = EventsTest.Events.Event
+
+        def __init__(self, **kwargs):
+            super(AsyncEventsTest.AsyncEvents, self).__init__(
+                on_event=self.Event,
+                **kwargs)
+
+    AsyncEvents._Listener = Listener
+
+    def test_iterate(self):
+        async def run():
+            async with self.AsyncEvents(maxsize=2) as events:
+                thread = threading.Thread(target=lambda: [
+                    events._listener.on_event(i)
+                    for i in range(10)])
+                thread.start()
+                values = []
+                async for event in events:
+                    values.append(event.value)
+                    if len(values) == 10:
+                        break
+                thread.join()
+                return values, events.peak
+
+        values, peak = asyncio.run(run())
+        self.assertEqual(list(range(10)), values)
+        self.assertLessEqual(peak, 2)
+
+    def test_drop(self):
+        async def run():
+            async with self.AsyncEvents(
+                    maxsize=2, overflow=RingBuffer.DROP_OLDEST) as events:
+                for i in range(5):
+                    events._listener.on_event(i)
+                await asyncio.sleep(0)
+                values = [
+                    (await events.get()).value,
+                    (await events.get()).value]
+                return values, events.dropped, await events.get(0.01)
+
+        self.assertEqual(([3, 4], 3, None), asyncio.run(run()))
+
+    def test_closed_loop(self):
+        events = self.AsyncEvents(maxsize=1)
+        events._loop = asyncio.new_event_loop()
+        events._loop.close()
+
+        # The listener must not block waiting for events that are never read
+        thread = threading.Thread(target=lambda: [
+            events._listener.on_event(i)
+            for i in range(3)])
+        thread.daemon = True
+        thread.start()
+        thread.join(1.0)
+        self.assertFalse(thread.is_alive())
+
+    def test_event_error(self):
+        def event(value):
+            raise ValueError(value)
+
+        events = self.AsyncEvents(maxsize=1)
+        with self.assertRaises(ValueError):
+            events._event_mapper(event)(1)
+        self.assertTrue(events._slots.acquire(blocking=False))
+
+
+class AsyncControllerTest(unittest.TestCase):
+    def test_order(self):
+        calls = []
+
+        class Controller(object):
+            def press(self, key):
+                calls.append((key, threading.current_thread().name))
+
+        async def run():
+            async with AsyncController(Controller()) as controller:
+                await asyncio.gather(*(
+                    controller.press(i)
+                    for i in range(5)))
+                return await controller.run(lambda c: c)
+
+        self.assertIsInstance(asyncio.run(run()), Controller)
+        self.assertEqual(list(range(5)), [key for key, _ in calls])
+        self.assertEqual(1, len(set(name for _, name in calls)))
+
+
+class NotifierMixinTest(unittest.TestCase):
+    def setUp(self):
+        class Controller(NotifierMixin):
+            pass
+
+        @Controller._receiver
+        class Listener(object):
+            class StopException(Exception):
+                pass
+
+            def __init__(self):
+                self.events = []
+                self.calls = 0
+                self.stopped = False
+
+            def on_event(self, value):
+                self.calls += 1
+                self.events.append(value)
+                if value == 'stop':
+                    raise self.StopException()
+
+            def stop(self):
+                self.stopped = True
+
+        self.controller = Controller()
+        self.listeners = [Listener(), Listener()]
+
+    def test_emit(self):
+        self.controller._emit('on_event', 'ignored')
+        with self.listeners[0]._receive():
+            self.controller._emit('on_event', 1)
+            with self.listeners[1]._receive():
+                self.controller._emit('on_event', 2)
+            self.controller._emit('on_event', 3)
+        self.controller._emit('on_event', 4)
+
+        self.assertEqual([1, 2, 3], self.listeners[0].events)
+        self.assertEqual([2], self.listeners[1].events)
+
+    def test_emit_batch(self):
+        calls = []
+        self.listeners[1]._receive_many = lambda notifications: calls.append(
+            list(notifications))
+
+        with self.listeners[0]._receive(), self.listeners[1]._receive():
+            with self.controller._emit_batch():
+                self.controller._emit('on_event', 1)
+                with self.controller._emit_batch():
+                    self.controller._emit('on_event', 'stop')
+                self.assertEqual([], self.listeners[0].events)
+                self.controller._emit('on_event', 3)
+
+        self.assertEqual([1, 'stop'], self.listeners[0].events)
+        self.assertTrue(self.listeners[0].stopped)
+        self.assertEqual(
+            [[('on_event', (1,)), ('on_event', ('stop',)),
+                ('on_event', (3,))]],
+            calls)
+
+    def test_emit_batch_threads(self):
+        calls = []
+        self.listeners[0]._receive_many = lambda notifications: calls.append(
+            list(notifications))
+        started = threading.Event()
+        emitted = threading.Event()
+
+        def other():
+            with self.controller._emit_batch():
+                started.wait()
+                self.controller._emit('on_event', 'b')
+                emitted.set()
+
+        with self.listeners[0]._receive():
+            thread = threading.Thread(target=other)
+            thread.start()
+            with self.controller._emit_batch():
+                self.controller._emit('on_event', 'a')
+                started.set()
+                emitted.wait()
+            thread.join()
+
+        self.assertEqual(
+            sorted([[('on_event', ('a',))], [('on_event', ('b',))]]),
+            sorted(calls))
@@ -0,0 +1,280 @@
+# coding=utf-8
+# pystray
+# Copyright (C) 2015-2024 Moses Palmér
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+import copy
+import pickle
+import threading
+import unittest
+
+from pynput import keyboard, mouse
+from pynput._util.virtual import DESKTOP, Desktop
+
+from . import virtual
+
+
+@virtual
+class VirtualTest(unittest.TestCase):
+    def setUp(self):
+        DESKTOP.reset()
+
+    def test_keyboard_state(self):
+        controller = keyboard.Controller()
+        with controller.pressed(keyboard.Key.shift):
+            controller.press('a')
+            self.assertEqual(
+                {keyboard.Key.shift.value, keyboard.KeyCode.from_char('a')},
+                DESKTOP.pressed)
+            self.assertEqual({keyboard.Key.shift}, DESKTOP.modifiers)
+            controller.release('a')
+        self.assertEqual(set(), DESKTOP.pressed)
+        self.assertEqual(set(), DESKTOP.modifiers)
+
+    def test_keycode_shared(self):
+        key = keyboard.KeyCode.from_char('a', vk=65)
+        self.assertIs(key, keyboard.KeyCode.from_char('a', vk=65))
+        self.assertIs(key, pickle.loads(pickle.dumps(key)))
+        self.assertIs(key, copy.deepcopy(key))
+        self.assertIsNot(key, keyboard.KeyCode.from_char('a'))
+        self.assertEqual(key, keyboard.KeyCode.from_char('a'))
+        self.assertEqual(key, keyboard.KeyCode(vk=65, char='a'))
+        self.assertIs(
+            keyboard.KeyCode.from_dead('~'),
+            keyboard.KeyCode.from_dead('~'))
+
+        with self.assertRaises(AttributeError):
+            key.char = 'b'
+        with self.assertRaises(AttributeError):
+            key.extra = None
+
+    def test_keyboard_listener(self):
+        events = []
+        controller = keyboard.Controller()
+        with keyboard.Listener(
+                on_press=lambda key, injected: events.append(
+                    (key, True, injected)),
+                on_release=lambda key, injected: events.append(
+                    (key, False, injected))):
+            controller.tap(keyboard.Key.enter)
+            controller.type('a')
+        controller.tap('b')
+
+        self.assertEqual([
+            (keyboard.Key.enter, True, True),
+            (keyboard.Key.enter, False, True),
+            (keyboard.KeyCode.from_char('a'), True, True),
+            (keyboard.KeyCode.from_char('a'), False, True)],
+            events)
+
+    def test_listener_stop(self):
+        events = []
+        controller = keyboard.Controller()
+        with keyboard.Listener(
+                on_press=lambda key: events.append(key) or len(events) < 2
+                ) as listener:
+            controller.type('abc')
+            listener.join(1.0)
+            self.assertFalse(listener.running)
+        self.assertEqual(2, len(events))
+
+    def test_mouse(self):
+        events = []
+        controller = mouse.Controller()
+        with mouse.Listener(
+                on_move=lambda x, y: events.append(('move', x, y)),
+                on_click=lambda x, y, button, pressed: events.append(
+                    ('click', x, y, button, pressed)),
+                on_scroll=lambda x, y, dx, dy: events.append(
+                    ('scroll', x, y, dx, dy))):
+            controller.position = (10, 20)
+            controller.move(5, -5)
+            controller.press(mouse.Button.left)
+            self.assertEqual({mouse.Button.left}, DESKTOP.buttons)
+            controller.release(mouse.Button.left)
+            controller.scroll(0, 2)
+            controller.position = (-1, 100000)
+
+        self.assertEqual([
+            ('move', 10, 20),
+            ('move', 15, 15),
+            ('click', 15, 15, mouse.Button.left, True),
+            ('click', 15, 15, mouse.Button.left, False),
+            ('scroll', 15, 15, 0, 2),
+            ('move', 0, DESKTOP.size[1] - 1)],
+            events)
+        self.assertEqual((0, DESKTOP.size[1] - 1), controller.position)
+
+    def test_mouse_coalesce(self):
+        events = []
+        controller = mouse.Controller()
+        controller.position = (0, 0)
+        with mouse.Listener(
+                on_move=lambda x, y, injected, distance, velocity:
+                events.append(('move', x, y, distance)),
+                on_click=lambda x, y, button, pressed: events.append(
+                    ('click', x, y)),
+                coalesce=60.0):
+            controller.position = (3, 4)
+            controller.position = (6, 8)
+            controller.position = (6, 10)
+            controller.click(mouse.Button.left)
+
+        self.assertEqual([
+            ('move', 3, 4, 0.0),
+            ('move', 6, 10, 7.0),
+            ('click', 6, 10),
+            ('click', 6, 10)],
+            events)
+
+    def test_mouse_coalesce_thread(self):
+        events = []
+        entered = threading.Event()
+        release = threading.Event()
+        controller = mouse.Controller()
+        controller.position = (0, 0)
+
+        def on_move(x, y):
+            events.append((x, y))
+            if (x, y) == (2, 2):
+                entered.set()
+                release.wait(5.0)
+
+        def move():
+            controller.position = (3, 3)
+
+        with mouse.Listener(on_move=on_move, coalesce=0.05) as listener:
+            controller.position = (1, 1)
+            controller.position = (2, 2)
+            self.assertTrue(entered.wait(1.0))
+
+            # Move events must be accepted while a callback is running
+            thread = threading.Thread(target=move)
+            thread.start()
+            thread.join(1.0)
+            alive = thread.is_alive()
+            release.set()
+            thread.join()
+            self.assertFalse(alive)
+            listener.join(0.2)
+
+        self.assertEqual([(1, 1), (2, 2), (3, 3)], events)
+
+    def test_mouse_events_coalesce(self):
+        controller = mouse.Controller()
+        controller.position = (0, 0)
+        with mouse.Events(coalesce=60.0) as events:
+            controller.position = (3, 4)
+            controller.position = (6, 8)
+            controller.scroll(0, 1)
+            move = events.get(1.0)
+            self.assertEqual((3, 4, 0.0), (move.x, move.y, move.distance))
+            move = events.get(1.0)
+            self.assertEqual((6, 8, 5.0), (move.x, move.y, move.distance))
+            self.assertIsInstance(events.get(1.0), mouse.Events.Scroll)
+
+    def test_log(self):
+        DESKTOP.reset(log_size=2)
+        controller = mouse.Controller()
+        controller.position = (1, 1)
+        controller.position = (2, 2)
+        controller.position = (3, 3)
+
+        log = DESKTOP.log
+        self.assertEqual(
+            [('on_move', (2, 2)), ('on_move', (3, 3))],
+            [(entry.action, entry.args) for entry in log])
+        self.assertLessEqual(log[0].time, log[1].time)
+
+        DESKTOP.reset(log_size=0)
+        controller.position = (4, 4)
+        self.assertEqual([], DESKTOP.log)
+
+        # The maximum is kept unless passed, and None means unbounded
+        DESKTOP.reset()
+        controller.position = (5, 5)
+        self.assertEqual([], DESKTOP.log)
+        DESKTOP.reset(log_size=None)
+        for i in range(3):
+            controller.position = (i, i)
+        self.assertEqual(3, len(DESKTOP.log))
+        DESKTOP.reset(log_size=Desktop.LOG_SIZE)
+
+    def test_batch(self):
+        events = []
+        controller = keyboard.Controller()
+        with keyboard.Listener(
+                on_press=lambda key: events.append(key)):
+            with controller.batch() as batch:
+                self.assertIs(controller, batch)
+                controller.tap('a')
+                controller.type('b')
+                self.assertEqual([], events)
+        self.assertEqual(
+            [keyboard.KeyCode.from_char('a'), keyboard.KeyCode.from_char('b')],
+            events)
+
+    def test_smooth_scroll(self):
+        controller = mouse.Controller()
+        controller.scroll(0, -6, duration=0.06)
+        controller.scroll(3, 0)
+
+        log = [
+            (entry.time, entry.args[2:])
+            for entry in DESKTOP.log
+            if entry.action == 'on_scroll']
+        self.assertEqual((3, 0), log[-1][1])
+        self.assertEqual(-6, sum(dy for _, (_, dy) in log[:-1]))
+        self.assertGreater(len(log) - 1, 1)
+        self.assertGreaterEqual(log[-2][0] - log[0][0], 0.04)
+
+    def test_move_along(self):
+        controller = mouse.Controller()
+        for profile in ('linear', 'ease', 'min_jerk'):
+            controller.position = (10, 10)
+            DESKTOP.reset()
+            DESKTOP.move(10, 10)
+            motion = controller.move_along(
+                [(110, 10), (110, 60)], 0.05, rate_hz=200, profile=profile)
+            self.assertEqual((110, 60), controller.position)
+            self.assertEqual(10, motion.points)
+            self.assertEqual(motion.sent + 1, len([
+                entry
+                for entry in DESKTOP.log
+                if entry.action == 'on_move']))
+            self.assertLessEqual(motion.sent + motion.skipped, motion.points)
+            self.assertEqual(0, motion.error)
+            self.assertGreaterEqual(motion.elapsed, 0.045)
+
+    def test_move_along_bezier(self):
+        controller = mouse.Controller()
+        controller.position = (0, 0)
+        DESKTOP.reset()
+        motion = controller.move_along(
+            [(0, 100), (100, 100)], 0.02, rate_hz=500, profile='bezier')
+        self.assertEqual((100, 100), controller.position)
+        moves = [
+            entry.args
+            for entry in DESKTOP.log
+            if entry.action == 'on_move']
+        self.assertEqual(motion.sent, len(moves))
+
+        # The curve stays within the hull of its control points
+        for x, y in moves:
+            self.assertLessEqual(x, y)
+
+        with self.assertRaises(ValueError):
+            controller.move_along((1, 1), 0.1, profile='unknown')
@@ -0,0 +1,66 @@
+# coding=utf-8
+# pystray
+# Copyright (C) 2015-2024 Moses Palmér
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+
+class XorgKeysymsTest(unittest.TestCase):
+    def test_lazy(self):
+        from pynput._util import xorg_keysyms
+
+        symbols = xorg_keysyms._Symbols(
+            xorg_keysyms._NAMES, xorg_keysyms._VALUES)
+        self.assertIsNone(symbols._names)
+        self.assertEqual(symbols['Aacute'], xorg_keysyms.SYMBOLS['Aacute'])
+        self.assertIsNotNone(symbols._names)
+
+        calls = []
+        lazy = xorg_keysyms._Lazy(lambda: calls.append(True) or {'a': 1})
+        self.assertEqual([], calls)
+        self.assertEqual(1, lazy['a'])
+        self.assertIn('a', lazy)
+        self.assertEqual(None, lazy.get('b'))
+        self.assertEqual([True], calls)
+
+    def test_reverse_tables(self):
+        from pynput._util.xorg_keysyms import CHARS, KEYSYMS, SYMBOLS
+
+        for name, (keysym, codepoint) in SYMBOLS.items():
+            if codepoint:
+                self.assertEqual(codepoint, SYMBOLS[CHARS[codepoint]][1])
+                self.assertEqual(keysym, SYMBOLS[KEYSYMS[keysym]][0])
+            else:
+                self.assertIsNone(codepoint)
+
+    def test_tables(self):
+        from pynput._util.xorg_keysyms import (
+            CHARS,
+            DEAD_KEYS,
+            KEYPAD_KEYS,
+            KEYSYMS,
+            SYMBOLS)
+
+        self.assertEqual(SYMBOLS['Aacute'], (0x00C1, u'Á'))
+        self.assertEqual(SYMBOLS.get('invalid'), None)
+        self.assertNotIn('invalid', SYMBOLS)
+        self.assertEqual(CHARS[u'Á'], 'Aacute')
+        self.assertEqual(KEYSYMS[0x00C1], 'Aacute')
+        self.assertEqual(DEAD_KEYS[u'́'], u'´')
+        self.assertEqual(KEYPAD_KEYS['KP_0'], 0xFFB0)
+        self.assertEqual(
+            len(SYMBOLS),
+            len(list(SYMBOLS)))
@@ -0,0 +1,494 @@
+#!/usr/bin/env python
+# coding: utf-8
+"""
+Micro benchmarks for performance sensitive parts of *pynput*.
+
+Run this script with the name of a benchmark as its argument. Benchmarks
+requiring an *X* server may be run under *Xvfb*::
+
+    xvfb-run python tools/benchmark.py type
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+sys.path.append(
+    os.path.join(os.path.dirname(__file__), '..', 'lib'))
+
+
+#: The registered benchmarks
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Registers a benchmark under a name.
+
+    :param str name: The name used to select the benchmark from the command
+        line.
+    """
+    def inner(f):
+        BENCHMARKS[name] = f
+        return f
+    return inner
+
+
+def measure(f, count):
+    """Calls a function and returns the number of calls per second.
+
+    :param callable f: The function to measure. This is called once, and must
+        perform ``count`` iterations.
+
+    :param int count: The number of iterations performed by ``f``.
+
+    :return: the number of iterations per second
+    """
+    start = time.perf_counter()
+    f()
+    return count / (time.perf_counter() - start)
+
+
+def report(name, value, unit):
+    """Prints the result of a benchmark.
+    """
+    print('{:<40} {:>14.1f} {}'.format(name, value, unit))
+
+
+@benchmark('type')
+def keyboard_type(args):
+    """Measures the characters typed per second by the keyboard controller"""
+    from pynput.keyboard import Controller, _base
+
+    controller = Controller()
+    text = ('The quick brown fox jumps over the lazy dog 0123456789. '
+        * (args.count // 56 + 1))[:args.count]
+
+    report(
+        'type (per event)',
+        measure(lambda: _base.Controller.type(controller, text), len(text)),
+        'chars/s')
+    report(
+        'type',
+        measure(lambda: controller.type(text), len(text)),
+        'chars/s')
+    if hasattr(controller, 'focus_cache_hits'):
+        report(
+            'focus requests avoided',
+            controller.focus_cache_hits,
+            'requests')
+        report(
+            'focus requests',
+            controller.focus_cache_misses,
+            'requests')
+
+
+@benchmark('resolve')
+def keyboard_resolve(args):
+    """Measures the characters resolved per second by the keyboard controller
+    """
+    from pynput.keyboard import Controller
+
+    controller = Controller()
+    keys = [
+        controller._resolve(c)
+        for c in ('The quick brown fox jumps over the lazy dog 0123456789. '
+            * (args.count // 56 + 1))[:args.count]]
+
+    def keysyms():
+        for key in keys:
+            controller.keyboard_mapping.get(controller._keysym(key))
+
+    def chars():
+        for key in keys:
+            controller._char_mapping.get(key.char)
+
+    report(
+        'resolve (keysym)',
+        measure(keysyms, len(keys)),
+        'chars/s')
+    report(
+        'resolve',
+        measure(chars, len(keys)),
+        'chars/s')
+
+
+@benchmark('keycodes')
+def keyboard_keycodes(args):
+    """Measures the time and memory used to create and hold the key codes of a
+    stream of key events; the stream has ``500 * count`` events, one million by
+    default
+    """
+    import string
+    import tracemalloc
+    from pynput.keyboard import KeyCode
+
+    count = 500 * args.count
+    chars = string.ascii_letters + string.digits + string.punctuation
+    events = [
+        (i % 200, chars[i % len(chars)])
+        for i in range(count)]
+
+    def run(create):
+        def inner():
+            for vk, char in events:
+                create(vk, char)
+
+        # Tracing allocations is slow, so we measure memory separately
+        rate = measure(inner, count)
+        tracemalloc.start()
+        keys = [create(vk, char) for vk, char in events]
+        current, _ = tracemalloc.get_traced_memory()
+        blocks = sum(
+            stat.count
+            for stat in tracemalloc.take_snapshot().statistics('filename'))
+        tracemalloc.stop()
+        del keys
+        return rate, current / count, blocks / count
+
+    for name, create in (
+            ('separate', lambda vk, char: KeyCode(vk=vk, char=char)),
+            ('shared', lambda vk, char: KeyCode.from_char(char, vk=vk))):
+        rate, size, blocks = run(create)
+        report('keycodes ({})'.format(name), rate, 'keys/s')
+        report('keycodes memory ({})'.format(name), size, 'bytes/key')
+        report('keycodes allocations ({})'.format(name), blocks, 'blocks/key')
+
+
+@benchmark('hotkeys')
+def keyboard_hotkeys(args):
+    """Measures the key events per second handled by a large number of hotkeys
+    """
+    import string
+    from pynput.keyboard import HotKey, HotKeyMatcher
+
+    # Every modifier combination with every letter and digit
+    modifiers = ['<ctrl>', '<alt>', '<shift>', '<cmd>']
+    descriptions = [
+        '+'.join(
+            [m for i, m in enumerate(modifiers) if mask & (1 << i)] + [c])
+        for mask in range(1, 1 << len(modifiers))
+        for c in string.ascii_lowercase + string.digits]
+    hotkeys = {description: lambda: None for description in descriptions}
+    events = [
+        HotKey.parse(descriptions[i % len(descriptions)])
+        for i in range(args.count)]
+
+    def run(press, release):
+        def inner():
+            for keys in events:
+                for key in keys:
+                    press(key)
+                for key in keys:
+                    release(key)
+        return inner
+
+    separate = [
+        HotKey(HotKey.parse(description), action)
+        for description, action in hotkeys.items()]
+
+    def press(key):
+        for hotkey in separate:
+            hotkey.press(key)
+
+    def release(key):
+        for hotkey in separate:
+            hotkey.release(key)
+
+    matcher = HotKeyMatcher(hotkeys)
+    count = sum(2 * len(keys) for keys in events)
+    report(
+        '{} hotkeys (separate)'.format(len(hotkeys)),
+        measure(run(press, release), count),
+        'events/s')
+    report(
+        '{} hotkeys'.format(len(hotkeys)),
+        measure(run(matcher.press, matcher.release), count),
+        'events/s')
+
+
+@benchmark('decode')
+def xorg_decode(args):
+    """Measures the mouse move events decoded per second by the *Xorg*
+    listeners
+    """
+    import Xlib.display
+    import Xlib.protocol.event
+    from pynput._util import xorg
+
+    display = Xlib.display.Display().display
+    data = b''.join(
+        Xlib.protocol.event.MotionNotify(
+            detail=0, time=i, root=0, window=0, child=0, root_x=i % 1000,
+            root_y=i % 1000, event_x=0, event_y=0, state=0, same_screen=1,
+            sequence_number=0)._binary
+        for i in range(args.count))
+
+    def generic():
+        remaining = data
+        while remaining:
+            _, remaining = xorg._EVENT_PARSER.parse_binary_value(
+                remaining, display, None, None)
+
+    def specialised():
+        for _ in xorg.parse_events(data, display):
+            pass
+
+    report(
+        'decode (Xlib)',
+        measure(generic, args.count),
+        'events/s')
+    report(
+        'decode',
+        measure(specialised, args.count),
+        'events/s')
+
+
+@benchmark('translate')
+def xorg_translate(args):
+    """Measures the key events translated per second by the *Xorg* keyboard
+    listener
+    """
+    import Xlib.display
+    import Xlib.X
+    from pynput._util import xorg
+    from pynput.keyboard import _xorg
+
+    display = Xlib.display.Display()
+    listener = _xorg.Listener()
+    listener._initialize(display)
+    min_keycode = display.display.info.min_keycode
+    keycode_count = display.display.info.max_keycode - min_keycode + 1
+
+    # The listener receives events as decoded by parse_events
+    events = [
+        xorg.CoreEvent(
+            type=Xlib.X.KeyPress, send_event=False,
+            detail=min_keycode + i % keycode_count, sequence_number=0, time=i,
+            root=0, window=0, child=0, root_x=0, root_y=0, event_x=0,
+            event_y=0, state=i % 2, same_screen=1)
+        for i in range(args.count)]
+
+    def resolve():
+        for event in events:
+            try:
+                listener._keycode_to_key(
+                    display, event.detail, event.state & 1, False)
+            except IndexError:
+                pass
+
+    def lookup():
+        for event in events:
+            listener._event_to_key(display, event)
+
+    report('translate (resolve)', measure(resolve, len(events)), 'events/s')
+    report('translate', measure(lookup, len(events)), 'events/s')
+
+
+@benchmark('layout')
+def uinput_layout(args):
+    """Measures the time taken to load the keyboard layout for the *uinput*
+    backend
+    """
+    from pynput.keyboard import _uinput
+
+    count = max(1, args.count // 100)
+
+    def load(cache):
+        def inner():
+            for _ in range(count):
+                _uinput.Layout(cache=cache)
+        return inner
+
+    report(
+        'layout (parsed)',
+        1000.0 / measure(load(False), count),
+        'ms')
+    report(
+        'layout (cached)',
+        1000.0 / measure(load(True), count),
+        'ms')
+
+
+@benchmark('lookup')
+def uinput_lookup(args):
+    """Measures the special keys found per second by name and by virtual key
+    code for the *uinput* backend
+    """
+    from pynput.keyboard import _uinput
+
+    keys = list(_uinput.Key)
+    names = [
+        keys[i % len(keys)].value._x_name
+        for i in range(args.count)]
+    vks = [
+        keys[i % len(keys)].value.vk
+        for i in range(args.count)]
+
+    def names_scan():
+        for name in names:
+            next(key for key in _uinput.Key if key.value._x_name == name)
+
+    def names_index():
+        for name in names:
+            _uinput._X_NAME_KEYS[name]
+
+    def vks_scan():
+        for vk in vks:
+            next(key for key in _uinput.Key if key.value.vk == vk)
+
+    def vks_index():
+        for vk in vks:
+            _uinput._VK_KEYS.get(vk, None)
+
+    report('lookup by name (scan)', measure(names_scan, len(names)), 'keys/s')
+    report('lookup by name', measure(names_index, len(names)), 'keys/s')
+    report('lookup by vk (scan)', measure(vks_scan, len(vks)), 'keys/s')
+    report('lookup by vk', measure(vks_index, len(vks)), 'keys/s')
+
+
+@benchmark('move')
+def uinput_move(args):
+    """Measures the relative moves per second sent by the mouse controller for
+    the *uinput* backend
+    """
+    from pynput.mouse import _uinput
+
+    controller = _uinput.Controller()
+
+    def separate():
+        for _ in range(args.count):
+            controller.move(1, 1)
+
+    def batched():
+        with controller.batch():
+            for _ in range(args.count):
+                controller.move(1, 1)
+
+    report('move', measure(separate, args.count), 'moves/s')
+    report('move (batched)', measure(batched, args.count), 'moves/s')
+
+
+@benchmark('keysyms')
+def xorg_keysyms_import(args):
+    """Measures the time taken to import the *Xorg* keysym tables, and to load
+    them on first use
+    """
+    module = 'pynput._util.xorg_keysyms'
+    count = max(1, args.count // 200)
+    script = '\n'.join((
+        'import time',
+        'import ' + module + ' as keysyms',
+        'start = time.perf_counter()',
+        'keysyms.SYMBOLS["Aacute"], keysyms.CHARS["a"], keysyms.KEYSYMS[0x61]',
+        'print(time.perf_counter() - start)'))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(sys.path)
+
+    # The tables do not require an X server, so avoid loading the backend
+    env.update(PYNPUT_BACKEND='dummy', PYNPUT_LAZY='1')
+
+    def run():
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', script],
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=True)
+        for line in process.stderr.decode('utf-8').splitlines():
+            if line.endswith('| ' + module):
+                imported = int(line.split('|')[0].split(':')[-1])
+        return imported / 1000.0, 1000.0 * float(process.stdout)
+
+    try:
+        # Import once to make sure compiled files exist
+        run()
+    except subprocess.CalledProcessError:
+        print('{:<40} {:>14} '.format('keysyms', 'unavailable'))
+        return
+    results = [run() for _ in range(count)]
+    report('keysyms import', min(r[0] for r in results), 'ms')
+    report('keysyms first use', min(r[1] for r in results), 'ms')
+
+
+@benchmark('import')
+def startup(args):
+    """Measures the time taken to import *pynput* and to access its
+    submodules, with and without deferred imports, for every backend
+    """
+    # Every iteration is performed in a new interpreter, so we use fewer
+    count = max(1, args.count // 200)
+    script = '\n'.join((
+        'import sys, time',
+        'start = time.perf_counter()',
+        'import pynput',
+        'imported = time.perf_counter()',
+        'pynput.keyboard.Controller',
+        'print(imported - start, time.perf_counter() - start)'))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(sys.path)
+
+    for backend in ('dummy', 'darwin', 'uinput', 'virtual', 'win32', 'xorg'):
+        for lazy in ('0', '1'):
+            env.update(
+                PYNPUT_BACKEND=backend,
+                PYNPUT_BACKEND_MOUSE=backend,
+                PYNPUT_LAZY=lazy)
+            try:
+                results = [
+                    [float(v) for v in subprocess.check_output(
+                        [sys.executable, '-c', script],
+                        env=env,
+                        stderr=subprocess.DEVNULL).split()]
+                    for _ in range(count)]
+            except subprocess.CalledProcessError:
+                print('{:<40} {:>14} '.format(backend, 'unavailable'))
+                break
+            name = '{} ({})'.format(backend, 'lazy' if lazy == '1' else 'eager')
+            report(
+                'import ' + name,
+                1000.0 * min(r[0] for r in results),
+                'ms')
+            report(
+                'import, keyboard ' + name,
+                1000.0 * min(r[1] for r in results),
+                'ms')
+
+
+@benchmark('suite')
+def controller_suite(args):
+    """Runs the controller and listener benchmarks in
+    ``tests/benchmark_tests.py``, which report their results as *JSON*
+    """
+    env = dict(os.environ)
+    env.update(
+        PYNPUT_BENCHMARK='1',
+        PYNPUT_BENCHMARK_COUNT=str(args.count))
+    env['PYTHONPATH'] = os.pathsep.join(sys.path)
+    subprocess.check_call(
+        [sys.executable, '-m', 'unittest', 'tests.benchmark_tests'],
+        cwd=os.path.join(os.path.dirname(__file__), '..'),
+        env=env)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument(
+        '--count',
+        type=int,
+        default=2000,
+        help='The number of iterations for each measurement')
+    parser.add_argument(
+        'benchmarks',
+        nargs='+',
+        choices=sorted(BENCHMARKS),
+        help='The benchmarks to run')
+    args = parser.parse_args()
+
+    for name in args.benchmarks:
+        BENCHMARKS[name](args)
+
+
+if __name__ == '__main__':
+    main()
@@ -18,8 +18,10 @@
 Converts <keysymdef.h> to Python mappings.
 """
 
+import base64
 import datetime
 import re
+import struct
 import sys
 import unicodedata
 
@@ -174,11 +176,48 @@ def definitions(data):
                     break
 
 
-def main():
-    syms = sorted(list(definitions(sys.stdin.read().splitlines())))
-    sys.stdout.write('''# coding: utf-8
+def literal(data, prefix='', width=72):
+    """Formats a string as a parenthesised sequence of string literals.
+
+    :param str data: The string to format.
+
+    :param str prefix: A string used to split the data; lines are split only
+        after this string. If this is empty, lines are split at ``width``
+        characters.
+
+    :param int width: The maximum length of the content of every line.
+
+    :return: a Python expression
+    """
+    lines = []
+    if prefix:
+        line = ''
+        for part in data.split(prefix):
+            if line and len(line) + len(part) + len(prefix) > width:
+                lines.append(line)
+                line = ''
+            line += part + prefix
+        lines.append(line)
+    else:
+        lines = [data[i:i + width] for i in range(0, len(data), width)]
+    return '(\n' + '\n'.join('    \'%s\'' % line for line in lines) + ')'
+
+
+def values(syms):
+    """Packs the keysyms and codepoints of a list of definitions.
+
+    :return: a *base64* encoded string of pairs of little endian 32 bit
+        unsigned integers
+    """
+    return base64.b64encode(b''.join(
+        struct.pack('<II', int(keysym, 16), int(first, 16) if first else 0)
+        for name, (keysym, (first, second)) in syms)).decode('ascii')
+
+
+TEMPLATE = \
+'''# coding: utf-8
 # pynput
-# Copyright (C) 2015-2024-%d Moses Palmér
+# Copyright (C) 2015-%d Moses Palmér
 #
 # This program is free software: you can redistribute it and/or modify it under
 # the terms of the GNU Lesser General Public License as published by the Free
@@ -195,8 +234,104 @@ def main():
 
 # pylint: disable=C0111,C0302
 
-SYMBOLS = {
-%s}
+import array
+import base64
+import bisect
+import sys
+
+import six
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+
+class _Symbols(Mapping):
+    """A read only mapping from symbol name to the tuple ``(keysym,
+    codepoint)``.
+
+    The table is stored in a compact form, and decoded on first use. Lookups
+    are performed using binary search in the sorted list of names.
+
+    :param str names: The sorted names, separated by space.
+
+    :param str values: The keysyms and codepoints corresponding to the names,
+        as pairs of little endian 32 bit unsigned integers encoded with
+        *base64*. A codepoint of ``0`` means that the symbol does not have
+        one.
+    """
+    def __init__(self, names, values):
+        self._data = (names, values)
+        self._names = None
+        self._values = None
+
+    def __getitem__(self, name):
+        names, values = self._load()
+        index = bisect.bisect_left(names, name)
+        if index == len(names) or names[index] != name:
+            raise KeyError(name)
+        codepoint = values[2 * index + 1]
+        return (
+            values[2 * index],
+            six.unichr(codepoint) if codepoint else None)
+
+    def __iter__(self):
+        return iter(self._load()[0])
+
+    def __len__(self):
+        return len(self._load()[0])
+
+    def _load(self):
+        if self._names is None:
+            names, values = self._data
+            typecode = next(t for t in 'IL' if array.array(t).itemsize == 4)
+            data = array.array(typecode)
+            data.frombytes(base64.b64decode(values))
+            if sys.byteorder != 'little':
+                data.byteswap()
+            self._values = data
+            self._names = names.split()
+        return self._names, self._values
+
+
+class _Lazy(Mapping):
+    """A read only mapping populated on first use.
+
+    :param callable factory: A function returning the actual mapping.
+    """
+    def __init__(self, factory):
+        self._factory = factory
+        self._mapping = None
+
+    def __getitem__(self, key):
+        return self._load()[key]
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self):
+        return len(self._load())
+
+    def __contains__(self, key):
+        return key in self._load()
+
+    def get(self, key, default=None):
+        return self._load().get(key, default)
+
+    def _load(self):
+        if self._mapping is None:
+            self._mapping = self._factory()
+        return self._mapping
+
+
+#: The names of all symbols, sorted and separated by space
+_NAMES = %s
+
+#: The keysyms and codepoints for the symbols in _NAMES
+_VALUES = %s
+
+SYMBOLS = _Symbols(_NAMES, _VALUES)
 
 DEAD_KEYS = {
 %s}
@@ -204,23 +339,27 @@ DEAD_KEYS = {
 KEYPAD_KEYS = {
 %s}
 
-CHARS = {
+CHARS = _Lazy(lambda: {
     codepoint: name
     for name, (keysym, codepoint) in SYMBOLS.items()
-    if codepoint}
+    if codepoint})
 
-KEYSYMS = {
+KEYSYMS = _Lazy(lambda: {
     keysym: name
     for name, (keysym, codepoint) in SYMBOLS.items()
-    if codepoint}
-''' % (
+    if codepoint})
+'''
+
+
+def generate(syms):
+    """Generates the module source for a sorted list of definitions.
+
+    :return: Python source code
+    """
+    return TEMPLATE % (
         datetime.date.today().year,
-        ',\n'.join(
-            '    \'%s\': (0x%s, %s)' % (
-                    name,
-                    keysym,
-                    'u\'\\u%s\'' % first if first else None)
-            for name, (keysym, (first, second)) in syms),
+        literal(' '.join(name for name, _ in syms), ' '),
+        literal(values(syms)),
         ',\n'.join(
             '    %s: %s' % (
                     'u\'\\u%s\'' % first,
@@ -231,6 +370,13 @@ KEYSYMS = {
         ',\n'.join(
             '    \'%s\': 0x%s' % (name, keysym)
             for name, (keysym, (first, second)) in syms
-            if name.startswith(KEYPAD_PREFIX))))
+            if name.startswith(KEYPAD_PREFIX)))
+
+
+def main():
+    syms = sorted(list(definitions(sys.stdin.read().splitlines())))
+    sys.stdout.write(generate(syms))
+
 
-main()
+if __name__ == '__main__':
+    main()